@@ -0,0 +1,76 @@
+"""
+Vote throughput of SwarmConsensus at several batch sizes.
+
+Run from the aether-framework directory:
+
+    python -m benchmarks.consensus_throughput                           # fakeredis stand-in
+    python -m benchmarks.consensus_throughput --redis-url redis://localhost:6379/15
+    python -m benchmarks.consensus_throughput --backend memory          # in-process backend
+
+Compares one round-trip per vote (SwarmConsensus.vote) with pipelined
+vote_many batches. Against fakeredis there is no network, so the numbers
+show per-command overhead only; a real server adds one round-trip per
+vote() call but only one per vote_many batch. A real server's database is
+flushed before each run.
+"""
+import argparse
+import contextlib
+import os
+import time
+
+
+def make_client(redis_url=None):
+    if redis_url:
+        import redis
+
+        return redis.StrictRedis.from_url(redis_url, decode_responses=True)
+    import fakeredis
+
+    return fakeredis.FakeStrictRedis(decode_responses=True)
+
+
+def make_consensus(client):
+    """A fresh SwarmConsensus on `client`, or an InMemoryConsensus on a new store when client is None."""
+    if client is None:
+        from src.swarm.consensus_backend import InMemoryConsensus, InMemoryConsensusStore
+
+        return InMemoryConsensus("bench", store=InMemoryConsensusStore())
+    from src.swarm.swarm_consensus import SwarmConsensus
+
+    client.flushdb()
+    return SwarmConsensus("bench", redis_client=client)
+
+
+def measure(client, votes, batch_size, proposals=100):
+    """Return votes/sec for `votes` votes spread over `proposals` proposals; batch_size None means vote()."""
+    consensus = make_consensus(client)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        proposal_ids = consensus.propose_many(f"Task {i}" for i in range(proposals))
+        ballots = [proposal_ids[i % proposals] for i in range(votes)]
+        started = time.perf_counter()
+        if batch_size is None:
+            for proposal_id in ballots:
+                consensus.vote(proposal_id)
+        else:
+            consensus.vote_many(ballots, batch_size=batch_size)
+        seconds = time.perf_counter() - started
+    return votes / seconds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--votes", type=int, default=10000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 10, 100, 1000, 10000])
+    parser.add_argument("--redis-url", help="Benchmark a real server instead of fakeredis")
+    parser.add_argument("--backend", choices=("redis", "memory"), default="redis")
+    args = parser.parse_args(argv)
+
+    client = make_client(args.redis_url) if args.backend == "redis" else None
+    print(f"{'mode':<24} {'votes/sec':>12}")
+    print(f"{'vote()':<24} {measure(client, args.votes, None):12.0f}")
+    for batch_size in args.batch_sizes:
+        print(f"{f'vote_many({batch_size})':<24} {measure(client, args.votes, batch_size):12.0f}")
+
+
+if __name__ == "__main__":
+    main()
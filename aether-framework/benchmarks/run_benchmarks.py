@@ -0,0 +1,283 @@
+"""
+Benchmark suite for lattice propagation and swarm simulations.
+
+Run from the aether-framework directory:
+
+    python -m benchmarks.run_benchmarks                       # sizes 1e2..1e4
+    python -m benchmarks.run_benchmarks --max-size 1000000    # full sweep
+    python -m benchmarks.run_benchmarks --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --baseline benchmarks/baseline.json
+
+Each case is timed as the best of --repeats runs with stdout suppressed.
+When a baseline is given, cases slower than baseline * (1 + tolerance) are
+reported as regressions and the command exits with status 1.
+"""
+import argparse
+import contextlib
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import numpy as np
+
+SIZES = [10**k for k in range(2, 7)]
+TOPOLOGIES = ("ring", "chain", "mesh")
+
+
+def build_lattice(topology, size):
+    """Build a lattice of `size` nodes wired the way the managers wire theirs."""
+    from src.core.lattice_engine import LatticeEngine
+    from src.core.node_autonomy import AutonomousNode
+    from src.core.node_state_table import NodeStateTable
+
+    lattice = LatticeEngine()
+    table = NodeStateTable(capacity=size)
+    nodes = [AutonomousNode(i, table=table) for i in range(size)]
+    for node in nodes:
+        lattice.add_node(node)
+    if topology == "chain":
+        for i in range(size - 1):
+            lattice.connect_nodes(nodes[i], nodes[i + 1])
+    elif topology == "ring":
+        for i in range(size):
+            lattice.connect_nodes(nodes[i], nodes[(i + 1) % size])
+    elif topology == "mesh":
+        side = math.ceil(math.sqrt(size))
+        for i in range(size):
+            if (i + 1) % side and i + 1 < size:
+                lattice.connect_nodes(nodes[i], nodes[i + 1])
+            if i + side < size:
+                lattice.connect_nodes(nodes[i], nodes[i + side])
+    else:
+        raise ValueError(f"Unknown topology: {topology}")
+    return lattice
+
+
+def propagate_signal_case(topology, size):
+    lattice = build_lattice(topology, size)
+    lattice.engine  # Build the CSR arrays outside the timed region
+    return lambda: lattice.propagate_signal("Benchmark", start_node_id=0)
+
+
+BATCH_WAVES = 10
+
+
+def propagate_batch_case(topology, size):
+    lattice = build_lattice(topology, size)
+    lattice.engine
+    signals = [f"Benchmark-{i}" for i in range(BATCH_WAVES)]
+    return lambda: lattice.propagate_batch(signals, [0] * BATCH_WAVES)
+
+
+def propagate_sequential_case(topology, size):
+    """The same waves as propagate_batch_case, one propagate_signal call each, for comparison."""
+    lattice = build_lattice(topology, size)
+    lattice.engine
+    signals = [f"Benchmark-{i}" for i in range(BATCH_WAVES)]
+
+    def run():
+        for signal in signals:
+            lattice.propagate_signal(signal, start_node_id=0)
+    return run
+
+
+def swarm_case(topology, size):
+    from src.swarm.swarm_behavior import Swarm
+
+    swarm = Swarm(size)
+    return lambda: swarm.simulate(size)
+
+
+def gossip_case(topology, size):
+    from src.swarm.gossip_engine import GossipEngine
+
+    graph = None
+    if topology == "ring":
+        graph = np.column_stack([np.arange(size), (np.arange(size) + 1) % size])
+    engine = GossipEngine(np.random.default_rng(0).random(size), graph, seed=0)
+    return lambda: engine.run(10, tolerance=0)
+
+
+def advanced_swarm_case(topology, size):
+    from src.swarm.advanced_swarm_behavior import Swarm
+
+    swarm = Swarm(size)
+    return lambda: swarm.simulate(10)
+
+
+def vectorized_swarm_case(topology, size):
+    from src.swarm.vectorized_swarm import VectorizedSwarm
+
+    swarm = VectorizedSwarm(size, seed=0)
+    return lambda: swarm.simulate(10)
+
+
+def task_auction_case(topology, size):
+    from src.marketplace.task_marketplace import TaskMarketplace
+    from src.swarm.negotiation_agent import NegotiationAgent
+
+    rng = random.Random(0)
+    types = "abcdefgh"
+    agents = [NegotiationAgent(i, set(rng.sample(types, 3)), rng.randint(20, 100)) for i in range(max(1, size // 10))]
+    marketplace = TaskMarketplace()
+    for task_id in range(size):
+        marketplace.add_task({"id": task_id, "type": rng.choice(types), "priority": rng.randint(1, 10),
+                              "resource_cost": rng.randint(1, 20)})
+    return lambda: marketplace.auction(agents)
+
+
+def order_book_case(topology, size):
+    from src.marketplace.agent_marketplace import AgentMarketplace
+
+    rng = random.Random(0)
+    orders = [(i % 100, f"Resource-{rng.randrange(10)}", rng.choice(("buy", "sell")), rng.randint(90, 110),
+               rng.randint(1, 5)) for i in range(size)]
+    marketplace = AgentMarketplace()
+    return lambda: marketplace.place_orders(orders)
+
+
+_ipfs_server = None
+
+def ipfs_publish_case(topology, size):
+    from src.integrations.ifps_communication import IPFSCommunication
+    from src.integrations.local_ipfs_server import LocalIPFSServer
+
+    global _ipfs_server
+    if _ipfs_server is None:
+        _ipfs_server = LocalIPFSServer().start()  # Offline stand-in, kept for the whole run
+    _ipfs_server.blocks.clear()
+    transport = IPFSCommunication(_ipfs_server.api_url)
+    messages = [f"Node {i} status update" for i in range(size)]
+    return lambda: transport.send_messages(messages)
+
+
+def hierarchical_case(topology, size):
+    from src.network.hierarchical_neural_agents import DecisionMakingAgent, HierarchicalNeuralSystem
+
+    layers = 2  # Middle layers never set an output signal, so deeper systems cannot run yet
+    per_layer = max(1, size // layers)
+    system = HierarchicalNeuralSystem(num_layers=layers, agents_per_layer=per_layer)
+    top = layers - 1
+    system.hierarchy[top] = [DecisionMakingAgent(agent_id=f"{top}-{i}", layer=top) for i in range(per_layer)]
+    return lambda: system.simulate(5)
+
+
+# name -> (case factory, topologies it is swept over)
+CASES = {
+    "propagate_signal": (propagate_signal_case, TOPOLOGIES),
+    "propagate_batch": (propagate_batch_case, ("chain", "ring")),
+    "propagate_signal_sequential": (propagate_sequential_case, ("chain", "ring")),
+    "swarm_behavior.Swarm.simulate": (swarm_case, ("none",)),
+    "GossipEngine.run": (gossip_case, ("none", "ring")),
+    "advanced_swarm_behavior.Swarm.simulate": (advanced_swarm_case, ("none",)),
+    "VectorizedSwarm.simulate": (vectorized_swarm_case, ("none",)),
+    "HierarchicalNeuralSystem.simulate": (hierarchical_case, ("none",)),
+    "IPFSCommunication.send_messages": (ipfs_publish_case, ("none",)),
+    "TaskMarketplace.auction": (task_auction_case, ("none",)),
+    "AgentMarketplace.place_orders": (order_book_case, ("none",)),
+}
+
+
+def time_case(factory, topology, size, repeats):
+    """Return the best wall time of `repeats` fresh runs of a case."""
+    best = math.inf
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeats):
+            run = factory(topology, size)
+            started = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_suite(cases=None, sizes=None, repeats=3, budget=10.0, seed=0, report=print):
+    """
+    Run the benchmark cases and return {"case/topology/size": result}.
+
+    A result holds "seconds", or "skipped" with a reason when the case raised
+    or a smaller size of it already exceeded `budget` seconds.
+    """
+    results = {}
+    for name in cases or CASES:
+        factory, topologies = CASES[name]
+        for topology in topologies:
+            over_budget = None
+            for size in sizes or SIZES:
+                key = f"{name}/{topology}/{size}"
+                if over_budget is not None:
+                    results[key] = {"skipped": f"size {over_budget} exceeded the {budget}s budget"}
+                    continue
+                random.seed(seed)
+                np.random.seed(seed)
+                try:
+                    seconds = time_case(factory, topology, size, repeats)
+                except Exception as exc:
+                    # Record cases that cannot run in this tree instead of aborting the sweep
+                    results[key] = {"skipped": f"{type(exc).__name__}: {exc}"}
+                    report(f"{key:<60} skipped ({type(exc).__name__}: {exc})")
+                    break
+                results[key] = {"seconds": seconds}
+                report(f"{key:<60} {seconds * 1000:12.3f} ms")
+                if seconds > budget:
+                    over_budget = size
+    return results
+
+
+def compare(results, baseline, tolerance=0.25):
+    """Return [(key, baseline seconds, current seconds)] for cases slower than the baseline allows."""
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get(key, {})
+        if "seconds" in result and "seconds" in previous:
+            if result["seconds"] > previous["seconds"] * (1 + tolerance):
+                regressions.append((key, previous["seconds"], result["seconds"]))
+    return regressions
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "recorded": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), help="Cases to run (default: all)")
+    parser.add_argument("--max-size", type=int, default=10**4, help="Largest size in the 1e2..1e6 sweep")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=10.0, help="Skip larger sizes once a run exceeds this many seconds")
+    parser.add_argument("--baseline", help="JSON baseline to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown over the baseline (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", help="Write this run's results as a JSON baseline")
+    args = parser.parse_args(argv)
+
+    sizes = [size for size in SIZES if size <= args.max_size]
+    results = run_suite(args.cases, sizes, repeats=args.repeats, budget=args.budget)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline["results"], args.tolerance)
+        for key, before, after in regressions:
+            print(f"REGRESSION {key}: {before * 1000:.3f} ms -> {after * 1000:.3f} ms ({after / before:.2f}x)")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
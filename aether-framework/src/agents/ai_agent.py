@@ -4,7 +4,7 @@ import numpy as np
 from solana.keypair import Keypair
 from src.utils.llm_client import LLMClient
 from src.utils.multi_modal_handler import MultiModalHandler
-from src.swarm.swarm_consensus import SwarmConsensus
+from src.swarm.consensus_backend import create_consensus
 from src.utils.blockchain_manager import BlockchainManager
 from src.utils.redis_task_queue import RedisTaskQueue
 from src.utils.knowledge_graph import KnowledgeGraph
@@ -21,7 +21,7 @@ class AIAgent:
         self.role = role
         self.llm_client = LLMClient(provider, base_url)
         self.multi_modal_handler = MultiModalHandler()  # Multi-modal capabilities
-        self.consensus = SwarmConsensus(agent_id)  # Swarm decision-making
+        self.consensus = create_consensus(agent_id)  # Swarm decision-making, backend from config.yaml
         self.blockchain_manager = BlockchainManager(ethereum_rpc_url=ethereum_rpc_url)  # Multi-chain blockchain manager
         self.redis_queue = RedisTaskQueue()  # Distributed task queue
         self.knowledge_graph = KnowledgeGraph()  # Knowledge graph integration
@@ -158,7 +158,9 @@ class AIAgent:
     def vote_on_task(self, proposal_id):
         self.consensus.vote(proposal_id)
 
-    def check_consensus(self):
+    def check_consensus(self, wait=False, timeout=None):
+        if wait:
+            return self.consensus.wait_for_consensus(timeout=timeout)
         return self.consensus.get_consensus()
 
     # Local task management
@@ -1,25 +1,33 @@
+import os
 from flask import Flask, jsonify
+from src.core.events import BufferedEventLog
 from src.core.lattice_engine import LatticeEngine
 from src.core.node_autonomy import AutonomousNode
 
 app = Flask(__name__)
 
-# Initialize lattice and nodes
-lattice = LatticeEngine()
-nodes = [AutonomousNode(i) for i in range(5)]
-for node in nodes:
-    lattice.add_node(node)
-lattice.connect_nodes(nodes[0], nodes[1])
-lattice.connect_nodes(nodes[1], nodes[2])
-lattice.connect_nodes(nodes[2], nodes[3])
-lattice.connect_nodes(nodes[3], nodes[4])
+# Load the lattice from a snapshot if one is configured, otherwise build the demo lattice
+SNAPSHOT_PATH = os.environ.get("AETHER_LATTICE_SNAPSHOT")
+if SNAPSHOT_PATH and os.path.exists(SNAPSHOT_PATH):
+    lattice = LatticeEngine.load(SNAPSHOT_PATH)
+else:
+    lattice = LatticeEngine()
+    nodes = [AutonomousNode(i) for i in range(5)]
+    for node in nodes:
+        lattice.add_node(node)
+    lattice.connect_nodes(nodes[0], nodes[1])
+    lattice.connect_nodes(nodes[1], nodes[2])
+    lattice.connect_nodes(nodes[2], nodes[3])
+    lattice.connect_nodes(nodes[3], nodes[4])
+
+events = BufferedEventLog()  # Keeps the latest lattice events until /events drains them
 
 @app.route("/nodes", methods=["GET"])
 def get_nodes():
     """Return the current state of all nodes."""
     return jsonify([
-        {"id": node.id, "state": node.state}
-        for node in nodes
+        {"id": node.id, "state": node.state.copy()}
+        for node in lattice.nodes
     ])
 
 @app.route("/lattice", methods=["GET"])
@@ -27,5 +35,10 @@ def get_lattice():
     """Return the lattice structure."""
     return jsonify(lattice.network_map)
 
+@app.route("/events", methods=["GET"])
+def get_events():
+    """Return the lattice events published since the last call."""
+    return jsonify([event.as_dict() for event in events.drain()])
+
 if __name__ == "__main__":
     app.run(debug=True, port=5001)
\ No newline at end of file
@@ -1,20 +1,25 @@
+import os
 from flask import Flask, request, jsonify
 from src.core.lattice_engine import LatticeEngine
 from src.core.node_autonomy import AutonomousNode
 
 app = Flask(__name__)
 
-# Initialize lattice and nodes
-lattice = LatticeEngine()
-nodes = [AutonomousNode(i) for i in range(3)]
-for node in nodes:
-    lattice.add_node(node)
-lattice.connect_nodes(nodes[0], nodes[1])
-lattice.connect_nodes(nodes[1], nodes[2])
+# Load the lattice from a snapshot if one is configured, otherwise build the demo lattice
+SNAPSHOT_PATH = os.environ.get("AETHER_LATTICE_SNAPSHOT")
+if SNAPSHOT_PATH and os.path.exists(SNAPSHOT_PATH):
+    lattice = LatticeEngine.load(SNAPSHOT_PATH)
+else:
+    lattice = LatticeEngine()
+    nodes = [AutonomousNode(i) for i in range(3)]
+    for node in nodes:
+        lattice.add_node(node)
+    lattice.connect_nodes(nodes[0], nodes[1])
+    lattice.connect_nodes(nodes[1], nodes[2])
 
 @app.route("/nodes", methods=["GET"])
 def get_nodes():
-    return jsonify([{"id": node.id, "state": node.state} for node in nodes])
+    return jsonify([{"id": node.id, "state": node.state.copy()} for node in lattice.nodes])
 
 @app.route("/signal", methods=["POST"])
 def propagate_signal():
@@ -0,0 +1,267 @@
+import numpy as np
+
+
+class CSRPropagationEngine:
+    """
+    Iterative signal propagation over a lattice stored in compressed sparse row form.
+
+    Adjacency is kept as two integer arrays addressed by node index:
+    the neighbors of node i are indices[indptr[i]:indptr[i + 1]].
+    Traversal uses an explicit stack, so chain length is no longer bounded
+    by Python's recursion limit.
+    """
+
+    # Frontiers of at most this many (wave, node) pairs take a pure-Python hop;
+    # NumPy's per-call overhead dominates below it, e.g. on long chains and rings.
+    SMALL_FRONTIER = 64
+
+    def __init__(self, indptr, indices):
+        self.indptr = indptr
+        self.indices = indices
+
+    @classmethod
+    def from_network_map(cls, nodes, network_map, node_index):
+        """Build CSR arrays from a LatticeEngine network map (id -> list of neighbor nodes)."""
+        node_count = len(nodes)
+        indptr = np.zeros(node_count + 1, dtype=np.int64)
+        for i, node in enumerate(nodes):
+            indptr[i + 1] = indptr[i] + len(network_map[node.id])
+
+        index_dtype = np.int32 if node_count < 2**31 else np.int64
+        indices = np.empty(int(indptr[-1]), dtype=index_dtype)
+        pos = 0
+        for node in nodes:
+            for neighbor in network_map[node.id]:
+                indices[pos] = node_index[neighbor.id]
+                pos += 1
+        return cls(indptr, indices)
+
+    @property
+    def node_count(self):
+        return len(self.indptr) - 1
+
+    @property
+    def edge_count(self):
+        return len(self.indices)
+
+    def neighbors(self, index):
+        """Return the neighbor indices of a node as an array view."""
+        return self.indices[self.indptr[index]:self.indptr[index + 1]]
+
+    def traverse(self, start, gate):
+        """
+        Yield node indices reachable from start in depth-first preorder.
+
+        gate(index) is evaluated when a node is reached; nodes failing it are
+        neither yielded nor expanded. The order matches a recursive DFS that
+        visits neighbors in insertion order, and gate is only called after the
+        previously yielded node has been processed by the caller.
+        """
+        if not gate(start):
+            return
+        indptr = memoryview(self.indptr)
+        indices = memoryview(self.indices)
+        visited = bytearray(self.node_count)
+
+        visited[start] = 1
+        yield start
+        node_stack = [start]
+        pos_stack = [indptr[start]]
+        while node_stack:
+            pos = pos_stack[-1]
+            if pos == indptr[node_stack[-1] + 1]:
+                node_stack.pop()
+                pos_stack.pop()
+                continue
+            pos_stack[-1] = pos + 1
+            neighbor = indices[pos]
+            if visited[neighbor] or not gate(neighbor):
+                continue
+            visited[neighbor] = 1
+            yield neighbor
+            node_stack.append(neighbor)
+            pos_stack.append(indptr[neighbor])
+
+    def propagate_waves(self, starts, energy, evolution_score, energy_cost):
+        """
+        Run many propagation waves at once over NumPy state arrays.
+
+        starts holds one start index per wave. Waves advance one hop per step
+        in lockstep; when several waves reach a node in the same step they are
+        served in ascending wave order while the node's energy covers
+        energy_cost. Each delivery applies the same update as
+        AutonomousNode.process_signal followed by the lattice energy deduction.
+        energy and evolution_score are updated in place.
+
+        Returns (wave_ids, node_indices) of every delivery, ordered by step,
+        then node, then wave. Adjacency must be symmetric, as built by
+        LatticeEngine.connect_nodes.
+
+        Steps whose frontier holds at most SMALL_FRONTIER pairs run in plain
+        Python with the same results, so long narrow graphs do not pay
+        NumPy's per-call overhead on every hop.
+        """
+        if energy_cost < 0:
+            raise ValueError("energy_cost must be non-negative for batched propagation.")
+        starts = np.asarray(starts, dtype=np.int64)
+        waves = np.flatnonzero(starts >= 0)
+        nodes = starts[waves]
+
+        delivered_waves, delivered_nodes = [], []
+        small_waves, small_nodes = [], []  # Deliveries of small steps not yet moved to delivered_*
+        recent = self.recent_keys()
+        small = False
+        while len(nodes):
+            if small != (len(nodes) <= self.SMALL_FRONTIER):
+                small = not small
+                waves, nodes, recent = self._convert(waves, nodes, recent, small)
+            if small:
+                waves, nodes = self._deliver_small(waves, nodes, recent, energy, evolution_score, energy_cost)
+                if not nodes:
+                    break
+                small_waves.extend(waves)
+                small_nodes.extend(nodes)
+                waves, nodes = self._expand_small(waves, nodes)
+                continue
+            waves, nodes = self.deliver(waves, nodes, recent, energy, evolution_score, energy_cost)
+            if not len(nodes):
+                break
+            if small_waves:
+                delivered_waves.append(np.array(small_waves, dtype=np.int64))
+                delivered_nodes.append(np.array(small_nodes, dtype=np.int64))
+                small_waves, small_nodes = [], []
+            delivered_waves.append(waves)
+            delivered_nodes.append(nodes)
+            waves, nodes = self.expand(waves, nodes)
+
+        if small_waves:
+            delivered_waves.append(np.array(small_waves, dtype=np.int64))
+            delivered_nodes.append(np.array(small_nodes, dtype=np.int64))
+        if not delivered_waves:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(delivered_waves), np.concatenate(delivered_nodes)
+
+    @staticmethod
+    def _convert(waves, nodes, recent, small):
+        """Switch a frontier and its recent keys between lists and sets (small) and NumPy arrays."""
+        if small:
+            return (np.asarray(waves).tolist(), np.asarray(nodes).tolist(),
+                    [set(keys.tolist()) if isinstance(keys, np.ndarray) else keys for keys in recent])
+        return (np.array(waves, dtype=np.int64), np.array(nodes, dtype=np.int64),
+                [np.array(sorted(keys), dtype=np.int64) if isinstance(keys, set) else keys for keys in recent])
+
+    @staticmethod
+    def recent_keys():
+        """Per-run record of the (wave, node) pairs delivered in the last two steps."""
+        empty = np.empty(0, dtype=np.int64)
+        return [empty, empty]
+
+    def deliver(self, waves, nodes, recent, energy, evolution_score, energy_cost):
+        """
+        Serve one lockstep hop of candidate (wave, node) pairs.
+
+        Updates energy, evolution_score and recent in place and returns the
+        accepted pairs ordered by node, then wave.
+        """
+        node_count = self.node_count
+        # Deduplicate (wave, node) pairs and drop pairs delivered in the last two steps;
+        # on a symmetric graph a wave cannot revisit a node it reached earlier than that.
+        previous_keys, current_keys = recent
+        keys = np.sort(waves * node_count + nodes)
+        if len(keys):
+            keys = keys[np.r_[True, keys[1:] != keys[:-1]]]
+            keys = keys[~(np.isin(keys, current_keys, assume_unique=True)
+                          | np.isin(keys, previous_keys, assume_unique=True))]
+        if not len(keys):
+            recent[:] = [current_keys, keys]
+            return keys, keys
+        waves, nodes = np.divmod(keys, node_count)
+
+        # Group contending waves by node, ascending wave order within each group.
+        order = np.lexsort((waves, nodes))
+        waves, nodes = waves[order], nodes[order]
+        group_start = np.flatnonzero(np.r_[True, nodes[1:] != nodes[:-1]])
+        group_size = np.diff(np.r_[group_start, len(nodes)])
+        group_nodes = nodes[group_start]
+        accepted, drains = self._serve(energy[group_nodes], group_size, energy_cost)
+        energy[group_nodes] -= accepted * energy_cost + drains * 5
+        evolution_score[group_nodes] += drains
+
+        rank = np.arange(len(nodes)) - np.repeat(group_start, group_size)
+        mask = rank < np.repeat(accepted, group_size)
+        waves, nodes = waves[mask], nodes[mask]
+        recent[:] = [current_keys, np.sort(waves * node_count + nodes)]
+        return waves, nodes
+
+    def _deliver_small(self, waves, nodes, recent, energy, evolution_score, energy_cost):
+        """deliver() for a small frontier given as lists, with recent keys kept as sets."""
+        node_count = self.node_count
+        previous_keys, current_keys = recent
+        keys = {wave * node_count + node for wave, node in zip(waves, nodes)}
+        keys -= current_keys
+        keys -= previous_keys
+        pairs = sorted((key % node_count, key // node_count) for key in keys)
+        accepted_waves, accepted_nodes, accepted_keys = [], [], set()
+        start = 0
+        while start < len(pairs):
+            node = pairs[start][0]
+            end = start + 1
+            while end < len(pairs) and pairs[end][0] == node:
+                end += 1
+            accepted, drains = self._serve_one(energy[node], end - start, energy_cost)
+            energy[node] -= accepted * energy_cost + drains * 5
+            evolution_score[node] += drains
+            for _, wave in pairs[start:start + accepted]:
+                accepted_waves.append(wave)
+                accepted_nodes.append(node)
+                accepted_keys.add(wave * node_count + node)
+            start = end
+        recent[:] = [current_keys, accepted_keys]
+        return accepted_waves, accepted_nodes
+
+    @staticmethod
+    def _serve_one(energy, contenders, energy_cost):
+        """_serve for a single node."""
+        if energy_cost > 0:
+            affordable = (energy - energy_cost) // (energy_cost + 5) + 1 if energy >= energy_cost else 0
+            accepted = int(min(contenders, affordable))
+            return accepted, accepted
+        drainable = int(max(-(-energy // 5), 0))
+        unbounded = energy >= 0 and energy % 5 == 0
+        accepted = contenders if unbounded else min(contenders, drainable)
+        return accepted, min(accepted, drainable)
+
+    @staticmethod
+    def _serve(energy, contenders, energy_cost):
+        """Return (accepted, evolve drains) per node for a number of contending waves."""
+        if energy_cost > 0:
+            # Every accepted wave has energy > 0 at evolve time, so each one drains cost + 5.
+            affordable = np.where(energy >= energy_cost, (energy - energy_cost) // (energy_cost + 5) + 1, 0)
+            accepted = np.minimum(contenders, affordable).astype(np.int64)
+            return accepted, accepted
+        # Zero cost: waves are accepted while energy is non-negative and evolve drains
+        # 5 while it is positive. Energy that lands exactly on 0 stays there and keeps
+        # accepting; otherwise it goes negative after ceil(energy / 5) deliveries.
+        drainable = np.maximum(-(-energy // 5), 0)
+        unbounded = (energy >= 0) & (energy % 5 == 0)
+        accepted = np.where(unbounded, contenders, np.minimum(contenders, drainable)).astype(np.int64)
+        drains = np.minimum(accepted, drainable).astype(np.int64)
+        return accepted, drains
+
+    def _expand_small(self, waves, nodes):
+        """expand() for a small frontier given as lists."""
+        indptr, indices = self.indptr, self.indices
+        next_waves, next_nodes = [], []
+        for wave, node in zip(waves, nodes):
+            neighbors = indices[indptr[node]:indptr[node + 1]].tolist()
+            next_waves.extend([wave] * len(neighbors))
+            next_nodes.extend(neighbors)
+        return next_waves, next_nodes
+
+    def expand(self, waves, nodes):
+        """Return the (wave, neighbor) pairs one hop out from a frontier."""
+        first = self.indptr[nodes]
+        degree = self.indptr[nodes + 1] - first
+        total = int(degree.sum())
+        offsets = np.arange(total) - np.repeat(np.cumsum(degree) - degree, degree)
+        return np.repeat(waves, degree), self.indices[np.repeat(first, degree) + offsets].astype(np.int64)
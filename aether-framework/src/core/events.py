@@ -0,0 +1,152 @@
+import sys
+from collections import deque
+
+
+class Event:
+    """Base class for lattice events; `type` names the hook it is published on."""
+
+    __slots__ = ()
+    type = None
+
+    def as_dict(self):
+        return {"type": self.type, **{name: getattr(self, name) for name in self.__slots__}}
+
+    def __eq__(self, other):
+        return type(other) is type(self) and self.as_dict() == other.as_dict()
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class SignalDelivered(Event):
+    __slots__ = ("node_id", "signal")
+    type = "signal_delivered"
+
+    def __init__(self, node_id, signal):
+        self.node_id = node_id
+        self.signal = signal
+
+    def __str__(self):
+        return f"Node {self.node_id} processing signal: {self.signal}"
+
+
+class NodeEvolved(Event):
+    __slots__ = ("node_id", "energy", "evolution_score")
+    type = "node_evolved"
+
+    def __init__(self, node_id, energy, evolution_score):
+        self.node_id = node_id
+        self.energy = energy
+        self.evolution_score = evolution_score
+
+    def __str__(self):
+        return f"Node {self.node_id} evolves. Energy: {self.energy}, evolution score: {self.evolution_score}"
+
+
+class EnergyDepleted(Event):
+    __slots__ = ("node_id", "energy")
+    type = "energy_depleted"
+
+    def __init__(self, node_id, energy):
+        self.node_id = node_id
+        self.energy = energy
+
+    def __str__(self):
+        return f"Node {self.node_id} is out of energy (energy={self.energy})."
+
+
+class NodeRecharged(Event):
+    __slots__ = ("node_id", "amount", "energy")
+    type = "node_recharged"
+
+    def __init__(self, node_id, amount, energy):
+        self.node_id = node_id
+        self.amount = amount
+        self.energy = energy
+
+    def __str__(self):
+        return f"Node {self.node_id} recharges by {self.amount}. Energy: {self.energy}"
+
+
+class EventHooks:
+    """
+    Subscriber lists for each event type.
+
+    Each hook is an attribute holding a tuple of callbacks, so publishers
+    guard with `if hooks.signal_delivered:` and build no event at all while
+    nobody is subscribed.
+    """
+
+    EVENT_TYPES = ("signal_delivered", "node_evolved", "energy_depleted", "node_recharged")
+
+    def __init__(self):
+        for event_type in self.EVENT_TYPES:
+            setattr(self, event_type, ())
+
+    def _check(self, event_type):
+        if event_type not in self.EVENT_TYPES:
+            raise ValueError(f"Unknown event type: {event_type}")
+
+    def subscribe(self, event_type, callback):
+        """Call callback(event) for every event of event_type; returns callback."""
+        self._check(event_type)
+        setattr(self, event_type, getattr(self, event_type) + (callback,))
+        return callback
+
+    def unsubscribe(self, event_type, callback):
+        self._check(event_type)
+        setattr(self, event_type, tuple(cb for cb in getattr(self, event_type) if cb is not callback))
+
+    def emit(self, event):
+        for callback in getattr(self, event.type):
+            callback(event)
+
+
+hooks = EventHooks()  # Process-wide hooks used by nodes and lattices
+
+
+class BufferedEventLog:
+    """
+    Subscriber that collects events in memory and writes them out in blocks.
+
+    Events are kept until drain() or flush(); flush() writes one line per
+    event to `stream` in a single call, and happens automatically every
+    flush_every events when a stream is given. Only the latest `capacity`
+    events (10000 by default) are kept between drains, so a long simulation
+    that nobody drains stays bounded; capacity=None keeps every event.
+    """
+
+    def __init__(self, event_types=EventHooks.EVENT_TYPES, stream=None, flush_every=1000, capacity=10000, hooks=hooks):
+        self.events = deque(maxlen=capacity)
+        self.stream = stream
+        self.flush_every = flush_every
+        self.hooks = hooks
+        self.event_types = tuple(event_types)
+        self.attach()
+
+    def __call__(self, event):
+        self.events.append(event)
+        if self.stream is not None and len(self.events) >= self.flush_every:
+            self.flush()
+
+    def attach(self):
+        for event_type in self.event_types:
+            self.hooks.subscribe(event_type, self)
+
+    def detach(self):
+        for event_type in self.event_types:
+            self.hooks.unsubscribe(event_type, self)
+
+    def drain(self):
+        """Return the buffered events and clear the buffer."""
+        events = list(self.events)
+        self.events.clear()
+        return events
+
+    def flush(self):
+        events = self.drain()
+        if events:
+            stream = self.stream if self.stream is not None else sys.stdout
+            stream.write("".join(f"{event}\n" for event in events))
+            stream.flush()
@@ -1,49 +1,273 @@
-import time
+import numpy as np
+from src.core.csr_propagation import CSRPropagationEngine
+from src.core.event_scheduler import EventScheduler
+from src.core.events import EnergyDepleted, NodeEvolved, SignalDelivered, hooks
+from src.core.node_autonomy import AutonomousNode
+from src.core.topology_index import TopologyIndex
 
 class LatticeEngine:
     def __init__(self):
-        self.nodes = []
-        self.network_map = {}
+        self._nodes = []
+        self._topology = TopologyIndex()
+        self._node_index = {}  # Maps node id -> position in self.nodes
+        self._snapshot_ids = None  # Node ids of a loaded snapshot whose nodes are not built yet
+        self.state_table = None  # NodeStateTable shared by all nodes of the lattice
+        self._rows = []  # Table row of each node, by position
+        self._row_array = None
+        self._engine = None
+        self.topology_version = 0  # Bumped on every topology change
+
+    @property
+    def nodes(self):
+        if self._snapshot_ids is not None:
+            self._materialize()
+        return self._nodes
+
+    @property
+    def topology(self):
+        if self._snapshot_ids is not None:
+            self._materialize()
+        return self._topology
+
+    @property
+    def network_map(self):
+        """Node id -> neighbor nodes, kept by the topology index."""
+        return self.topology.network_map
+
+    @property
+    def node_index(self):
+        if self._node_index is None:
+            self._node_index = dict(zip(self._snapshot_ids, range(len(self._snapshot_ids))))
+        return self._node_index
 
     def add_node(self, node):
         """Add a new node to the lattice."""
+        self.topology.add_node(node.id)
+        if self.state_table is None:
+            self.state_table = node.table
+        else:
+            node.move_to(self.state_table)
+        self.node_index[node.id] = len(self.nodes)
         self.nodes.append(node)
-        self.network_map[node.id] = []
+        self._rows.append(node.row)
+        self._row_array = None
+        self._engine = None
+        self.topology_version += 1
+
+    def remove_node(self, node):
+        """Remove a node and its connections; the last node takes its position."""
+        index = self.node_index.pop(node.id, None)
+        if index is None:
+            raise ValueError(f"Node {node.id} is not in the lattice.")
+        self.topology.remove_node(node.id)
+        last = self.nodes.pop()
+        last_row = self._rows.pop()
+        if last is not node:
+            self.nodes[index] = last
+            self._rows[index] = last_row
+            self.node_index[last.id] = index
+        self._row_array = None
+        self._engine = None
+        self.topology_version += 1
 
     def connect_nodes(self, node_a, node_b):
         """Create a bidirectional connection between two nodes."""
-        if node_a.id not in self.network_map or node_b.id not in self.network_map:
+        if node_a.id not in self.topology or node_b.id not in self.topology:
+            raise ValueError("Both nodes must be added to the lattice first.")
+        if self.topology.add_edge(node_a, node_b):
+            self._engine = None
+            self.topology_version += 1
+
+    def disconnect_nodes(self, node_a, node_b):
+        """Remove the connection between two nodes, if any."""
+        if node_a.id not in self.topology or node_b.id not in self.topology:
             raise ValueError("Both nodes must be added to the lattice first.")
-        self.network_map[node_a.id].append(node_b)
-        self.network_map[node_b.id].append(node_a)
+        if self.topology.remove_edge(node_a.id, node_b.id):
+            self._engine = None
+            self.topology_version += 1
+
+    def reach(self, node_id):
+        """Upper bound on how many nodes a signal from node_id can reach: the size of its component."""
+        return self.topology.reach(node_id)
+
+    def is_connected(self):
+        """Return True if every node can be reached from every other node."""
+        return self.topology.is_connected()
+
+    @property
+    def engine(self):
+        """CSR propagation engine, rebuilt lazily after topology changes."""
+        if self._engine is None:
+            self._engine = CSRPropagationEngine.from_network_map(self.nodes, self.network_map, self.node_index)
+        return self._engine
+
+    @property
+    def rows(self):
+        """State table rows of the lattice nodes as an array, by position."""
+        if self._row_array is None:
+            self._row_array = np.array(self._rows, dtype=np.int64)
+        return self._row_array
+
+    def save(self, path):
+        """Write the lattice to a columnar binary snapshot at path."""
+        from src.core.lattice_snapshot import save_lattice
+
+        save_lattice(self, path)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Load a lattice written by save().
+
+        With mmap=True the topology and state columns are copy-on-write views
+        over a memory map of the file; node objects and the topology index are
+        only built when first accessed.
+        """
+        from src.core.lattice_snapshot import load_lattice
+
+        return load_lattice(cls(), path, mmap=mmap)
+
+    def attach_snapshot(self, table, ids, engine):
+        """Adopt a loaded state table (row i is node i) and CSR engine, deferring node creation."""
+        if self._rows:
+            raise ValueError("Snapshots can only be attached to an empty lattice.")
+        self.state_table = table
+        self._rows = list(range(len(ids)))
+        self._row_array = np.arange(len(ids), dtype=np.int64)
+        self._engine = engine
+        self._snapshot_ids = ids
+        self._node_index = None
+
+    def _materialize(self):
+        self.node_index  # Built from the snapshot ids, which are dropped below
+        ids, self._snapshot_ids = self._snapshot_ids, None
+        table, engine = self.state_table, self._engine
+        self._nodes = [AutonomousNode.attach(node_id, table, row) for row, node_id in zip(self._rows, ids)]
+        self._topology = TopologyIndex.from_csr(self._nodes, engine.indptr, engine.indices)
+
+    def recharge_all(self, amount=50):
+        """Recharge every node in the lattice at once."""
+        if self._rows:
+            self.state_table.recharge_all(amount, self.rows)
+
+    def evolve_all(self):
+        """Evolve every node with energy left at once; returns how many evolved."""
+        if not self._rows:
+            return 0
+        return len(self.state_table.evolve_all(self.rows))
+
+    def nodes_with_energy(self, min_energy):
+        """Return the nodes whose energy is at least min_energy."""
+        if not self.nodes:
+            return []
+        mask = self.state_table.energy[self.rows] >= min_energy
+        return [self.nodes[i] for i in np.flatnonzero(mask)]
 
     def propagate_signal(self, signal, start_node_id, energy_cost=5):
         """Propagate a signal through the lattice with energy cost."""
-        visited = set()
-
-        def dfs(node):
-            if node.id in visited or node.state["energy"] < energy_cost:
-                return
-            visited.add(node.id)
-            node.process_signal(signal)
-            node.state["energy"] -= energy_cost  # Deduct energy for processing the signal
-            for neighbor in self.network_map[node.id]:
-                dfs(neighbor)
-
-        start_node = next((n for n in self.nodes if n.id == start_node_id), None)
-        if start_node:
-            dfs(start_node)
-        else:
+        start = self.node_index.get(start_node_id)
+        if start is None:
             print(f"Start node {start_node_id} not found in the lattice.")
+            return
+
+        nodes, rows, energy = self.nodes, self._rows, self.state_table.energy
+        for index in self.engine.traverse(start, lambda i: energy[rows[i]] >= energy_cost):
+            row = rows[index]
+            nodes[index].process_signal(signal)
+            energy[row] -= energy_cost  # Deduct energy for processing the signal
+            if hooks.energy_depleted and energy[row] <= 0 < energy[row] + energy_cost:
+                hooks.emit(EnergyDepleted(nodes[index].id, energy[row].item()))
+
+    def propagate_batch(self, signals, start_node_ids, energy_cost=5):
+        """
+        Propagate many signals in one pass and return {node_id: [signals delivered]}.
+
+        Waves advance in lockstep over NumPy energy arrays; when several reach a
+        node in the same step, earlier signals in the batch are served first.
+        Events are published once the batch is done: one signal_delivered per
+        delivery, then one node_evolved per node with its final state.
+        """
+        if len(signals) != len(start_node_ids):
+            raise ValueError("signals and start_node_ids must have the same length.")
+        starts = []
+        for start_node_id in start_node_ids:
+            start = self.node_index.get(start_node_id, -1)
+            if start < 0:
+                print(f"Start node {start_node_id} not found in the lattice.")
+            starts.append(start)
+
+        table, rows = self.state_table, self.rows
+        if table is None:
+            return {}
+        before = self.state_snapshot()
+        energy = table.energy[rows].astype(np.result_type(table.energy, energy_cost))
+        evolution_score = table.evolution_score[rows]
+        wave_ids, node_indices = self.engine.propagate_waves(starts, energy, evolution_score, energy_cost)
+        table.energy[rows] = energy
+        table.evolution_score[rows] = evolution_score
+        return self.record_deliveries(signals, wave_ids, node_indices, before)
+
+    def state_snapshot(self):
+        """Energy and evolution score columns to diff against after a batch, or None if no one listens."""
+        if not (hooks.node_evolved or hooks.energy_depleted) or self.state_table is None:
+            return None
+        return self.state_table.energy[self.rows], self.state_table.evolution_score[self.rows]
+
+    def record_deliveries(self, signals, wave_ids, node_indices, before=None):
+        """
+        Append delivered signals to the node message logs and return {node_id: [signals]}.
+
+        Publishes the batch's events; `before` is the state_snapshot() taken
+        before the batch ran.
+        """
+        table, rows = self.state_table, self.rows
+        signal_ids = np.array([table.logs.interner.intern(signal) for signal in signals], dtype=np.int32)
+        table.logs.append_many(rows[node_indices], table.owners, signal_ids[wave_ids])
 
-    def simulate_activity(self, duration=5):
-        """Simulate random activity for a set duration."""
+        deliveries = {}
+        for wave, index in zip(wave_ids.tolist(), node_indices.tolist()):
+            deliveries.setdefault(index, []).append(signals[wave])
+        owners = table.owners
+        if hooks.signal_delivered:
+            for wave, index in zip(wave_ids.tolist(), node_indices.tolist()):
+                hooks.emit(SignalDelivered(owners[rows[index]], signals[wave]))
+        if before is not None:
+            self._publish_state_changes(*before)
+        return {owners[rows[index]]: delivered for index, delivered in deliveries.items()}
+
+    def _publish_state_changes(self, energy_before, score_before):
+        table, rows, owners = self.state_table, self.rows, self.state_table.owners
+        energy, evolution_score = table.energy[rows], table.evolution_score[rows]
+        if hooks.node_evolved:
+            for index in np.flatnonzero(evolution_score != score_before).tolist():
+                hooks.emit(NodeEvolved(owners[rows[index]], energy[index].item(), evolution_score[index].item()))
+        if hooks.energy_depleted:
+            for index in np.flatnonzero((energy_before > 0) & (energy <= 0)).tolist():
+                hooks.emit(EnergyDepleted(owners[rows[index]], energy[index].item()))
+
+    def shard(self, shard_count, seed=0):
+        """Return a ShardedLattice running batched propagation across shard_count worker processes."""
+        from src.core.sharded_lattice import ShardedLattice
+
+        return ShardedLattice(self, shard_count, seed=seed)
+
+    def simulate_activity(self, duration=5, scheduler=None):
+        """
+        Simulate random activity for a set duration, one emission per time unit.
+
+        Runs on the given EventScheduler's virtual clock; by default a
+        fast-forward scheduler, so no wall time is spent waiting.
+        """
         import random
 
-        print("Simulating lattice activity...")
-        for _ in range(duration):
+        scheduler = scheduler if scheduler is not None else EventScheduler()
+
+        def emit():
             active_node = random.choice(self.nodes)
             random_signal = f"Signal-{random.randint(1000, 9999)}"
             print(f"Node {active_node.id} emitting signal: {random_signal}")
             self.propagate_signal(random_signal, start_node_id=active_node.id)
-            time.sleep(1)
\ No newline at end of file
+
+        print("Simulating lattice activity...")
+        scheduler.every(1, emit, count=duration)
+        scheduler.run(until=scheduler.now + duration)
@@ -0,0 +1,200 @@
+import json
+import numpy as np
+
+from src.core.message_log import decode_strings
+
+MAGIC = b"AETHLAT\x01"
+ALIGN = 64
+
+
+def _string_table(values):
+    """Encode values as JSON strings packed into (offsets, data) arrays."""
+    encoded = [json.dumps(value).encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(item) for item in encoded], out=offsets[1:])
+    return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+class SnapshotIds:
+    """
+    Node ids of a loaded snapshot, read from its (possibly memory-mapped) arrays.
+
+    Stands in for NodeStateTable.owners: an id is converted when it is
+    first read, and the ids become a plain list the first time one changes.
+    """
+
+    def __init__(self, ids=None, offsets=None, data=None):
+        self._ids = ids  # int64 ids, or None for JSON-encoded ones in (offsets, data)
+        self._offsets = offsets
+        self._data = data
+        self._list = None
+
+    def tolist(self):
+        if self._list is not None:
+            return self._list
+        if self._ids is not None:
+            return self._ids.tolist()
+        return decode_strings(self._offsets, self._data)
+
+    def _materialize(self):
+        if self._list is None:
+            self._list = self.tolist()
+        return self._list
+
+    def __getitem__(self, row):
+        if self._list is not None:
+            return self._list[row]
+        if self._ids is not None:
+            return int(self._ids[row])
+        return json.loads(self._data[self._offsets[row]:self._offsets[row + 1]].tobytes())
+
+    def __setitem__(self, row, node_id):
+        self._materialize()[row] = node_id
+
+    def append(self, node_id):
+        self._materialize().append(node_id)
+
+    def __len__(self):
+        if self._list is not None:
+            return len(self._list)
+        return len(self._ids) if self._ids is not None else len(self._offsets) - 1
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __eq__(self, other):
+        return self.tolist() == list(other)
+
+    def __repr__(self):
+        return f"SnapshotIds({self.tolist()!r})"
+
+
+def write_snapshot(path, sections, meta):
+    """
+    Write named arrays and a JSON metadata dict to a single binary file.
+
+    Layout: magic, header length (uint64), JSON header, then each array's raw
+    little-endian bytes at a 64-byte aligned offset recorded in the header, so
+    a reader can map the file and view the arrays in place.
+    """
+    layout, offset = {}, 0
+    arrays = {}
+    for name, array in sections.items():
+        array = np.ascontiguousarray(array)
+        arrays[name] = array.astype(array.dtype.newbyteorder("<"), copy=False)
+        layout[name] = {"offset": offset, "dtype": arrays[name].dtype.str, "shape": list(array.shape)}
+        offset += -(-array.nbytes // ALIGN) * ALIGN
+    header = json.dumps({"version": 1, "sections": layout, "meta": meta}).encode("utf-8")
+    data_start = -(-(len(MAGIC) + 8 + len(header)) // ALIGN) * ALIGN
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(np.uint64(len(header)).tobytes())
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name]["offset"])
+            f.write(array.tobytes())
+        f.truncate(data_start + offset)
+
+
+def read_snapshot(path, mmap=True):
+    """
+    Return (arrays, meta) from a file written by write_snapshot.
+
+    With mmap=True the arrays are copy-on-write views over a memory map of the
+    file: nothing is parsed up front, pages are shared between processes
+    mapping the same file, and writes stay private to the process.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a lattice snapshot.")
+        header_length = int(np.frombuffer(f.read(8), dtype="<u8")[0])
+        header = json.loads(f.read(header_length))
+    data_start = -(-(len(MAGIC) + 8 + header_length) // ALIGN) * ALIGN
+    buffer = np.memmap(path, dtype=np.uint8, mode="c") if mmap else np.fromfile(path, dtype=np.uint8)
+    arrays = {}
+    for name, spec in header["sections"].items():
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"], dtype=np.int64))
+        start = data_start + spec["offset"]
+        # Plain ndarray views of the map: no copy, without np.memmap's per-index overhead
+        arrays[name] = buffer[start:start + count * dtype.itemsize].view(dtype).reshape(spec["shape"]).view(np.ndarray)
+    return arrays, header["meta"]
+
+
+def save_lattice(lattice, path):
+    """Write a LatticeEngine's topology, node state and message logs to path."""
+    table, rows = lattice.state_table, lattice.rows
+    engine = lattice.engine
+    node_count = len(rows)
+    ids = [table.owners[row] for row in rows.tolist()] if node_count else []
+    sections = {
+        "indptr": engine.indptr,
+        "indices": engine.indices,
+        "energy": table.energy[rows] if node_count else np.empty(0, dtype=np.float64),
+        "evolution_score": table.evolution_score[rows] if node_count else np.empty(0, dtype=np.int64),
+    }
+    meta = {"node_count": node_count, "log_capacity": table.logs.capacity if table else 32}
+    if all(type(node_id) is int for node_id in ids):
+        meta["id_kind"] = "int"
+        sections["ids"] = np.array(ids, dtype=np.int64)
+    else:
+        meta["id_kind"] = "json"
+        sections["id_offsets"], sections["id_data"] = _string_table(ids)
+    if table is None:
+        return write_snapshot(path, sections, meta)
+
+    position = {row: i for i, row in enumerate(rows.tolist())}
+    meta["extras"] = [[position[row], values] for row, values in table.extras.items() if row in position]
+
+    # Message logs: the ring contents of each node, oldest first, plus its total count.
+    logs = table.logs
+    held = sorted((position[row], row) for row in logs.rows() if row in position)
+    flat = logs.export([row for _, row in held])
+    sections.update({
+        "log_positions": np.array([pos for pos, _ in held], dtype=np.int64),
+        "log_owners": flat["owners"],
+        "log_counts": flat["counts"],
+        "log_signals": flat["signal_ids"],
+        "log_times": flat["times"],
+        "log_epoch_tokens": flat["epoch_tokens"],
+        "log_epochs": flat["epochs"],
+    })
+    meta["log_tokens"] = logs.tokens
+    sections["string_offsets"], sections["string_data"] = _string_table(logs.interner.values)
+    write_snapshot(path, sections, meta)
+
+
+def load_lattice(lattice, path, mmap=True):
+    """
+    Fill an empty LatticeEngine from a snapshot; node objects are built on first use.
+
+    Ids, signal strings and message logs are read from the snapshot's arrays
+    in place and only copied once they change.
+    """
+    from src.core.csr_propagation import CSRPropagationEngine
+    from src.core.message_log import SignalInterner
+    from src.core.node_state_table import NodeStateTable
+
+    arrays, meta = read_snapshot(path, mmap=mmap)
+    node_count = meta["node_count"]
+    if meta["id_kind"] == "int":
+        ids = SnapshotIds(arrays["ids"])
+    else:
+        ids = SnapshotIds(offsets=arrays["id_offsets"], data=arrays["id_data"])
+
+    table = NodeStateTable(capacity=node_count, log_capacity=meta["log_capacity"])
+    if node_count:
+        table.energy = arrays["energy"].astype(np.float64, copy=False)  # Older snapshots stored integers
+        table.evolution_score = arrays["evolution_score"]
+        table.live = np.ones(node_count, dtype=bool)
+    table.size = node_count
+    table.owners = ids
+    table.extras = {pos: values for pos, values in meta.get("extras", [])}
+    if "string_offsets" in arrays:
+        table.logs.interner = SignalInterner.from_table(arrays["string_offsets"], arrays["string_data"])
+        table.logs.restore(arrays["log_positions"], arrays["log_owners"], arrays["log_counts"],
+                           arrays["log_signals"], arrays["log_times"], meta.get("log_tokens"),
+                           arrays.get("log_epoch_tokens"), arrays.get("log_epochs"))
+
+    lattice.attach_snapshot(table, ids, CSRPropagationEngine(arrays["indptr"], arrays["indices"]))
+    return lattice
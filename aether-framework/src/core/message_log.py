@@ -0,0 +1,634 @@
+import json
+import os
+import time
+import uuid
+import numpy as np
+
+SPILL_RECORD = np.dtype([("node", "<i8"), ("time", "<f8"), ("signal", "<i4")])
+
+
+def decode_strings(offsets, data):
+    """Decode a table of JSON values packed into (offsets, data) arrays, as written by lattice snapshots."""
+    if len(offsets) < 2:
+        return []
+    # One json.loads over the whole table: join the packed values with commas into a JSON array.
+    body = np.insert(np.asarray(data[offsets[0]:offsets[-1]]), np.asarray(offsets[1:-1]) - offsets[0], ord(","))
+    return json.loads(b"[" + body.tobytes() + b"]")
+
+
+class SignalInterner:
+    """Maps signal strings (and node ids) to dense integer ids and back."""
+
+    def __init__(self, values=()):
+        self._values = []
+        self._ids = {}
+        self._table = None  # (offsets, data) of a packed string table not decoded yet
+        for value in values:
+            self.intern(value)
+
+    @classmethod
+    def from_table(cls, offsets, data):
+        """
+        An interner over a packed string table, e.g. a memory-mapped snapshot.
+
+        lookup() decodes single strings in place; the table is only decoded
+        as a whole when values or ids are needed, e.g. to intern a string.
+        """
+        interner = cls()
+        interner._table = (offsets, data)
+        return interner
+
+    def _decode(self):
+        offsets, data = self._table
+        self._table = None
+        self._values = decode_strings(offsets, data)
+        self._ids = {value: signal_id for signal_id, value in enumerate(self._values)}
+
+    @property
+    def values(self):
+        if self._table is not None:
+            self._decode()
+        return self._values
+
+    @property
+    def ids(self):
+        if self._table is not None:
+            self._decode()
+        return self._ids
+
+    def intern(self, value):
+        ids = self.ids
+        signal_id = ids.get(value)
+        if signal_id is None:
+            signal_id = ids[value] = len(self._values)
+            self._values.append(value)
+        return signal_id
+
+    def lookup(self, signal_id):
+        if self._table is not None:
+            offsets, data = self._table
+            return json.loads(data[offsets[signal_id]:offsets[signal_id + 1]].tobytes())
+        return self._values[signal_id]
+
+    def __len__(self):
+        return len(self._table[0]) - 1 if self._table is not None else len(self._values)
+
+
+class SpillSegment:
+    """
+    Append-only file of message log entries evicted from node ring buffers.
+
+    Records are fixed-size (node key, timestamp, signal id) triples; the
+    interned strings they refer to are appended to a `.strings` sidecar as
+    JSON lines in id order, so a segment can be reopened by another process.
+    An existing segment's strings are loaded into `interner`, so new records
+    share its ids and are appended after the old ones.
+    """
+
+    def __init__(self, path, interner=None, flush_every=4096):
+        self.path = path
+        self.strings_path = f"{path}.strings"
+        self.interner = interner if interner is not None else SignalInterner()
+        self.flush_every = flush_every
+        self._pending = []
+        self._persisted_strings = self._load_strings()
+
+    @classmethod
+    def open(cls, path):
+        """Open an existing segment, restoring its string table."""
+        return cls(path)
+
+    def _load_strings(self):
+        """Merge the sidecar's strings into the interner; returns how many the file holds."""
+        if not os.path.exists(self.strings_path):
+            return 0
+        values = self.interner.values
+        count = 0
+        with open(self.strings_path, "r") as f:
+            for count, line in enumerate(f, start=1):
+                value = json.loads(line)
+                if count <= len(values):
+                    if values[count - 1] != value:
+                        raise ValueError(f"Spill segment {self.path} was written with a different string table.")
+                elif self.interner.intern(value) != count - 1:
+                    raise ValueError(f"Spill segment {self.path} was written with a different string table.")
+        return count
+
+    def write(self, node_key, timestamp, signal_id):
+        """Queue one evicted entry; records are written in blocks."""
+        self._pending.append((node_key, timestamp, signal_id))
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def write_many(self, node_keys, timestamps, signal_ids):
+        """Queue a block of evicted entries."""
+        block = np.empty(len(node_keys), dtype=SPILL_RECORD)
+        block["node"], block["time"], block["signal"] = node_keys, timestamps, signal_ids
+        self._pending.extend(block.tolist())
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        values = self.interner.values
+        if self._persisted_strings < len(values):
+            with open(self.strings_path, "a") as f:
+                for value in values[self._persisted_strings:]:
+                    f.write(json.dumps(value) + "\n")
+            self._persisted_strings = len(values)
+        with open(self.path, "ab") as f:
+            np.array(self._pending, dtype=SPILL_RECORD).tofile(f)
+        self._pending = []
+
+    def records(self):
+        """Return all records as a read-only memory-mapped structured array."""
+        self.flush()
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return np.empty(0, dtype=SPILL_RECORD)
+        return np.memmap(self.path, dtype=SPILL_RECORD, mode="r")
+
+    def query(self, node_id=None, start=None, end=None):
+        """Return [(node_id, timestamp, signal)] for a node and/or a [start, end) time range."""
+        records = self.records()
+        mask = np.ones(len(records), dtype=bool)
+        if node_id is not None:
+            node_key = self.interner.ids.get(node_id)
+            if node_key is None:
+                return []
+            mask &= records["node"] == node_key
+        if start is not None:
+            mask &= records["time"] >= start
+        if end is not None:
+            mask &= records["time"] < end
+        lookup = self.interner.lookup
+        return [
+            (lookup(node), timestamp, lookup(signal))
+            for node, timestamp, signal in records[mask].tolist()
+        ]
+
+
+class SnapshotLogs:
+    """
+    Message logs of a loaded lattice snapshot, read in place from its flat arrays.
+
+    rows (sorted), owners, counts, epoch_tokens and epochs are per log;
+    signal_ids and times hold each log's ring contents, oldest first. With a
+    memory-mapped snapshot nothing is copied: a log leaves this layer, and
+    is copied into a ring of its MessageLogStore, the first time it is
+    written or released.
+    """
+
+    def __init__(self, rows, owners, counts, signal_ids, times, epoch_tokens, epochs, capacity):
+        self.rows = rows
+        self.owners = owners
+        self.counts = counts
+        self.signal_ids = signal_ids
+        self.times = times
+        self.epoch_tokens = epoch_tokens
+        self.epochs = epochs
+        self.capacity = capacity
+        self.gone = set()  # Rows whose log has moved to the rings
+        self._starts = None
+
+    def __len__(self):
+        return len(self.rows) - len(self.gone)
+
+    def find(self, row):
+        """Index of a row's log here, or None."""
+        index = int(np.searchsorted(self.rows, row))
+        if index < len(self.rows) and self.rows[index] == row and row not in self.gone:
+            return index
+        return None
+
+    def live(self):
+        """Indices of the logs still held here."""
+        if not self.gone:
+            return np.arange(len(self.rows))
+        return np.flatnonzero(~np.isin(self.rows, np.fromiter(self.gone, dtype=np.int64)))
+
+    def lengths(self, indices):
+        return np.minimum(np.asarray(self.counts[indices], dtype=np.int64), self.capacity)
+
+    def starts(self, indices):
+        """Offsets of logs' entries in signal_ids and times."""
+        if self._starts is None:
+            lengths = self.lengths(slice(None))
+            self._starts = np.cumsum(lengths) - lengths
+        return self._starts[indices]
+
+    def entries(self, index):
+        """(timestamps, signal ids) of a log, oldest first."""
+        start = int(self.starts(index))
+        end = start + int(self.lengths(index))
+        return self.times[start:end].tolist(), self.signal_ids[start:end].tolist()
+
+
+class MessageLogStore:
+    """
+    Bounded per-node message logs for a NodeStateTable.
+
+    Each row that has received a message owns a slot in two fixed-width
+    arrays (interned signal ids and timestamps) used as a ring buffer of
+    `capacity` entries. When a ring is full the oldest entry is evicted and,
+    if a spill path is configured, appended to a SpillSegment.
+
+    Every log also has an epoch naming this particular sequence of entries:
+    a new one is minted when a row gets a fresh log (after a release, a
+    replace or a rebase) and is carried along when a log is copied or
+    snapshotted, so consumers such as Storage can tell a continuation of a
+    log from a new one. Epochs are "<token>:<number>" strings, where the
+    token is a random id of the store that minted them.
+
+    Logs restored from a snapshot stay in a read-only SnapshotLogs layer
+    (self.snapshot) until they are first written.
+    """
+
+    def __init__(self, capacity=32, spill_path=None, clock=time.time):
+        if capacity < 1:
+            raise ValueError("Message log capacity must be at least 1.")
+        self.capacity = capacity
+        self.clock = clock
+        self.interner = SignalInterner()
+        self.spill = SpillSegment(spill_path, self.interner) if spill_path else None
+        self.slots = {}  # row -> slot
+        self.owners = []  # slot -> interned node id
+        self.signal_ids = np.zeros((0, capacity), dtype=np.int32)
+        self.times = np.zeros((0, capacity), dtype=np.float64)
+        self.counts = np.zeros(0, dtype=np.int64)  # Total entries ever appended per slot
+        self.tokens = [uuid.uuid4().hex]  # Epoch namespaces; self.own_token names this store's
+        self.own_token = 0
+        self.epoch_tokens = np.zeros(0, dtype=np.int32)  # slot -> index into tokens
+        self.epochs = np.zeros(0, dtype=np.int64)  # slot -> epoch number within its token
+        self._next_epoch = 0
+        self._free_slots = []
+        self.snapshot = None  # SnapshotLogs not yet moved into the rings
+        self._snapshot_epochs = 0  # First epoch number of snapshot logs restored without epochs
+
+    def _snapshot_index(self, row):
+        return self.snapshot.find(row) if self.snapshot else None
+
+    def _new_slots(self, owner_keys):
+        """Take slots for logs owned by owner_keys (interned ids), reusing released ones first."""
+        owner_keys = list(owner_keys)
+        reused = [self._free_slots.pop() for _ in range(min(len(owner_keys), len(self._free_slots)))]
+        for slot, owner_key in zip(reused, owner_keys):
+            self.owners[slot] = owner_key
+        start = len(self.owners)
+        end = start + len(owner_keys) - len(reused)
+        if end > len(self.counts):
+            self._grow(max(16, 2 * len(self.counts), end))
+        self.owners.extend(owner_keys[len(reused):])
+        return reused + list(range(start, end))
+
+    def _slot(self, row, owner):
+        slot = self.slots.get(row)
+        if slot is not None:
+            return slot
+        if self._snapshot_index(row) is not None:
+            self._thaw(np.array([row], dtype=np.int64))
+            return self.slots[row]
+        slot, = self._new_slots([self.interner.intern(owner)])
+        self.counts[slot] = 0
+        self.epoch_tokens[slot] = self.own_token
+        self.epochs[slot] = self._next_epoch
+        self._next_epoch += 1
+        self.slots[row] = slot
+        return slot
+
+    def _thaw(self, rows):
+        """Copy the snapshot logs of rows (those that have one) into rings."""
+        snapshot = self.snapshot
+        indices = np.minimum(np.searchsorted(snapshot.rows, rows), len(snapshot.rows) - 1)
+        found = np.asarray(snapshot.rows[indices]) == rows
+        if snapshot.gone:
+            found &= ~np.isin(rows, np.fromiter(snapshot.gone, dtype=np.int64))
+        rows, indices = rows[found], indices[found]
+        if not len(rows):
+            return
+        slots = np.array(self._new_slots(snapshot.owners[indices].tolist()), dtype=np.int64)
+        self.slots.update(zip(rows.tolist(), slots.tolist()))
+        snapshot.gone.update(rows.tolist())
+
+        counts = np.asarray(snapshot.counts[indices], dtype=np.int64)
+        lengths = snapshot.lengths(indices)
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        entry_slots = np.repeat(slots, lengths)
+        positions = (np.repeat(counts - lengths, lengths) + offsets) % self.capacity
+        source = np.repeat(snapshot.starts(indices), lengths) + offsets
+        self.signal_ids[entry_slots, positions] = snapshot.signal_ids[source]
+        self.times[entry_slots, positions] = snapshot.times[source]
+        self.counts[slots] = counts
+        if snapshot.epochs is None:
+            self.epoch_tokens[slots] = self.own_token
+            self.epochs[slots] = self._snapshot_epochs + indices
+        else:
+            self.epoch_tokens[slots] = snapshot.epoch_tokens[indices]
+            self.epochs[slots] = snapshot.epochs[indices]
+
+    def _snapshot_epoch(self, index):
+        snapshot = self.snapshot
+        if snapshot.epochs is None:
+            return self.own_token, self._snapshot_epochs + index
+        return int(snapshot.epoch_tokens[index]), int(snapshot.epochs[index])
+
+    def _grow(self, slot_capacity):
+        for name in ("signal_ids", "times", "counts", "epoch_tokens", "epochs"):
+            old = getattr(self, name)
+            new = np.zeros((slot_capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def append(self, row, owner, signal, timestamp=None):
+        slot = self._slot(row, owner)
+        count = int(self.counts[slot])
+        pos = count % self.capacity
+        if count >= self.capacity and self.spill is not None:
+            self.spill.write(self.owners[slot], self.times[slot, pos], self.signal_ids[slot, pos])
+        self.signal_ids[slot, pos] = self.interner.intern(signal)
+        self.times[slot, pos] = self.clock() if timestamp is None else timestamp
+        self.counts[slot] = count + 1
+
+    def append_many(self, rows, owners, signal_ids, timestamp=None):
+        """
+        Append interned signal ids to many rows at once, in order.
+
+        rows and signal_ids are parallel arrays (a row may repeat); owners maps
+        a row to its node id for rows that have no log yet.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if not len(rows):
+            return
+        timestamp = self.clock() if timestamp is None else timestamp
+        unique_rows, inverse = np.unique(rows, return_inverse=True)
+        if self.snapshot:
+            self._thaw(unique_rows)
+        slots = np.array([self._slot(row, owners[row]) for row in unique_rows.tolist()], dtype=np.int64)
+        entry_slots = slots[inverse]
+
+        # Sequence number of each entry: previous count plus its rank within its slot.
+        order = np.argsort(entry_slots, kind="stable")
+        sorted_slots = entry_slots[order]
+        group_start = np.flatnonzero(np.r_[True, sorted_slots[1:] != sorted_slots[:-1]])
+        group_size = np.diff(np.r_[group_start, len(sorted_slots)])
+        rank = np.empty(len(rows), dtype=np.int64)
+        rank[order] = np.arange(len(rows)) - np.repeat(group_start, group_size)
+        old_counts = self.counts[slots]
+        new_counts = old_counts + np.bincount(inverse, minlength=len(slots))
+        seq = old_counts[inverse] + rank
+        keep_from = new_counts - self.capacity  # Oldest seq still in the ring afterwards
+
+        if self.spill is not None:
+            self._spill_evicted(slots, old_counts, keep_from, entry_slots, seq, inverse, signal_ids, timestamp)
+
+        kept = seq >= keep_from[inverse]
+        pos = seq[kept] % self.capacity
+        self.signal_ids[entry_slots[kept], pos] = np.asarray(signal_ids)[kept]
+        self.times[entry_slots[kept], pos] = timestamp
+        self.counts[slots] = new_counts
+
+    def _spill_evicted(self, slots, old_counts, keep_from, entry_slots, seq, inverse, signal_ids, timestamp):
+        owners = np.array(self.owners, dtype=np.int64)
+        # Entries already in the rings that fall out of the window.
+        first_old = np.maximum(old_counts - self.capacity, 0)
+        evict_end = np.minimum(old_counts, keep_from)
+        count = np.maximum(evict_end - first_old, 0)
+        if count.any():
+            slot_rep = np.repeat(slots, count)
+            old_seq = np.repeat(first_old, count) + np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+            pos = old_seq % self.capacity
+            self.spill.write_many(owners[slot_rep], self.times[slot_rep, pos], self.signal_ids[slot_rep, pos])
+        # New entries that are overwritten within the same batch.
+        dropped = seq < keep_from[inverse]
+        if dropped.any():
+            self.spill.write_many(owners[entry_slots[dropped]], timestamp, np.asarray(signal_ids)[dropped])
+
+    def restore(self, rows, owners, counts, signal_ids, times, tokens=None, epoch_tokens=None, epochs=None):
+        """
+        Attach flattened logs, as written by a lattice snapshot, to an empty store.
+
+        rows (sorted), owners (interned node ids) and counts (entries ever
+        appended) are per log; signal_ids and times hold each log's ring
+        contents, oldest first. epoch_tokens (indices into tokens) and epochs
+        give each log's epoch; without them every log gets a new one. The
+        arrays are used in place (see SnapshotLogs), so memory-mapped ones
+        are not read until a log is.
+        """
+        if self.slots or self.snapshot:
+            raise ValueError("Logs can only be restored into an empty store.")
+        if epochs is None:
+            self._snapshot_epochs = self._next_epoch
+            self._next_epoch += len(rows)
+        else:
+            self.tokens = list(tokens) + [self.tokens[self.own_token]]
+            self.own_token = len(self.tokens) - 1
+        self.snapshot = SnapshotLogs(rows, owners, counts, signal_ids, times, epoch_tokens, epochs, self.capacity)
+
+    def export(self, rows):
+        """
+        Flatten the logs of `rows` (each must hold a log) in the layout restore() takes.
+
+        Returns a dict of per-log owners, counts, epoch_tokens and epochs and
+        the concatenated ring contents signal_ids and times, oldest first.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        in_rings = np.array([row in self.slots for row in rows.tolist()], dtype=bool)
+        slots = np.array([self.slots[row] for row in rows[in_rings].tolist()], dtype=np.int64)
+        indices = np.array([self.snapshot.find(row) for row in rows[~in_rings].tolist()], dtype=np.int64)
+
+        counts = np.empty(len(rows), dtype=np.int64)
+        owners = np.empty(len(rows), dtype=np.int64)
+        epoch_tokens = np.empty(len(rows), dtype=np.int32)
+        epochs = np.empty(len(rows), dtype=np.int64)
+        counts[in_rings] = self.counts[slots]
+        owners[in_rings] = np.array(self.owners, dtype=np.int64)[slots] if len(slots) else []
+        epoch_tokens[in_rings], epochs[in_rings] = self.epoch_tokens[slots], self.epochs[slots]
+        lengths = np.minimum(counts, self.capacity)
+
+        # Ring entries of the logs in the rings, then the snapshot's flat entries, gathered in row order.
+        ring_lengths = lengths[in_rings]
+        entry_slots = np.repeat(slots, ring_lengths)
+        seq = (np.repeat(counts[in_rings] - ring_lengths, ring_lengths) + np.arange(ring_lengths.sum())
+               - np.repeat(np.cumsum(ring_lengths) - ring_lengths, ring_lengths))
+        signal_ids = [self.signal_ids[entry_slots, seq % self.capacity]]
+        times = [self.times[entry_slots, seq % self.capacity]]
+        source_starts = np.empty(len(rows), dtype=np.int64)
+        source_starts[in_rings] = np.cumsum(ring_lengths) - ring_lengths
+        if len(indices):
+            snapshot = self.snapshot
+            counts[~in_rings] = snapshot.counts[indices]
+            owners[~in_rings] = snapshot.owners[indices]
+            for index, at in zip(indices.tolist(), np.flatnonzero(~in_rings).tolist()):
+                epoch_tokens[at], epochs[at] = self._snapshot_epoch(index)
+            lengths[~in_rings] = snapshot.lengths(indices)
+            source_starts[~in_rings] = snapshot.starts(indices) + len(seq)
+            signal_ids.append(snapshot.signal_ids)
+            times.append(snapshot.times)
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        gather = np.repeat(source_starts, lengths) + offsets
+        return {
+            "owners": owners, "counts": counts, "epoch_tokens": epoch_tokens, "epochs": epochs,
+            "signal_ids": np.concatenate(signal_ids)[gather], "times": np.concatenate(times)[gather],
+        }
+
+    def rows(self):
+        """Rows that hold a log, in the rings or the snapshot layer."""
+        rows = list(self.slots)
+        if self.snapshot:
+            rows.extend(self.snapshot.rows[self.snapshot.live()].tolist())
+        return rows
+
+    def load(self, row, owner, entries, count, epoch=None):
+        """
+        Replace a row's log with (timestamp, signal) entries that end at seq count.
+
+        Only the last `capacity` entries are kept. The log takes `epoch` if
+        given, otherwise a new one.
+        """
+        entries = list(entries)[-self.capacity:]
+        self.release(row)
+        slot = self._slot(row, owner)
+        for offset, (timestamp, signal) in enumerate(entries, start=count - len(entries)):
+            self.signal_ids[slot, offset % self.capacity] = self.interner.intern(signal)
+            self.times[slot, offset % self.capacity] = 0.0 if timestamp is None else timestamp
+        self.counts[slot] = count
+        if epoch is not None:
+            token, number = epoch.rsplit(":", 1)
+            if token not in self.tokens:
+                self.tokens.append(token)
+            self.epoch_tokens[slot] = self.tokens.index(token)
+            self.epochs[slot] = int(number)
+
+    def copy(self, source, source_row, row, owner):
+        """Copy a row's log from another store, keeping its sequence numbers and epoch."""
+        if source_row not in source.slots and source._snapshot_index(source_row) is None:
+            self.release(row)
+            return
+        entries = [(timestamp, signal) for _, timestamp, signal in source.entries(source_row)]
+        self.load(row, owner, entries, source.total(source_row), source.epoch(source_row, owner))
+
+    def rebase(self, row, owner, seq, history=()):
+        """
+        Renumber a row's log so its entries continue from seq, under a new epoch.
+
+        history holds the (timestamp, signal) entries just before seq, oldest
+        first, and fills the rest of the ring; pass at least
+        min(seq, capacity) of them so every slot in the window is known.
+        """
+        current = [(timestamp, signal) for _, timestamp, signal in self.entries(row)]
+        self.load(row, owner, list(history) + current, seq + len(current))
+
+    def epoch(self, row, owner):
+        """Identity of a row's current log, giving the row an empty log if it has none."""
+        index = self._snapshot_index(row) if row not in self.slots else None
+        if index is not None:
+            token, number = self._snapshot_epoch(index)
+        else:
+            slot = self._slot(row, owner)
+            token, number = self.epoch_tokens[slot], self.epochs[slot]
+        return f"{self.tokens[token]}:{number}"
+
+    def entries(self, row, since=0):
+        """Return [(seq, timestamp, signal)] still held in the ring, oldest first, with seq >= since."""
+        slot = self.slots.get(row)
+        if slot is None:
+            index = self._snapshot_index(row)
+            if index is None:
+                return []
+            times, signal_ids = self.snapshot.entries(index)
+            count = int(self.snapshot.counts[index])
+            first = count - len(times)
+            lookup = self.interner.lookup
+            return [(seq, times[seq - first], lookup(signal_ids[seq - first]))
+                    for seq in range(max(first, since), count)]
+        count = int(self.counts[slot])
+        first = max(count - self.capacity, since)
+        lookup = self.interner.lookup
+        return [
+            (seq, self.times[slot, seq % self.capacity].item(),
+             lookup(self.signal_ids[slot, seq % self.capacity]))
+            for seq in range(first, count)
+        ]
+
+    def length(self, row):
+        return min(self.total(row), self.capacity)
+
+    def total(self, row):
+        """Number of entries ever appended to a row's log."""
+        slot = self.slots.get(row)
+        if slot is None:
+            index = self._snapshot_index(row)
+            return 0 if index is None else int(self.snapshot.counts[index])
+        return int(self.counts[slot])
+
+    def release(self, row):
+        if self._snapshot_index(row) is not None:
+            self.snapshot.gone.add(row)
+        slot = self.slots.pop(row, None)
+        if slot is not None:
+            self.counts[slot] = 0
+            self._free_slots.append(slot)
+
+    def flush(self):
+        if self.spill is not None:
+            self.spill.flush()
+
+
+class MessageLogView:
+    """List-like view of one node's message log; keeps `state["message_log"]` working."""
+
+    __slots__ = ("_store", "_row", "_owner")
+
+    def __init__(self, store, row, owner):
+        self._store = store
+        self._row = row
+        self._owner = owner
+
+    def append(self, signal):
+        self._store.append(self._row, self._owner, signal)
+
+    def extend(self, signals):
+        for signal in signals:
+            self._store.append(self._row, self._owner, signal)
+
+    def clear(self):
+        self._store.release(self._row)
+
+    @property
+    def seq(self):
+        """Total number of entries ever appended, including evicted ones."""
+        return self._store.total(self._row)
+
+    @property
+    def capacity(self):
+        return self._store.capacity
+
+    @property
+    def epoch(self):
+        """Identity of this log; see MessageLogStore."""
+        return self._store.epoch(self._row, self._owner)
+
+    def rebase(self, seq, history=()):
+        """Continue numbering from seq after the (timestamp, signal) history, e.g. when reloading persisted logs."""
+        self._store.rebase(self._row, self._owner, seq, history)
+
+    def entries_since(self, seq):
+        """Return [(seq, timestamp, signal)] appended at or after seq that are still in memory."""
+        return self._store.entries(self._row, since=seq)
+
+    def __len__(self):
+        return self._store.length(self._row)
+
+    def __iter__(self):
+        return iter([signal for _, _, signal in self._store.entries(self._row)])
+
+    def __getitem__(self, index):
+        return list(self)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, MessageLogView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
@@ -1,33 +1,80 @@
+from src.core.events import EnergyDepleted, NodeEvolved, NodeRecharged, SignalDelivered, hooks
+from src.core.node_state_table import NodeStateTable, NodeStateView
+
+
 class AutonomousNode:
-    def __init__(self, id):
+    """A view over one row of a NodeStateTable; `state` behaves like the old state dict."""
+
+    __slots__ = ("id", "_table", "_row")
+
+    def __init__(self, id, table=None):
         self.id = id
-        self.state = {
-            "energy": 100,
-            "evolution_score": 0,
-            "message_log": [],
-        }
+        self._table = table if table is not None else NodeStateTable.default()
+        self._row = self._table.allocate(id)
+
+    @classmethod
+    def attach(cls, id, table, row):
+        """Return a node viewing an existing, already allocated table row."""
+        node = cls.__new__(cls)
+        node.id, node._table, node._row = id, table, row
+        return node
+
+    def __del__(self):
+        try:
+            self._table.release(self._row)
+        except (AttributeError, TypeError):
+            pass  # Partially constructed node or interpreter shutdown
+
+    @property
+    def state(self):
+        return NodeStateView(self)
+
+    @state.setter
+    def state(self, values):
+        self._table.assign(self._row, values)
+
+    @property
+    def table(self):
+        return self._table
+
+    @property
+    def row(self):
+        return self._row
+
+    def move_to(self, table):
+        """Move this node's state into another table."""
+        if table is self._table:
+            return
+        row = table.allocate(self.id)
+        table.copy_row(self._table, self._row, row)
+        self._table.release(self._row)
+        self._table, self._row = table, row
 
     def evolve(self):
         """Simulate autonomous evolution."""
-        if self.state["energy"] > 0:
-            self.state["energy"] -= 5
-            self.state["evolution_score"] += 1
-            print(f"Node {self.id} evolves. State: {self.state}")
-        else:
-            print(f"Node {self.id} is out of energy and cannot evolve.")
+        state = self.state
+        if state["energy"] > 0:
+            state["energy"] -= 5
+            state["evolution_score"] += 1
+            if hooks.node_evolved:
+                hooks.emit(NodeEvolved(self.id, state["energy"], state["evolution_score"]))
+            if hooks.energy_depleted and state["energy"] <= 0:
+                hooks.emit(EnergyDepleted(self.id, state["energy"]))
 
     def recharge(self, amount=50):
         """Recharge the node's energy."""
         self.state["energy"] += amount
-        print(f"Node {self.id} recharges by {amount}. Energy: {self.state['energy']}")
+        if hooks.node_recharged:
+            hooks.emit(NodeRecharged(self.id, amount, self.state["energy"]))
 
     def process_signal(self, signal):
         """Process an incoming signal and log it."""
-        print(f"Node {self.id} processing signal: {signal}")
+        if hooks.signal_delivered:
+            hooks.emit(SignalDelivered(self.id, signal))
         self.state["message_log"].append(signal)
         self.evolve()
 
     def destroy(self):
         """Simulate node destruction."""
         print(f"Node {self.id} has self-destructed.")
-        self.state = {"energy": 0, "evolution_score": 0, "message_log": []}
\ No newline at end of file
+        self.state = {"energy": 0, "evolution_score": 0, "message_log": []}
@@ -0,0 +1,191 @@
+from collections.abc import MutableMapping
+import numpy as np
+from src.core.message_log import MessageLogStore, MessageLogView
+
+_default_table = None
+
+
+class NodeStateTable:
+    """
+    Columnar storage for AutonomousNode state.
+
+    Numeric fields live in NumPy columns indexed by row, so bulk operations
+    over many nodes are vectorized. Message logs are bounded ring buffers in a
+    MessageLogStore (log_capacity entries per node, evictions optionally spilled
+    to spill_path), and ad-hoc keys (e.g. "task") are kept in a sparse side table.
+    Energy is stored as a float, so fractional costs and recharges are kept as
+    they were on plain node attributes; evolution score counts evolutions and
+    is an integer.
+    """
+
+    COLUMNS = ("energy", "evolution_score")
+    _STORAGE = COLUMNS + ("live",)
+    DEFAULTS = {"energy": 100, "evolution_score": 0}
+
+    def __init__(self, capacity=1024, log_capacity=32, spill_path=None):
+        capacity = max(1, capacity)
+        self.size = 0  # High-water mark of allocated rows
+        self.energy = np.zeros(capacity, dtype=np.float64)
+        self.evolution_score = np.zeros(capacity, dtype=np.int64)
+        self.live = np.zeros(capacity, dtype=bool)
+        self.logs = MessageLogStore(log_capacity, spill_path)
+        self.owners = []  # row -> id of the node using it
+        self.extras = {}  # row -> dict of non-columnar keys
+        self._free_rows = []
+
+    @classmethod
+    def default(cls):
+        """Return the process-wide table used by nodes created without one."""
+        global _default_table
+        if _default_table is None:
+            _default_table = cls()
+        return _default_table
+
+    @property
+    def capacity(self):
+        return len(self.energy)
+
+    def allocate(self, owner=None):
+        """Reserve a row initialised with default node state and return its index."""
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self.owners[row] = owner
+        else:
+            row = self.size
+            if row == self.capacity:
+                self._grow(2 * self.capacity)
+            self.size += 1
+            self.owners.append(owner)
+        self.energy[row] = self.DEFAULTS["energy"]
+        self.evolution_score[row] = self.DEFAULTS["evolution_score"]
+        self.live[row] = True
+        return row
+
+    def release(self, row):
+        """Return a row to the free list."""
+        self.energy[row] = 0
+        self.evolution_score[row] = 0
+        self.live[row] = False
+        self.logs.release(row)
+        self.owners[row] = None
+        self.extras.pop(row, None)
+        self._free_rows.append(row)
+
+    def _grow(self, capacity):
+        for column in self._STORAGE:
+            old = getattr(self, column)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, column, new)
+
+    def message_log(self, row):
+        """Return a list-like view of a row's message log."""
+        return MessageLogView(self.logs, row, self.owners[row])
+
+    def _replace_log(self, row, signals):
+        self.logs.release(row)
+        self.message_log(row).extend(signals)
+
+    def get(self, row, key):
+        if key in self.COLUMNS:
+            return getattr(self, key)[row].item()
+        if key == "message_log":
+            return self.message_log(row)
+        return self.extras[row][key]
+
+    def set(self, row, key, value):
+        if key in self.COLUMNS:
+            getattr(self, key)[row] = value
+        elif key == "message_log":
+            self._replace_log(row, list(value))
+        else:
+            self.extras.setdefault(row, {})[key] = value
+
+    def keys(self, row):
+        return list(self.COLUMNS) + ["message_log"] + list(self.extras.get(row, ()))
+
+    def assign(self, row, values):
+        """Replace the whole state of a row from a mapping, as `node.state = {...}` did."""
+        values = dict(values)
+        for column in self.COLUMNS:
+            getattr(self, column)[row] = values.pop(column, 0)
+        self._replace_log(row, list(values.pop("message_log", [])))
+        if values:
+            self.extras[row] = values
+        else:
+            self.extras.pop(row, None)
+
+    def copy_row(self, source, source_row, row):
+        """Copy a row from another table into this one."""
+        for column in self.COLUMNS:
+            getattr(self, column)[row] = getattr(source, column)[source_row]
+        self.logs.copy(source.logs, source_row, row, self.owners[row])
+        if source_row in source.extras:
+            self.extras[row] = source.extras[source_row]
+
+    # Vectorized bulk operations; rows=None means every live row.
+    def _select(self, rows):
+        if rows is None:
+            return np.flatnonzero(self.live[:self.size])
+        return np.asarray(rows, dtype=np.int64)
+
+    def recharge_all(self, amount=50, rows=None):
+        """Recharge every node (or the given rows) by amount."""
+        self.energy[self._select(rows)] += amount
+
+    def evolve_all(self, rows=None):
+        """Apply AutonomousNode.evolve to every node (or the given rows) and return the rows that evolved."""
+        rows = self._select(rows)
+        rows = rows[self.energy[rows] > 0]
+        self.energy[rows] -= 5
+        self.evolution_score[rows] += 1
+        return rows
+
+    def rows_with_energy(self, min_energy, rows=None):
+        """Return the rows whose energy is at least min_energy."""
+        rows = self._select(rows)
+        return rows[self.energy[rows] >= min_energy]
+
+
+class NodeStateView(MutableMapping):
+    """Mapping proxy that keeps `node.state[...]` working over a NodeStateTable row."""
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node):
+        self._node = node
+
+    def __getitem__(self, key):
+        node = self._node
+        try:
+            return node._table.get(node._row, key)
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        node = self._node
+        node._table.set(node._row, key, value)
+
+    def __delitem__(self, key):
+        node = self._node
+        extras = node._table.extras.get(node._row, {})
+        if key not in extras:
+            raise KeyError(key)
+        del extras[key]
+
+    def __iter__(self):
+        node = self._node
+        return iter(node._table.keys(node._row))
+
+    def __len__(self):
+        node = self._node
+        return len(node._table.keys(node._row))
+
+    def copy(self):
+        """Return a plain dict snapshot, with the message log as a list."""
+        snapshot = dict(self)
+        snapshot["message_log"] = list(snapshot["message_log"])
+        return snapshot
+
+    def __repr__(self):
+        return repr(self.copy())
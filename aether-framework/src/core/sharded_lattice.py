@@ -0,0 +1,263 @@
+import multiprocessing as mp
+from collections import deque
+from multiprocessing import shared_memory
+import numpy as np
+from src.core.csr_propagation import CSRPropagationEngine
+
+
+def partition_graph(indptr, indices, shard_count, seed=0, refine_passes=4, imbalance=0.05):
+    """
+    Split a CSR graph into shard_count balanced parts with few cut edges.
+
+    Parts are grown breadth-first from seeded start nodes, so connected
+    regions stay together, then refined by moving boundary nodes to the
+    neighboring part holding most of their edges while sizes stay within
+    (1 + imbalance) of the mean. Returns the part of every node.
+    """
+    node_count = len(indptr) - 1
+    if node_count == 0:
+        return np.empty(0, dtype=np.int64)
+    shard_count = max(1, min(shard_count, node_count))
+    target = -(-node_count // shard_count)
+    rng = np.random.default_rng(seed)
+
+    part, size = 0, 0
+    assignment = [-1] * node_count
+    indptr_list, indices_list = indptr.tolist(), indices.tolist()
+    for root in rng.permutation(node_count).tolist():
+        if assignment[root] >= 0:
+            continue
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            if assignment[node] >= 0:
+                continue
+            if size >= target and part < shard_count - 1:
+                part, size = part + 1, 0
+            assignment[node] = part
+            size += 1
+            for neighbor in indices_list[indptr_list[node]:indptr_list[node + 1]]:
+                if assignment[neighbor] < 0:
+                    queue.append(neighbor)
+    assignment = np.array(assignment, dtype=np.int64)
+
+    capacity = int(target * (1 + imbalance)) + 1
+    sources = np.repeat(np.arange(node_count), np.diff(indptr))
+    for _ in range(refine_passes):
+        # Only boundary nodes can gain by moving; count their edges into each part.
+        crossing = assignment[sources] != assignment[indices]
+        boundary = np.unique(sources[crossing])
+        if not len(boundary):
+            break
+        local = np.full(node_count, -1, dtype=np.int64)
+        local[boundary] = np.arange(len(boundary))
+        edges = local[sources] >= 0
+        links = np.bincount(local[sources[edges]] * shard_count + assignment[indices[edges]],
+                            minlength=len(boundary) * shard_count).reshape(len(boundary), shard_count)
+        best = links.argmax(axis=1)
+        span = np.arange(len(boundary))
+        gain = links[span, best] - links[span, assignment[boundary]]
+        moving = (gain > 0) & (rng.random(len(boundary)) < 0.5)
+        movers, destinations, gain = boundary[moving], best[moving], gain[moving]
+        if not len(movers):
+            continue
+        order = np.lexsort((-gain, destinations))
+        movers, destinations = movers[order], destinations[order]
+        sizes = np.bincount(assignment, minlength=shard_count)
+        rank = np.arange(len(movers)) - np.searchsorted(destinations, destinations)
+        allowed = rank < (capacity - sizes)[destinations]
+        assignment[movers[allowed]] = destinations[allowed]
+    return assignment
+
+
+def cut_edges(indptr, indices, assignment):
+    """Return the number of undirected edges whose endpoints sit in different parts."""
+    sources = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    return int(np.count_nonzero(assignment[sources] != assignment[indices])) // 2
+
+
+def _share(array):
+    """Copy an array into a new shared memory block; returns (block, view)."""
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    view[:] = array
+    return block, view
+
+
+def _attach(spec):
+    name, shape, dtype = spec
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _shard_worker(shard_id, conn, specs):
+    """Worker loop: serve the frontier of one shard per superstep."""
+    blocks, arrays = zip(*(_attach(spec) for spec in specs))
+    indptr, indices, assignment, energy, evolution_score = arrays
+    engine = CSRPropagationEngine(indptr, indices)
+    empty = np.empty(0, dtype=np.int64)
+    try:
+        while True:
+            command, *args = conn.recv()
+            if command == "begin":
+                energy_cost, = args
+                recent = engine.recent_keys()
+                pending = (empty, empty)
+                conn.send(None)
+            elif command == "step":
+                incoming_waves, incoming_nodes = args
+                waves = np.concatenate([pending[0], incoming_waves])
+                nodes = np.concatenate([pending[1], incoming_nodes])
+                waves, nodes = engine.deliver(waves, nodes, recent, energy, evolution_score, energy_cost)
+                next_waves, next_nodes = engine.expand(waves, nodes)
+                owners = assignment[next_nodes]
+                local = owners == shard_id
+                pending = (next_waves[local], next_nodes[local])
+                remote = ~local
+                conn.send((waves, nodes, next_waves[remote], next_nodes[remote], owners[remote], len(pending[1])))
+            elif command == "close":
+                break
+    finally:
+        del indptr, indices, assignment, energy, evolution_score, arrays, engine
+        for block in blocks:
+            block.close()
+        conn.close()
+
+
+class ShardedLattice:
+    """
+    Runs batched propagation for a LatticeEngine across worker processes.
+
+    The CSR topology, shard assignment and node energy / evolution score live
+    in multiprocessing.shared_memory blocks. Each worker owns one shard and
+    serves its nodes one lockstep hop per superstep; frontier pairs crossing
+    shard boundaries are exchanged as one batched message per shard per step.
+    Per-node contention is resolved exactly as in LatticeEngine.propagate_batch,
+    so results match single-process propagation.
+    """
+
+    def __init__(self, lattice, shard_count, seed=0, context=None):
+        self.lattice = lattice
+        engine = lattice.engine
+        self.assignment = partition_graph(engine.indptr, engine.indices, shard_count, seed=seed)
+        self.shard_count = int(self.assignment.max()) + 1 if len(self.assignment) else 0
+        self.topology_version = lattice.topology_version
+
+        table, rows = lattice.state_table, lattice.rows
+        self._blocks = []
+        shared = []
+        for array in (engine.indptr, engine.indices, self.assignment,
+                      table.energy[rows] if table is not None else np.empty(0),
+                      table.evolution_score[rows] if table is not None else np.empty(0, dtype=np.int64)):
+            block, view = _share(array)
+            self._blocks.append(block)
+            shared.append(view)
+        self._indptr, self._indices, _, self.energy, self.evolution_score = shared
+        specs = [(block.name, view.shape, view.dtype) for block, view in zip(self._blocks, shared)]
+
+        context = context or mp.get_context()
+        self._connections, self._workers = [], []
+        for shard_id in range(self.shard_count):
+            parent_conn, child_conn = context.Pipe()
+            worker = context.Process(target=_shard_worker, args=(shard_id, child_conn, specs), daemon=True)
+            worker.start()
+            child_conn.close()
+            self._connections.append(parent_conn)
+            self._workers.append(worker)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def cut_edges(self):
+        return cut_edges(self._indptr, self._indices, self.assignment)
+
+    def propagate_signal(self, signal, start_node_id, energy_cost=5):
+        """Propagate a single signal through the shards."""
+        return self.propagate_batch([signal], [start_node_id], energy_cost)
+
+    def propagate_batch(self, signals, start_node_ids, energy_cost=5):
+        """Sharded equivalent of LatticeEngine.propagate_batch; returns {node_id: [signals delivered]}."""
+        lattice = self.lattice
+        if lattice.topology_version != self.topology_version:
+            raise RuntimeError("Lattice topology changed; create a new ShardedLattice.")
+        if len(signals) != len(start_node_ids):
+            raise ValueError("signals and start_node_ids must have the same length.")
+        if energy_cost < 0:
+            raise ValueError("energy_cost must be non-negative for batched propagation.")
+        starts = []
+        for start_node_id in start_node_ids:
+            start = lattice.node_index.get(start_node_id, -1)
+            if start < 0:
+                print(f"Start node {start_node_id} not found in the lattice.")
+            starts.append(start)
+        table, rows = lattice.state_table, lattice.rows
+        if table is None:
+            return {}
+
+        # The lattice table stays the source of truth between runs.
+        before = lattice.state_snapshot()
+        self.energy[:] = table.energy[rows]
+        self.evolution_score[:] = table.evolution_score[rows]
+        starts = np.asarray(starts, dtype=np.int64)
+        waves = np.flatnonzero(starts >= 0)
+        nodes = starts[waves]
+        inbox = self._route(waves, nodes, self.assignment[nodes])
+        for conn in self._connections:
+            conn.send(("begin", energy_cost))
+        for conn in self._connections:
+            conn.recv()
+
+        delivered_waves, delivered_nodes = [], []
+        while True:
+            for conn, (in_waves, in_nodes) in zip(self._connections, inbox):
+                conn.send(("step", in_waves, in_nodes))
+            step_waves, step_nodes, out_waves, out_nodes, out_owners = [], [], [], [], []
+            pending = 0
+            for conn in self._connections:
+                accepted_waves, accepted_nodes, remote_waves, remote_nodes, remote_owners, local = conn.recv()
+                step_waves.append(accepted_waves)
+                step_nodes.append(accepted_nodes)
+                out_waves.append(remote_waves)
+                out_nodes.append(remote_nodes)
+                out_owners.append(remote_owners)
+                pending += local
+            step_waves, step_nodes = np.concatenate(step_waves), np.concatenate(step_nodes)
+            order = np.lexsort((step_waves, step_nodes))
+            delivered_waves.append(step_waves[order])
+            delivered_nodes.append(step_nodes[order])
+            out_nodes = np.concatenate(out_nodes)
+            if not pending and not len(out_nodes):
+                break
+            inbox = self._route(np.concatenate(out_waves), out_nodes, np.concatenate(out_owners))
+
+        table.energy[rows] = self.energy
+        table.evolution_score[rows] = self.evolution_score
+        return lattice.record_deliveries(signals, np.concatenate(delivered_waves), np.concatenate(delivered_nodes), before)
+
+    def _route(self, waves, nodes, owners):
+        """Split frontier pairs into one batch per destination shard."""
+        order = np.argsort(owners, kind="stable")
+        bounds = np.searchsorted(owners[order], np.arange(self.shard_count + 1))
+        waves, nodes = waves[order], nodes[order]
+        return [(waves[lo:hi], nodes[lo:hi]) for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+    def close(self):
+        """Stop the workers and release the shared memory blocks."""
+        for conn in self._connections:
+            try:
+                conn.send(("close",))
+            except (BrokenPipeError, OSError):
+                pass
+        for worker in self._workers:
+            worker.join(timeout=5)
+        for conn in self._connections:
+            conn.close()
+        self._connections, self._workers = [], []
+        self._indptr = self._indices = self.energy = self.evolution_score = None
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
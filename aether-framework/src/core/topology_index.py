@@ -0,0 +1,184 @@
+import numpy as np
+
+
+class TopologyIndex:
+    """
+    Incrementally maintained adjacency, degree and component index for a lattice.
+
+    Neighbors are kept per node id in insertion-ordered dicts (id -> node), so
+    repeated connections are deduplicated and edges are inserted or deleted in
+    O(1). Connected components are tracked with a union-find; inserts union in
+    near-constant time, while deletes only mark the components stale so they
+    are rebuilt once, on the next query.
+    """
+
+    def __init__(self):
+        self.adjacency = {}  # node id -> {neighbor id: neighbor node}
+        self.network_map = {}  # node id -> live view of neighbor nodes
+        self.edge_count = 0
+        self.degree_counts = {}  # degree -> number of nodes with that degree
+        self._parent = {}
+        self._size = {}
+        self._components = 0
+        self._stale = False
+
+    @classmethod
+    def from_csr(cls, nodes, indptr, indices):
+        """Build an index from CSR adjacency over nodes; components are computed on first query."""
+        index = cls()
+        ids = [node.id for node in nodes]
+        bounds, neighbors_of = indptr.tolist(), indices.tolist()
+        for i, node_id in enumerate(ids):
+            neighbors = index.adjacency[node_id] = {
+                ids[j]: nodes[j] for j in neighbors_of[bounds[i]:bounds[i + 1]]
+            }
+            index.network_map[node_id] = neighbors.values()
+        degrees = np.diff(indptr)
+        index.degree_counts = dict(zip(*(values.tolist() for values in np.unique(degrees, return_counts=True))))
+        self_loops = int(np.count_nonzero(indices == np.repeat(np.arange(len(ids)), degrees)))
+        index.edge_count = (len(indices) + self_loops) // 2
+        index._stale = True
+        return index
+
+    def __contains__(self, node_id):
+        return node_id in self.adjacency
+
+    def __len__(self):
+        return len(self.adjacency)
+
+    def add_node(self, node_id):
+        if node_id in self.adjacency:
+            raise ValueError(f"Node {node_id} is already in the topology.")
+        neighbors = self.adjacency[node_id] = {}
+        self.network_map[node_id] = neighbors.values()
+        self._count_degree(0, 1)
+        self._parent[node_id] = node_id
+        self._size[node_id] = 1
+        self._components += 1
+
+    def remove_node(self, node_id):
+        """Remove a node and all of its edges."""
+        for neighbor_id in list(self.adjacency[node_id]):
+            self.remove_edge(node_id, neighbor_id)
+        del self.adjacency[node_id]
+        del self.network_map[node_id]
+        self._count_degree(0, -1)
+        if self._stale:
+            self._parent.pop(node_id, None)
+            self._size.pop(node_id, None)
+        else:
+            # An isolated node is its own singleton component.
+            del self._parent[node_id]
+            del self._size[node_id]
+            self._components -= 1
+
+    def add_edge(self, node_a, node_b):
+        """Connect two nodes; returns False if they were already connected."""
+        neighbors_a, neighbors_b = self.adjacency[node_a.id], self.adjacency[node_b.id]
+        if node_b.id in neighbors_a:
+            return False
+        self._move_degree(len(neighbors_a), len(neighbors_a) + 1)
+        neighbors_a[node_b.id] = node_b
+        if node_a.id != node_b.id:
+            self._move_degree(len(neighbors_b), len(neighbors_b) + 1)
+            neighbors_b[node_a.id] = node_a
+        self.edge_count += 1
+        if not self._stale:
+            self._union(node_a.id, node_b.id)
+        return True
+
+    def remove_edge(self, node_a_id, node_b_id):
+        """Disconnect two nodes; returns False if they were not connected."""
+        neighbors_a, neighbors_b = self.adjacency[node_a_id], self.adjacency[node_b_id]
+        if node_b_id not in neighbors_a:
+            return False
+        self._move_degree(len(neighbors_a), len(neighbors_a) - 1)
+        del neighbors_a[node_b_id]
+        if node_a_id != node_b_id:
+            self._move_degree(len(neighbors_b), len(neighbors_b) - 1)
+            del neighbors_b[node_a_id]
+            self._stale = True
+        self.edge_count -= 1
+        return True
+
+    def has_edge(self, node_a_id, node_b_id):
+        return node_b_id in self.adjacency[node_a_id]
+
+    def degree(self, node_id):
+        return len(self.adjacency[node_id])
+
+    def degree_stats(self):
+        """Return min, max and mean degree along with the degree histogram."""
+        if not self.adjacency:
+            return {"min": 0, "max": 0, "mean": 0.0, "histogram": {}}
+        degree_sum = sum(degree * count for degree, count in self.degree_counts.items())
+        return {
+            "min": min(self.degree_counts),
+            "max": max(self.degree_counts),
+            "mean": degree_sum / len(self.adjacency),
+            "histogram": dict(sorted(self.degree_counts.items())),
+        }
+
+    def _count_degree(self, degree, delta):
+        count = self.degree_counts.get(degree, 0) + delta
+        if count:
+            self.degree_counts[degree] = count
+        else:
+            del self.degree_counts[degree]
+
+    def _move_degree(self, old, new):
+        self._count_degree(old, -1)
+        self._count_degree(new, 1)
+
+    def _find(self, node_id):
+        parent = self._parent
+        root = node_id
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node_id] != root:
+            parent[node_id], node_id = root, parent[node_id]
+        return root
+
+    def _union(self, node_a_id, node_b_id):
+        root_a, root_b = self._find(node_a_id), self._find(node_b_id)
+        if root_a == root_b:
+            return
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size.pop(root_b)
+        self._components -= 1
+
+    def _refresh(self):
+        """Rebuild the union-find from the adjacency after edge deletions."""
+        if not self._stale:
+            return
+        self._parent = {node_id: node_id for node_id in self.adjacency}
+        self._size = dict.fromkeys(self.adjacency, 1)
+        self._components = len(self.adjacency)
+        self._stale = False
+        for node_id, neighbors in self.adjacency.items():
+            for neighbor_id in neighbors:
+                self._union(node_id, neighbor_id)
+
+    def component(self, node_id):
+        """Return a representative id for the component holding node_id."""
+        self._refresh()
+        return self._find(node_id)
+
+    def connected(self, node_a_id, node_b_id):
+        self._refresh()
+        return self._find(node_a_id) == self._find(node_b_id)
+
+    def reach(self, node_id):
+        """Number of nodes in the component of node_id, itself included."""
+        self._refresh()
+        return self._size[self._find(node_id)]
+
+    @property
+    def component_count(self):
+        self._refresh()
+        return self._components
+
+    def is_connected(self):
+        return self.component_count <= 1
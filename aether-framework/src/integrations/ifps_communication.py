@@ -1,13 +1,42 @@
+import json
 import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_API_URL = "http://127.0.0.1:5001"
 
 class IPFSCommunication:
-    """Decentralized communication using IPFS."""
-    def __init__(self, api_url="http://127.0.0.1:5001"):
+    """
+    Decentralized communication using IPFS.
+
+    HTTP connections come from a requests.Session created on first use, so
+    constructing a transport is free and repeated calls reuse pooled
+    keep-alive connections instead of opening one per message.
+    """
+    def __init__(self, api_url=DEFAULT_API_URL, pool_size=10, timeout=30):
         self.api_url = api_url
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._session = None
+
+    @property
+    def session(self):
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
     def send_message(self, message):
         """Send a message by uploading it to IPFS."""
-        response = requests.post(f"{self.api_url}/api/v0/add", files={"file": message.encode()})
+        response = self.session.post(f"{self.api_url}/api/v0/add", files={"file": message.encode()},
+                                     timeout=self.timeout)
         if response.status_code == 200:
             ipfs_hash = response.json()["Hash"]
             print(f"Message sent to IPFS with hash: {ipfs_hash}")
@@ -16,9 +45,32 @@ class IPFSCommunication:
             print("Failed to send message to IPFS.")
             return None
 
+    def send_messages(self, messages):
+        """
+        Upload many messages in one multi-file add request.
+
+        Returns their hashes in the order given, or None if the request failed.
+        """
+        if not messages:
+            return []
+        # Name each part by its position; the add endpoint streams one JSON object per file
+        files = [("file", (str(index), message.encode())) for index, message in enumerate(messages)]
+        response = self.session.post(f"{self.api_url}/api/v0/add", files=files, timeout=self.timeout)
+        if response.status_code != 200:
+            print("Failed to send messages to IPFS.")
+            return None
+        hashes = {}
+        for line in response.text.splitlines():
+            if line.strip():
+                entry = json.loads(line)
+                hashes[entry["Name"]] = entry["Hash"]
+        print(f"{len(messages)} messages sent to IPFS in one request.")
+        return [hashes.get(str(index)) for index in range(len(messages))]
+
     def retrieve_message(self, ipfs_hash):
         """Retrieve a message from IPFS using its hash."""
-        response = requests.get(f"{self.api_url}/api/v0/cat?arg={ipfs_hash}")
+        # The Kubo RPC API only accepts POST
+        response = self.session.post(f"{self.api_url}/api/v0/cat", params={"arg": ipfs_hash}, timeout=self.timeout)
         if response.status_code == 200:
             print(f"Message retrieved from IPFS: {response.text}")
             return response.text
@@ -26,10 +78,20 @@ class IPFSCommunication:
             print("Failed to retrieve message from IPFS.")
             return None
 
+
+_transports = {}
+
+def shared_transport(api_url=DEFAULT_API_URL):
+    """Return the process-wide transport for api_url, creating it on first use."""
+    transport = _transports.get(api_url)
+    if transport is None:
+        transport = _transports.setdefault(api_url, IPFSCommunication(api_url))
+    return transport
+
 # Example usage
 if __name__ == "__main__":
     ipfs_comm = IPFSCommunication()
     message = "Hello, decentralized world!"
     hash = ipfs_comm.send_message(message)
     if hash:
-        ipfs_comm.retrieve_message(hash)
\ No newline at end of file
+        ipfs_comm.retrieve_message(hash)
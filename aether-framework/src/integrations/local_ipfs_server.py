@@ -0,0 +1,111 @@
+import base64
+import hashlib
+import json
+import threading
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# CIDv1 prefix: version 1, raw codec, sha2-256 multihash of 32 bytes
+_CID_PREFIX = bytes([0x01, 0x55, 0x12, 0x20])
+
+def content_id(data):
+    """CIDv1 (raw, sha2-256, base32) of a block, as `ipfs add --cid-version=1 --raw-leaves` reports for small files."""
+    return "b" + base64.b32encode(_CID_PREFIX + hashlib.sha256(data).digest()).decode().lower().rstrip("=")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, so pooled client connections are reused
+    disable_nagle_algorithm = True  # Headers and body go out as separate writes
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if url.path == "/api/v0/add":
+            self._add(body)
+        elif url.path == "/api/v0/cat":
+            self._cat(parse_qs(url.query).get("arg", [""])[0])
+        else:
+            self._reply(404, b"Not found")
+
+    do_GET = do_POST
+
+    def _add(self, body):
+        header = f"Content-Type: {self.headers.get('Content-Type', '')}\r\n\r\n".encode()
+        message = BytesParser(policy=HTTP).parsebytes(header + body)
+        if not message.is_multipart():
+            self._reply(400, b"Expected a multipart/form-data body")
+            return
+        lines = []
+        for part in message.iter_parts():
+            data = part.get_payload(decode=True) or b""
+            cid = content_id(data)
+            self.server.blocks[cid] = data
+            lines.append(json.dumps({"Name": part.get_filename() or cid, "Hash": cid, "Size": str(len(data))}))
+        self._reply(200, ("\n".join(lines) + "\n").encode(), "application/json")
+
+    def _cat(self, cid):
+        data = self.server.blocks.get(cid)
+        if data is None:
+            self._reply(500, json.dumps({"Message": f"block not found: {cid}"}).encode(), "application/json")
+        else:
+            self._reply(200, data, "text/plain")
+
+    def _reply(self, status, payload, content_type="text/plain"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalIPFSServer:
+    """
+    In-memory stand-in for the add and cat endpoints of an IPFS node's RPC API.
+
+    Blocks are kept in a dict keyed by content ID, so IPFSCommunication can be
+    tested and benchmarked without a running daemon. Port 0 picks a free port.
+    """
+    def __init__(self, host="127.0.0.1", port=0):
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.blocks = {}
+        self._thread = None
+
+    @property
+    def api_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def blocks(self):
+        return self.httpd.blocks
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+# Example usage
+if __name__ == "__main__":
+    server = LocalIPFSServer(port=5001)
+    print(f"Local IPFS stand-in listening on {server.api_url}")
+    server.httpd.serve_forever()
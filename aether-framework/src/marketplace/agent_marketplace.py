@@ -1,19 +1,83 @@
+import itertools
+from src.marketplace.order_book import Order, OrderBook
+
 class AgentMarketplace:
+    """
+    Resource exchange between agents, backed by one OrderBook per resource.
+
+    list_resource and buy_resource keep the original listing/purchase API on
+    top of limit orders; place_order, place_orders and cancel expose the
+    order book directly.
+    """
     def __init__(self):
-        self.market = []
+        self.books = {}  # resource -> OrderBook
+        self.order_resources = {}  # order_id -> resource of a resting order
+        self._ids = itertools.count(1)
+
+    @property
+    def market(self):
+        """Resting sell orders as listing dicts, cheapest first per resource."""
+        return [{"agent_id": order.agent_id, "resource": order.resource, "price": order.price}
+                for book in self.books.values()
+                for order in sorted((o for o in book.orders.values() if o.side == "sell"),
+                                    key=lambda o: (o.price, o.order_id))]
+
+    def book(self, resource):
+        book = self.books.get(resource)
+        if book is None:
+            book = self.books[resource] = OrderBook(resource)
+        return book
+
+    def place_order(self, agent_id, resource, side, price, quantity=1, rest=True):
+        """
+        Submit a limit order; returns (order_id, fills).
+
+        The order trades against the best-priced, then oldest, opposite
+        orders it crosses; what is left rests in the book unless rest=False.
+        """
+        order = Order(next(self._ids), agent_id, resource, side, price, quantity)
+        book = self.book(resource)
+        fills = book.submit(order, rest)
+        for fill in fills:
+            for order_id in (fill["buy_order"], fill["sell_order"]):
+                if order_id not in book.orders:
+                    self.order_resources.pop(order_id, None)
+        if order.order_id in book.orders:
+            self.order_resources[order.order_id] = resource
+        return order.order_id, fills
+
+    def place_orders(self, orders):
+        """
+        Submit a batch of (agent_id, resource, side, price, quantity) orders in sequence.
+
+        Returns (order_ids, fills) with every fill of the batch in the order
+        it happened.
+        """
+        order_ids, fills = [], []
+        for agent_id, resource, side, price, quantity in orders:
+            order_id, order_fills = self.place_order(agent_id, resource, side, price, quantity)
+            order_ids.append(order_id)
+            fills.extend(order_fills)
+        return order_ids, fills
+
+    def cancel(self, order_id):
+        """Cancel a resting order; returns False if it already traded or was cancelled."""
+        resource = self.order_resources.pop(order_id, None)
+        return resource is not None and self.books[resource].cancel(order_id) is not None
 
     def list_resource(self, agent_id, resource, price):
-        """List a resource on the marketplace."""
-        self.market.append({"agent_id": agent_id, "resource": resource, "price": price})
+        """List a resource on the marketplace; returns the order id of the listing."""
+        order_id, _ = self.place_order(agent_id, resource, "sell", price)
         print(f"Agent {agent_id} listed {resource} for {price} credits.")
+        return order_id
 
     def buy_resource(self, buyer_id, resource, max_price):
-        """Buy a resource if available and within the budget."""
-        for listing in self.market:
-            if listing["resource"] == resource and listing["price"] <= max_price:
-                print(f"Agent {buyer_id} bought {resource} from Agent {listing['agent_id']} for {listing['price']} credits.")
-                self.market.remove(listing)
-                return True
+        """Buy the cheapest listing of a resource if it is within the budget."""
+        _, fills = self.place_order(buyer_id, resource, "buy", max_price, rest=False)
+        if fills:
+            fill = fills[0]
+            print(f"Agent {buyer_id} bought {resource} from Agent {fill['seller_id']} for {fill['price']} credits.")
+            return True
         print(f"Agent {buyer_id} could not buy {resource}.")
         return False
 
@@ -23,4 +87,4 @@ if __name__ == "__main__":
     marketplace.list_resource(1, "Energy", 10)
     marketplace.list_resource(2, "Data", 15)
     marketplace.buy_resource(3, "Energy", 12)
-    marketplace.buy_resource(3, "Data", 10)
\ No newline at end of file
+    marketplace.buy_resource(3, "Data", 10)
@@ -0,0 +1,100 @@
+import heapq
+
+
+class Order:
+    """A limit order for `quantity` units of a resource at `price` or better."""
+    __slots__ = ("order_id", "agent_id", "resource", "side", "price", "quantity")
+
+    def __init__(self, order_id, agent_id, resource, side, price, quantity=1):
+        if side not in ("buy", "sell"):
+            raise ValueError(f"Unknown order side: {side}")
+        self.order_id = order_id
+        self.agent_id = agent_id
+        self.resource = resource
+        self.side = side
+        self.price = price
+        self.quantity = quantity
+
+
+class OrderBook:
+    """
+    Limit order book for one resource with price-time priority.
+
+    Resting asks sit in a min-heap of (price, order_id) and resting bids in
+    a min-heap of (-price, order_id), so each side's best order is at the top
+    and order ids, which increase, break price ties oldest first. Matching
+    an incoming order costs O(log n) per fill. Cancelled orders are dropped
+    from `orders` and skipped when they surface; a side is rebuilt once its
+    heap holds more cancelled entries than live ones.
+    """
+
+    def __init__(self, resource):
+        self.resource = resource
+        self.orders = {}  # order_id -> resting Order
+        self.asks = []
+        self.bids = []
+        self._stale = {"buy": 0, "sell": 0}
+
+    def __len__(self):
+        return len(self.orders)
+
+    def _side(self, side):
+        return self.bids if side == "buy" else self.asks
+
+    def _best(self, side):
+        """The best live resting order on a side, or None."""
+        heap = self._side(side)
+        while heap and heap[0][1] not in self.orders:
+            heapq.heappop(heap)
+            self._stale[side] -= 1
+        return self.orders[heap[0][1]] if heap else None
+
+    def best_ask(self):
+        order = self._best("sell")
+        return None if order is None else order.price
+
+    def best_bid(self):
+        order = self._best("buy")
+        return None if order is None else order.price
+
+    def submit(self, order, rest=True):
+        """
+        Match `order` against the other side, then rest what is left.
+
+        Each fill trades at the resting order's price. With rest=False any
+        unfilled quantity is discarded (immediate-or-cancel). Returns the
+        fills as dicts.
+        """
+        fills = []
+        other = "sell" if order.side == "buy" else "buy"
+        while order.quantity > 0:
+            best = self._best(other)
+            if best is None or (best.price > order.price if order.side == "buy" else best.price < order.price):
+                break
+            quantity = min(order.quantity, best.quantity)
+            buy, sell = (order, best) if order.side == "buy" else (best, order)
+            fills.append({"resource": self.resource, "price": best.price, "quantity": quantity,
+                          "buyer_id": buy.agent_id, "seller_id": sell.agent_id,
+                          "buy_order": buy.order_id, "sell_order": sell.order_id})
+            order.quantity -= quantity
+            best.quantity -= quantity
+            if not best.quantity:
+                heapq.heappop(self._side(other))
+                del self.orders[best.order_id]
+        if rest and order.quantity > 0:
+            self.orders[order.order_id] = order
+            key = order.price if order.side == "sell" else -order.price
+            heapq.heappush(self._side(order.side), (key, order.order_id))
+        return fills
+
+    def cancel(self, order_id):
+        """Withdraw a resting order; returns it, or None if it is not resting."""
+        order = self.orders.pop(order_id, None)
+        if order is not None:
+            self._stale[order.side] += 1
+            heap = self._side(order.side)
+            if self._stale[order.side] > len(heap) // 2:
+                heap[:] = [entry for entry in heap if entry[1] in self.orders]
+                heapq.heapify(heap)
+                self._stale[order.side] = 0
+        return order
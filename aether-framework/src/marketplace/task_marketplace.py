@@ -1,3 +1,7 @@
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+from src.swarm.negotiation_agent import NegotiationAgent
+
 class TaskMarketplace:
     """
     A decentralized marketplace for task negotiation between agents.
@@ -5,6 +9,7 @@ class TaskMarketplace:
     """
     def __init__(self):
         self.tasks = []
+        self.task_index = {}  # Maps task_id to its task
         self.bids = {}  # Maps task_id to a list of (agent, bid_score)
 
     def add_task(self, task):
@@ -12,6 +17,7 @@ class TaskMarketplace:
         Add a new task to the marketplace.
         """
         self.tasks.append(task)
+        self.task_index[task["id"]] = task
         self.bids[task["id"]] = []
         print(f"Task {task['id']} added to the marketplace.")
 
@@ -32,13 +38,68 @@ class TaskMarketplace:
                 continue
 
             # Find the highest bidder
-            bid_list.sort(key=lambda x: x[1], reverse=True)
-            winner, _ = bid_list[0]
+            winner, _ = max(bid_list, key=lambda x: x[1])
 
             # Assign task to the winning agent
-            task = next(t for t in self.tasks if t["id"] == task_id)
+            task = self.task_index[task_id]
             print(f"Task {task_id} assigned to Agent {winner.agent_id}.")
             winner.perform_task(task)
 
         # Clear bids after assignment
-        self.bids.clear()
\ No newline at end of file
+        self.bids.clear()
+
+    def auction(self, agents, batch=64):
+        """
+        Clear every queued task against `agents` in one batched auction.
+
+        Bids are NegotiationAgent.score_tasks scores. Each round takes the
+        `batch` open tasks with the best top bids and solves an optimal
+        one-task-per-agent assignment over them with linear_sum_assignment,
+        counting only bids each agent can still afford. Winners' remaining
+        capacity is charged before the next round, so no agent wins more
+        than its resource_capacity covers. Rounds stop once no open task has
+        an agent left that can take it. Solve time grows quickly with
+        `batch`, so many small rounds clear a large queue fastest.
+
+        Winners perform their tasks, which leave the marketplace; returns
+        {task_id: agent}.
+        """
+        tasks, agents = list(self.tasks), list(agents)
+        if not tasks or not agents:
+            return {}
+        scores = NegotiationAgent.score_tasks(agents, tasks)
+        cost = np.array([task["resource_cost"] for task in tasks], dtype=float)
+        remaining = np.array([agent.resource_capacity for agent in agents], dtype=float)
+        best_bid = scores.max(axis=0)  # Zero once no agent can still take the task
+
+        won = []
+        while True:
+            columns = np.flatnonzero(best_bid > 0)
+            if not len(columns):
+                break
+            if batch < len(columns):
+                columns = columns[np.argpartition(-best_bid[columns], batch - 1)[:batch]]
+            matrix = scores[:, columns]
+            matrix[cost[columns] > remaining[:, None]] = 0
+            bids = matrix > 0
+            best_bid[columns[~bids.any(axis=0)]] = 0  # Capacity only shrinks, so these stay out of reach
+            bidders = np.flatnonzero(bids.any(axis=1))
+            matrix = matrix[bidders]
+            row, col = linear_sum_assignment(matrix, maximize=True)
+            keep = matrix[row, col] > 0
+            winners, placed = bidders[row[keep]], columns[col[keep]]
+            best_bid[placed] = 0
+            remaining[winners] -= cost[placed]
+            won.extend(zip(placed.tolist(), winners.tolist()))
+
+        assignment = {}
+        for task_index, agent_index in sorted(won):
+            task, winner = tasks[task_index], agents[agent_index]
+            print(f"Task {task['id']} assigned to Agent {winner.agent_id}.")
+            winner.perform_task(task)
+            assignment[task["id"]] = winner
+        self.tasks = [task for task in self.tasks if task["id"] not in assignment]
+        for task_id in assignment:
+            self.task_index.pop(task_id, None)
+            self.bids.pop(task_id, None)
+        return assignment
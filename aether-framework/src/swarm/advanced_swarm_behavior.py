@@ -1,21 +1,39 @@
 import random
-from src.integrations.ipfs_communication import IPFSCommunication
+from src.integrations.ifps_communication import shared_transport
+from src.swarm.indexed_set import IndexedSet
+from src.swarm.knowledge_store import KnowledgeStore
+from src.utils.reinforcement_learning import QTensor
+
+TASK_ACTIONS = ["explore", "process", "rest"]
 
 class ReinforcementLearningAgent:
-    """A basic RL agent for swarm nodes."""
-    def __init__(self):
+    """
+    A basic RL agent for swarm nodes.
+
+    Q-values live in a per-agent dict unless a shared QTensor is given, in
+    which case the agent reads and writes row `node` of the tensor.
+    """
+    def __init__(self, q_store=None, node=None, rng=random):
         self.q_table = {}
+        self.rng = rng
         self.learning_rate = 0.1
         self.discount_factor = 0.9
+        self.q_store = q_store
+        self.node = node
 
     def choose_action(self, state, actions):
         """Choose an action based on Q-values or explore."""
-        if random.random() < 0.1:  # Exploration rate
-            return random.choice(actions)
+        if self.q_store is not None:
+            return self.q_store.actions[self.q_store.choose_actions(state, [self.node])[0]]
+        if self.rng.random() < 0.1:  # Exploration rate
+            return self.rng.choice(actions)
         return max(actions, key=lambda action: self.q_table.get((state, action), 0))
 
     def update_q_value(self, state, action, reward, next_state, next_actions):
         """Update the Q-value using the Bellman equation."""
+        if self.q_store is not None:
+            self.q_store.update([state], [action], [reward], [next_state], nodes=[self.node])
+            return
         current_q = self.q_table.get((state, action), 0)
         max_future_q = max(self.q_table.get((next_state, a), 0) for a in next_actions)
         new_q = current_q + self.learning_rate * (reward + self.discount_factor * max_future_q - current_q)
@@ -24,15 +42,23 @@ class ReinforcementLearningAgent:
 
 class SwarmNode:
     """A single node in an AI swarm with advanced behaviors."""
-    def __init__(self, id, role="worker"):
+    def __init__(self, id, role="worker", rl_agent=None, ipfs=None, rng=random, knowledge=None):
         self.id = id
         self.role = role
-        self.state = random.random()  # Initial state
-        self.energy = random.randint(50, 100)
+        self.rng = rng
+        self.state = rng.random()  # Initial state
+        self.energy = rng.randint(50, 100)
         self.tasks_completed = 0
-        self.knowledge = {}  # Shared knowledge
-        self.rl_agent = ReinforcementLearningAgent()
-        self.ipfs = IPFSCommunication()  # Add IPFS communication
+        self.knowledge = knowledge if knowledge is not None else {}  # Shared knowledge, a dict or KnowledgeView
+        self.swarm = None  # Set by the Swarm that tracks this node's activity
+        self.rl_agent = rl_agent if rl_agent is not None else ReinforcementLearningAgent(rng=rng)
+        self._ipfs = ipfs  # IPFS transport, shared by all nodes unless one is given
+
+    @property
+    def ipfs(self):
+        if self._ipfs is None:
+            self._ipfs = shared_transport()
+        return self._ipfs
 
     def interact(self, other_node):
         """Simulate interaction between nodes."""
@@ -44,9 +70,15 @@ class SwarmNode:
     def perform_task(self):
         """Perform a task based on the node's role and reinforcement learning."""
         state = "normal"
-        actions = ["explore", "process", "rest"]
+        actions = TASK_ACTIONS
         action = self.rl_agent.choose_action(state, actions)
+        self.act(action)
+
+        reward = self.rng.randint(0, 10)  # Random reward for simplicity
+        self.rl_agent.update_q_value(state, action, reward, "normal", actions)
 
+    def act(self, action):
+        """Carry out a chosen task action."""
         if action == "explore":
             self.explore()
         elif action == "process":
@@ -54,13 +86,10 @@ class SwarmNode:
         elif action == "rest":
             self.rest()
 
-        reward = random.randint(0, 10)  # Random reward for simplicity
-        self.rl_agent.update_q_value(state, action, reward, "normal", actions)
-
     def explore(self):
         """Node explores and gathers data."""
         print(f"Node {self.id} (explorer) is gathering data.")
-        self.knowledge[random.randint(0, 100)] = random.random()
+        self.knowledge[self.rng.randint(0, 100)] = self.rng.random()
 
     def process(self):
         """Node processes data."""
@@ -90,13 +119,17 @@ class SwarmNode:
             self.tasks_completed = 0  # Reset any ongoing work
             self.knowledge.clear()  # Clear knowledge to simulate failure
             print(f"Node {self.id} has failed and is now inactive.")
+            if self.swarm is not None:
+                self.swarm.node_failed(self)
 
     def recover(self):
         """Recover a failed node."""
         if self.role == "inactive":  # Only allow recovery for inactive nodes
-            self.role = random.choice(["worker", "explorer", "coordinator"])
-            self.energy = random.randint(50, 100)  # Assign new energy
+            self.role = self.rng.choice(["worker", "explorer", "coordinator"])
+            self.energy = self.rng.randint(50, 100)  # Assign new energy
             print(f"Node {self.id} has recovered and is now active with role: {self.role}.")
+            if self.swarm is not None:
+                self.swarm.node_recovered(self)
 
     def send_decentralized_message(self, message):
         """Send a message to IPFS."""
@@ -110,33 +143,120 @@ class SwarmNode:
 
 
 class Swarm:
-    """A collection of swarm nodes with specialized roles and behaviors."""
-    def __init__(self, node_count):
+    """
+    A collection of swarm nodes with specialized roles and behaviors.
+
+    q_mode selects where node Q-values live: None keeps a dict per node,
+    "per_node" and "shared" use one QTensor for the swarm (separate tables
+    per node, or one table shared by all), and let simulate() choose and
+    learn for every active node in one call per iteration. Nodes share
+    one IPFS transport: `ipfs` if given, else the process-wide one.
+    Random draws come from `rng` (a random.Random), or the global random
+    module when none is given. Node knowledge lives in one KnowledgeStore,
+    each node holding a view of it.
+
+    `active` and `inactive` index node positions in swap-remove sets that
+    SwarmNode.fail() and recover() keep current, so counting, sampling and
+    recovery sweeps never scan the whole swarm.
+    """
+    def __init__(self, node_count, q_mode=None, ipfs=None, rng=None):
+        if q_mode not in (None, "per_node", "shared"):
+            raise ValueError(f"Unknown q_mode: {q_mode}")
+        self.rng = rng if rng is not None else random
+        self.q_store = None
+        self.ipfs = ipfs
+        self.knowledge_store = KnowledgeStore()
+        if q_mode is not None:
+            self.q_store = QTensor(node_count, ["normal"], TASK_ACTIONS, shared=q_mode == "shared",
+                                   seed=rng.getrandbits(64) if rng is not None else None)
         self.nodes = [
-            SwarmNode(i, role=random.choice(["worker", "explorer", "coordinator"]))
+            SwarmNode(
+                i,
+                role=self.rng.choice(["worker", "explorer", "coordinator"]),
+                rl_agent=ReinforcementLearningAgent(self.q_store, i, self.rng) if self.q_store is not None else None,
+                ipfs=ipfs,
+                rng=self.rng,
+                knowledge=self.knowledge_store.view(),
+            )
             for i in range(node_count)
         ]
+        self.active = IndexedSet(node_count, range(node_count))
+        self.inactive = IndexedSet(node_count)
+        for node in self.nodes:
+            node.swarm = self
 
     def simulate(self, iterations):
         """Simulate swarm activity with interactions and tasks."""
         for _ in range(iterations):
             print("\n--- Iteration ---")
-            for node in self.nodes:
-                if node.role != "inactive":
-                    node.perform_task()
-                else:
-                    if random.random() < 0.2:  # 20% chance of recovery
-                        node.recover()
+            if self.q_store is not None:
+                self.perform_tasks()
+            else:
+                for i in self.active.items:
+                    self.nodes[i].perform_task()
+
+            # Each inactive node has a 20% chance of recovery
+            self.recover_nodes(self.inactive.bernoulli(0.2, self.rng))
 
             # Randomly fail a node
-            if random.random() < 0.2:  # 20% chance of failure
-                random.choice(self.nodes).fail()
+            if self.rng.random() < 0.2:  # 20% chance of failure
+                self.rng.choice(self.nodes).fail()
 
             # Random node interactions
-            active_nodes = [node for node in self.nodes if node.role != "inactive"]
-            if len(active_nodes) > 1:
-                node1, node2 = random.sample(active_nodes, 2)
-                node1.interact(node2)
+            if len(self.active) > 1:
+                first, second = self.active.sample(2, self.rng)
+                self.nodes[first].interact(self.nodes[second])
+
+    def node_failed(self, node):
+        self.active.remove(node.id)
+        self.inactive.add(node.id)
+
+    def node_recovered(self, node):
+        self.inactive.remove(node.id)
+        self.active.add(node.id)
+
+    def fail_nodes(self, positions):
+        """Fail the nodes at `positions` as one batch."""
+        for i in positions:
+            self.nodes[i].fail()
+
+    def recover_nodes(self, positions):
+        """Recover the nodes at `positions` as one batch."""
+        for i in positions:
+            self.nodes[i].recover()
+
+    @property
+    def active_count(self):
+        return len(self.active)
+
+    @property
+    def inactive_count(self):
+        return len(self.inactive)
+
+    def perform_tasks(self):
+        """Run perform_task for every active node with one Q-tensor selection and update."""
+        positions = list(self.active.items)
+        if not positions:
+            return
+        actions = self.q_store.choose_actions("normal", positions)
+        for i, action in zip(positions, actions.tolist()):
+            self.nodes[i].act(TASK_ACTIONS[action])
+        rewards = [self.rng.randint(0, 10) for _ in positions]  # Random reward for simplicity
+        self.q_store.update("normal", actions, rewards, "normal", nodes=positions)
+
+    def send_decentralized_messages(self, messages):
+        """
+        Publish {node_id: message} to IPFS in one batched request.
+
+        Returns {node_id: hash}, or None if the upload failed.
+        """
+        ipfs = self.ipfs if self.ipfs is not None else shared_transport()
+        node_ids = list(messages)
+        print(f"Swarm sending {len(node_ids)} node messages to IPFS...")
+        hashes = ipfs.send_messages([messages[node_id] for node_id in node_ids])
+        if hashes is None:
+            return None
+        return dict(zip(node_ids, hashes))
 
 
 # Example usage
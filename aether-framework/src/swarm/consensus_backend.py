@@ -0,0 +1,270 @@
+import heapq
+import threading
+import time
+from src.utils.config_loader import ConfigLoader
+
+
+class ConsensusBackend:
+    """
+    Swarm decision-making as used by AIAgent: propose tasks, vote on them,
+    and find proposals whose votes reached consensus_threshold.
+
+    Proposal ids are consecutive ints. Consensus results are dicts of
+    {"proposal_id": str, "task": str}. A proposal and its votes are kept for
+    proposal_ttl seconds; a vote for an unknown proposal starts a new tally.
+    """
+
+    def propose_task(self, task_description):
+        raise NotImplementedError("Consensus backends must implement propose_task.")
+
+    def propose_many(self, task_descriptions, batch_size=1000):
+        raise NotImplementedError("Consensus backends must implement propose_many.")
+
+    def vote(self, proposal_id):
+        raise NotImplementedError("Consensus backends must implement vote.")
+
+    def vote_many(self, proposal_ids, batch_size=1000):
+        raise NotImplementedError("Consensus backends must implement vote_many.")
+
+    def get_consensus(self):
+        raise NotImplementedError("Consensus backends must implement get_consensus.")
+
+    def wait_for_consensus(self, proposal_id=None, timeout=None):
+        raise NotImplementedError("Consensus backends must implement wait_for_consensus.")
+
+
+class InMemoryConsensusStore:
+    """
+    Proposals and tallies shared by every InMemoryConsensus of one process.
+
+    Proposals are spread over `stripes` dicts, each behind its own lock, so
+    agents voting on different proposals rarely contend. Expiry times sit in
+    a heap swept at most once per sweep_interval seconds, by whichever
+    proposal or vote finds a sweep due; expired entries are ignored by reads
+    until then. Proposals at the threshold
+    sit in a second heap ordered like Redis's swarm:consensus set, with a
+    condition variable that wakes waiters when one is added.
+    """
+
+    def __init__(self, stripes=64, sweep_interval=1.0):
+        self.stripes = [{} for _ in range(stripes)]  # str(proposal_id) -> [task, votes, expires_at]
+        self.locks = [threading.Lock() for _ in range(stripes)]
+        self.counter = 0
+        self.counter_lock = threading.Lock()
+        self.expiry = []  # (expires_at, proposal_id)
+        self.expiry_lock = threading.Lock()
+        self.sweep_interval = sweep_interval
+        self.next_sweep = 0.0
+        self.reached = []  # (expires_at, proposal_id)
+        self.reached_changed = threading.Condition()
+
+    def stripe(self, proposal_id):
+        index = hash(proposal_id) % len(self.stripes)
+        return self.stripes[index], self.locks[index]
+
+    def __len__(self):
+        return sum(len(stripe) for stripe in self.stripes)
+
+    def reserve(self, count):
+        """Reserve `count` consecutive proposal ids; returns the first."""
+        with self.counter_lock:
+            self.counter += count
+            return self.counter - count + 1
+
+    def track(self, proposal_id, expires_at):
+        with self.expiry_lock:
+            heapq.heappush(self.expiry, (expires_at, proposal_id))
+
+    def sweep(self, now):
+        """Drop proposals whose time is up, if a sweep is due and no other thread is sweeping."""
+        if now < self.next_sweep or not self.expiry_lock.acquire(blocking=False):
+            return
+        try:
+            self.next_sweep = now + self.sweep_interval
+            while self.expiry and self.expiry[0][0] <= now:
+                expires_at, proposal_id = heapq.heappop(self.expiry)
+                stripe, lock = self.stripe(proposal_id)
+                with lock:
+                    entry = stripe.get(proposal_id)
+                    if entry is not None and entry[2] <= now:
+                        del stripe[proposal_id]
+        finally:
+            self.expiry_lock.release()
+
+    def live_reached(self, now):
+        """The earliest-expiring live proposal at the threshold, or None; call with reached_changed held."""
+        while self.reached and self.reached[0][0] <= now:
+            heapq.heappop(self.reached)
+        return self.reached[0][1] if self.reached else None
+
+
+_store = None
+_store_lock = threading.Lock()
+
+def shared_store():
+    """Return the process-wide in-memory store, creating it on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = InMemoryConsensusStore()
+    return _store
+
+
+class InMemoryConsensus(ConsensusBackend):
+    """
+    SwarmConsensus semantics for swarms that live in one process.
+
+    Agents share an InMemoryConsensusStore (the process-wide one by default)
+    instead of a Redis server, so proposing and voting are dict updates
+    under a striped lock rather than network round-trips.
+    """
+
+    def __init__(self, agent_id, consensus_threshold=None, proposal_ttl=None, store=None):
+        self.agent_id = agent_id
+        self.store = store if store is not None else shared_store()
+        if consensus_threshold is None or proposal_ttl is None:
+            config = ConfigLoader()
+            if consensus_threshold is None:
+                consensus_threshold = config.get("swarm.consensus_threshold", 3)
+            if proposal_ttl is None:
+                proposal_ttl = config.get("swarm.proposal_ttl", 86400)
+        self.consensus_threshold = int(consensus_threshold)
+        self.proposal_ttl = int(proposal_ttl)
+
+    def _create(self, proposal_ids, task_descriptions):
+        now = time.time()
+        self.store.sweep(now)
+        expires_at = int(now) + self.proposal_ttl
+        for proposal_id, task_description in zip(proposal_ids, task_descriptions):
+            key = str(proposal_id)
+            stripe, lock = self.store.stripe(key)
+            with lock:
+                stripe[key] = [task_description, 0, expires_at]
+            self.store.track(key, expires_at)
+
+    def _cast(self, proposal_id, now):
+        """Add one vote; returns (count, expires_at)."""
+        key = str(proposal_id)
+        stripe, lock = self.store.stripe(key)
+        with lock:
+            entry = stripe.get(key)
+            created = entry is None or entry[2] <= now
+            if created:
+                entry = stripe[key] = [None, 0, int(now) + self.proposal_ttl]
+            entry[1] += 1
+            count, expires_at = entry[1], entry[2]
+        if created:
+            self.store.track(key, expires_at)  # After releasing the stripe, as sweep() locks in the other order
+        return count, expires_at
+
+    def _announce(self, reached):
+        """Record (proposal_id, expires_at) pairs that just reached the threshold and wake waiters."""
+        if reached:
+            with self.store.reached_changed:
+                for proposal_id, expires_at in reached:
+                    heapq.heappush(self.store.reached, (expires_at, str(proposal_id)))
+                self.store.reached_changed.notify_all()
+
+    def _task(self, proposal_id):
+        stripe, lock = self.store.stripe(proposal_id)
+        with lock:
+            entry = stripe.get(proposal_id)
+            return None if entry is None else entry[0]
+
+    def propose_task(self, task_description):
+        """Propose a task to the swarm."""
+        proposal_id = self.store.reserve(1)
+        self._create([proposal_id], [task_description])
+        print(f"Agent {self.agent_id} proposed task {proposal_id}: {task_description}")
+        return proposal_id
+
+    def propose_many(self, task_descriptions, batch_size=1000):
+        """Propose many tasks at once; returns their proposal ids in order."""
+        task_descriptions = list(task_descriptions)
+        if not task_descriptions:
+            return []
+        first_id = self.store.reserve(len(task_descriptions))
+        proposal_ids = list(range(first_id, first_id + len(task_descriptions)))
+        self._create(proposal_ids, task_descriptions)
+        print(f"Agent {self.agent_id} proposed {len(proposal_ids)} tasks ({first_id}..{proposal_ids[-1]})")
+        return proposal_ids
+
+    def vote(self, proposal_id):
+        """Vote for a proposed task; returns its vote count after this vote."""
+        now = time.time()
+        self.store.sweep(now)
+        count, expires_at = self._cast(proposal_id, now)
+        if count == self.consensus_threshold:
+            self._announce([(proposal_id, expires_at)])
+        print(f"Agent {self.agent_id} voted for task {proposal_id}")
+        return count
+
+    def vote_many(self, proposal_ids, batch_size=1000):
+        """Cast one vote per item of `proposal_ids`; returns each item's vote count after its vote."""
+        now = time.time()
+        self.store.sweep(now)
+        counts, reached = [], []
+        for proposal_id in proposal_ids:
+            count, expires_at = self._cast(proposal_id, now)
+            counts.append(count)
+            if count == self.consensus_threshold:
+                reached.append((proposal_id, expires_at))
+        self._announce(reached)
+        print(f"Agent {self.agent_id} cast {len(counts)} votes")
+        return counts
+
+    def _reached(self, proposal_id=None):
+        now = time.time()
+        if proposal_id is None:
+            return self.store.live_reached(now)
+        key = str(proposal_id)
+        stripe, lock = self.store.stripe(key)
+        with lock:
+            entry = stripe.get(key)
+            return key if entry is not None and entry[2] > now and entry[1] >= self.consensus_threshold else None
+
+    def get_consensus(self):
+        """Check if consensus has been reached on any task."""
+        with self.store.reached_changed:
+            proposal_id = self._reached()
+        if proposal_id is not None:
+            task = self._task(proposal_id)
+            print(f"Consensus reached for task {proposal_id}: {task}")
+            return {"proposal_id": proposal_id, "task": task}
+        print("No consensus reached.")
+        return None
+
+    def wait_for_consensus(self, proposal_id=None, timeout=None):
+        """Block until a proposal (any, or `proposal_id`) reaches consensus; None after `timeout` seconds."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.store.reached_changed:
+            reached = self._reached(proposal_id)
+            while reached is None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    print("No consensus reached.")
+                    return None
+                self.store.reached_changed.wait(remaining)
+                reached = self._reached(proposal_id)
+        task = self._task(reached)
+        print(f"Consensus reached for task {reached}: {task}")
+        return {"proposal_id": reached, "task": task}
+
+
+def create_consensus(agent_id, backend=None, **kwargs):
+    """
+    Build the consensus backend named by `backend`, or by swarm.consensus_backend in config.yaml.
+
+    "redis" (the default) gives a SwarmConsensus, "memory" an
+    InMemoryConsensus; kwargs go to the backend's constructor.
+    """
+    if backend is None:
+        backend = ConfigLoader().get("swarm.consensus_backend", "redis")
+    if backend == "memory":
+        return InMemoryConsensus(agent_id, **kwargs)
+    if backend == "redis":
+        from src.swarm.swarm_consensus import SwarmConsensus
+
+        return SwarmConsensus(agent_id, **kwargs)
+    raise ValueError(f"Unknown consensus backend: {backend}")
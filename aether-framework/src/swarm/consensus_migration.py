@@ -0,0 +1,76 @@
+"""
+Move SwarmConsensus data from the global hashes into per-proposal keys.
+
+Run from the aether-framework directory:
+
+    python -m src.swarm.consensus_migration                   # swarm.redis from config.yaml
+    python -m src.swarm.consensus_migration --host redis-1 --port 6379 --keep
+
+Reads the legacy swarm_proposals hash and its counter, plus vote tallies
+from the swarm_votes hash and the swarm_vote_tally sorted set. Both tally
+keys are summed, since either may hold votes. Each proposal is written as
+a swarm:proposal:{id} hash with a fresh proposal_ttl. Proposals already at
+the threshold are recorded in swarm:consensus, and the new counter is
+raised past the old one. The legacy keys are deleted unless --keep is
+given. Votes for proposals that no longer exist are dropped and counted.
+"""
+import argparse
+import time
+from src.swarm.swarm_consensus import SwarmConsensus
+
+LEGACY_PROPOSALS = "swarm_proposals"
+LEGACY_COUNTER = "swarm_proposals:counter"
+LEGACY_VOTES = "swarm_votes"
+LEGACY_TALLY = "swarm_vote_tally"
+
+
+def migrate(consensus, batch_size=1000, keep=False):
+    """Migrate the legacy keys `consensus.redis_client` can see; returns counts of what moved."""
+    client = consensus.redis_client
+    votes = {}
+    for proposal_id, count in client.hscan_iter(LEGACY_VOTES):
+        votes[str(proposal_id)] = votes.get(str(proposal_id), 0) + int(count)
+    for proposal_id, count in client.zscan_iter(LEGACY_TALLY):
+        votes[str(proposal_id)] = votes.get(str(proposal_id), 0) + int(count)
+
+    expires_at = int(time.time()) + consensus.proposal_ttl
+    moved = reached = 0
+    with client.pipeline(transaction=False) as pipe:
+        for proposal_id, task in client.hscan_iter(LEGACY_PROPOSALS, count=batch_size):
+            count = votes.pop(str(proposal_id), 0)
+            key = consensus.proposal_key(proposal_id)
+            pipe.hset(key, mapping={"task": task, "votes": count, "expires_at": expires_at})
+            pipe.expireat(key, expires_at)
+            if count >= consensus.consensus_threshold:
+                pipe.zadd(consensus.reached_key, {proposal_id: expires_at})
+                reached += 1
+            moved += 1
+            if moved % batch_size == 0:
+                pipe.execute()
+        pipe.execute()
+
+    legacy_counter = int(client.get(LEGACY_COUNTER) or 0)
+    if legacy_counter > int(client.get(consensus.counter_key) or 0):
+        client.set(consensus.counter_key, legacy_counter)
+    if not keep:
+        client.delete(LEGACY_PROPOSALS, LEGACY_COUNTER, LEGACY_VOTES, LEGACY_TALLY)
+    return {"proposals": moved, "reached": reached, "orphan_votes": sum(votes.values())}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", help="Redis host (default: swarm.redis.host)")
+    parser.add_argument("--port", type=int, help="Redis port (default: swarm.redis.port)")
+    parser.add_argument("--ttl", type=int, help="Seconds migrated proposals live (default: swarm.proposal_ttl)")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--keep", action="store_true", help="Leave the legacy keys in place")
+    args = parser.parse_args(argv)
+
+    consensus = SwarmConsensus("migration", redis_host=args.host, redis_port=args.port, proposal_ttl=args.ttl)
+    result = migrate(consensus, batch_size=args.batch_size, keep=args.keep)
+    print(f"Migrated {result['proposals']} proposals ({result['reached']} at consensus); "
+          f"dropped {result['orphan_votes']} votes for missing proposals.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import numpy as np
+from scipy import sparse
+
+
+class GossipEngine:
+    """
+    Batched pairwise averaging over a NumPy state vector.
+
+    Each step draws a random matching of disjoint node pairs and applies all
+    of its interactions at once as a sparse averaging matrix. This replaces
+    one SwarmNode.interact call per Swarm.simulate iteration with a single
+    sparse product per step.
+
+    With no graph, any two nodes may interact (Swarm.simulate's uniform
+    random pairs). Otherwise pairs come from the graph's edges, given as an
+    (m, 2) edge array or a scipy.sparse adjacency matrix (see also
+    from_csr). symmetric=True sets both nodes of a pair to their mean, which
+    keeps the swarm mean. symmetric=False updates only the first node, like
+    SwarmNode.interact.
+    """
+
+    def __init__(self, states, graph=None, symmetric=True, seed=None, rng=None):
+        self.states = np.array(states, dtype=float)
+        self.symmetric = symmetric
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+        self.edges = None if graph is None else self._edge_array(graph, len(self.states))
+        if self.edges is not None:
+            # Edge ids grouped by endpoint, so per-node minima are one reduceat per step
+            endpoints = self.edges.ravel()
+            order = np.argsort(endpoints, kind="stable")
+            self._incidence = order // 2
+            degree = np.bincount(endpoints, minlength=len(self.states))
+            self._touched = np.flatnonzero(degree)
+            self._starts = (np.cumsum(degree) - degree)[self._touched]
+            self._heads, self._tails = np.ascontiguousarray(self.edges.T)
+        self.steps = 0
+        self.interactions = 0
+        self.variance_history = []
+
+    @staticmethod
+    def _edge_array(graph, node_count):
+        if sparse.issparse(graph):
+            graph = sparse.coo_matrix(graph)
+            edges = np.column_stack([graph.row, graph.col])
+        else:
+            edges = np.asarray(graph, dtype=np.int64).reshape(-1, 2)
+        if len(edges) and (edges.min() < 0 or edges.max() >= node_count):
+            raise ValueError("Graph edges must reference nodes 0..node_count-1")
+        edges = np.sort(edges[edges[:, 0] != edges[:, 1]], axis=1)  # Drop self-loops
+        keys = np.unique(edges[:, 0] * node_count + edges[:, 1])  # Drop duplicates and reverse edges
+        return np.column_stack([keys // node_count, keys % node_count])
+
+    @classmethod
+    def from_csr(cls, states, indptr, indices, **kwargs):
+        """Build an engine over a CSR adjacency such as a lattice's CSRPropagationEngine."""
+        sources = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+        return cls(states, np.column_stack([sources, indices]), **kwargs)
+
+    @classmethod
+    def from_swarm(cls, swarm, graph=None, **kwargs):
+        """Start from the states of a swarm_behavior.Swarm's nodes, in node order."""
+        return cls([node.state for node in swarm.nodes], graph, **kwargs)
+
+    def write_back(self, swarm):
+        """Copy the engine's states onto the swarm's nodes."""
+        for node, state in zip(swarm.nodes, self.states.tolist()):
+            node.state = state
+
+    def __len__(self):
+        return len(self.states)
+
+    @property
+    def variance(self):
+        return float(self.states.var()) if len(self.states) else 0.0
+
+    def sample_pairs(self, max_pairs=None):
+        """
+        Return a (k, 2) array of disjoint node pairs in random order.
+
+        Uniform mode pairs up a random permutation of the nodes. Graph mode
+        gives every edge a random priority and keeps the edges that have the
+        lowest priority at both endpoints, a random matching found in one
+        vectorized pass over the edges.
+        """
+        if self.edges is None:
+            count = len(self.states) // 2 if max_pairs is None else min(max_pairs, len(self.states) // 2)
+            return self.rng.permutation(len(self.states))[:2 * count].reshape(-1, 2)
+        edge_count = len(self.edges)
+        if not edge_count:
+            return self.edges
+        priority = self.rng.permutation(edge_count)
+        lowest = np.full(len(self.states), edge_count)
+        lowest[self._touched] = np.minimum.reduceat(priority[self._incidence], self._starts)
+        kept = (lowest[self._heads] == priority) & (lowest[self._tails] == priority)
+        matched = self.edges[kept]
+        matched = matched[np.argsort(priority[kept])]  # Random pair order
+        flip = self.rng.random(len(matched)) < 0.5  # Random first node, for asymmetric updates
+        matched[flip] = matched[flip, ::-1]
+        return matched if max_pairs is None else matched[:max_pairs]
+
+    def averaging_matrix(self, pairs):
+        """
+        Sparse row-stochastic matrix applying every pair's averaging at once.
+
+        Every row holds two entries of 0.5. An updated node i has (i, partner).
+        A node left unchanged has (i, i), which CSR products sum back to 1.
+        """
+        node_count = len(self.states)
+        partner = np.arange(node_count)
+        if len(pairs):
+            partner[pairs[:, 0]] = pairs[:, 1]
+            if self.symmetric:
+                partner[pairs[:, 1]] = pairs[:, 0]
+        indices = np.column_stack([np.arange(node_count), partner]).ravel()
+        indptr = np.arange(0, 2 * node_count + 1, 2)
+        return sparse.csr_matrix((np.full(2 * node_count, 0.5), indices, indptr), shape=(node_count, node_count))
+
+    def step(self, max_pairs=None):
+        """Apply one round of disjoint pairwise interactions; returns the number of pairs."""
+        pairs = self.sample_pairs(max_pairs)
+        self.states = self.averaging_matrix(pairs) @ self.states
+        self.steps += 1
+        self.interactions += len(pairs)
+        return len(pairs)
+
+    def run(self, max_steps, tolerance=1e-6, check_every=1, max_pairs=None):
+        """
+        Step until the state variance falls to `tolerance` or max_steps is reached.
+
+        The variance is checked every `check_every` steps and recorded in
+        variance_history. Returns the number of steps run.
+        """
+        for done in range(max_steps):
+            if done % check_every == 0:
+                variance = self.variance
+                self.variance_history.append(variance)
+                if variance <= tolerance:
+                    return done
+            self.step(max_pairs)
+        return max_steps
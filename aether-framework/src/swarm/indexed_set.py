@@ -0,0 +1,70 @@
+import math
+
+
+class IndexedSet:
+    """
+    A set of integers 0..capacity-1 with O(1) add, remove and random choice.
+
+    Members are packed at the front of `items` and `positions[i]` is the
+    slot of member i (or -1). Removing a member moves the last one into its
+    slot, so `items` never has holes and can be sampled directly.
+    """
+
+    def __init__(self, capacity, members=()):
+        self.items = []
+        self.positions = [-1] * capacity
+        for member in members:
+            self.add(member)
+
+    def add(self, member):
+        if self.positions[member] >= 0:
+            return False
+        self.positions[member] = len(self.items)
+        self.items.append(member)
+        return True
+
+    def remove(self, member):
+        slot = self.positions[member]
+        if slot < 0:
+            return False
+        last = self.items.pop()
+        if last != member:
+            self.items[slot] = last
+            self.positions[last] = slot
+        self.positions[member] = -1
+        return True
+
+    def __contains__(self, member):
+        return 0 <= member < len(self.positions) and self.positions[member] >= 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def choice(self, rng):
+        return self.items[int(rng.random() * len(self.items))]
+
+    def sample(self, count, rng):
+        return rng.sample(self.items, count)
+
+    def bernoulli(self, probability, rng):
+        """
+        Members each picked independently with `probability`.
+
+        Gaps between picks are drawn from the geometric distribution, so the
+        cost is proportional to the number picked, not to the set size.
+        """
+        if probability <= 0 or not self.items:
+            return []
+        if probability >= 1:
+            return list(self.items)
+        log_miss = math.log(1.0 - probability)
+        picked = []
+        slot = -1
+        while True:
+            slot += 1 + int(math.log(1.0 - rng.random()) / log_miss)
+            if slot >= len(self.items):
+                return picked
+            picked.append(self.items[slot])
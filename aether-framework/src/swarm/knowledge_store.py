@@ -0,0 +1,282 @@
+import weakref
+from collections.abc import MutableMapping
+import numpy as np
+
+DELETED = object()  # Value of a tombstone entry, written when a key is removed
+
+
+class KnowledgeEntry:
+    """One write: `key` set to `value` (DELETED for a removal) at global time `stamp` by a writer."""
+    __slots__ = ("stamp", "key", "value", "__weakref__")
+
+    def __init__(self, stamp, key, value):
+        self.stamp = stamp
+        self.key = key
+        self.value = value
+
+
+class KnowledgeStore:
+    """
+    Shared, versioned home of the knowledge held by a swarm's nodes.
+
+    Every write is an immutable KnowledgeEntry appended to its writer's log
+    under a per-writer sequence number and a global stamp. Logs hold weak
+    references only: an entry lives as long as some KnowledgeView holds it,
+    so memory tracks the unique knowledge the swarm still has rather than
+    one copy per node.
+
+    Each view writes as one writer. When a view is garbage collected its
+    writer is retired, and once every live view has seen the writer's last
+    entry it is dropped from the logs and from all version vectors. Views
+    created after a drop compare full contents on their first merge from a
+    view that has seen it (see KnowledgeView.merge).
+    """
+
+    def __init__(self):
+        self.logs = {}  # writer -> {seq: weakref to entry}
+        self.heads = {}  # writer -> entries written
+        self.views = weakref.WeakValueDictionary()  # writer -> live view
+        self.retired = {}  # writer -> writers of the live views still behind on its entries
+        self.generation = 0  # Writers with entries dropped so far
+        self.clock = 0
+        self._writers = 0
+
+    def new_writer(self, view):
+        self._writers += 1
+        writer = self._writers
+        self.logs[writer] = {}
+        self.heads[writer] = 0
+        self.views[writer] = view
+        for behind in self.retired.values():
+            behind.add(writer)
+        weakref.finalize(view, self._retire, writer)
+        return writer
+
+    def append(self, writer, seq, key, value):
+        self.clock += 1
+        entry = KnowledgeEntry(self.clock, key, value)
+        log = self.logs[writer]
+        log[seq] = weakref.ref(entry, lambda ref, log=log, seq=seq: log.pop(seq, None))
+        self.heads[writer] = seq + 1
+        return entry
+
+    def _retire(self, writer):
+        """A view was collected: drop its writer once the live views have all seen its entries."""
+        for other, behind in list(self.retired.items()):
+            behind.discard(writer)
+            if not behind:
+                self._drop(other)
+        final = self.heads[writer]
+        behind = {other for other, view in self.views.items() if other != writer and view.seen(writer) < final}
+        if behind:
+            self.retired[writer] = behind
+        else:
+            self._drop(writer)
+
+    def caught_up(self, view):
+        """Note that `view` may have seen the last entries of retired writers."""
+        for writer, behind in list(self.retired.items()):
+            if view.writer in behind and view.seen(writer) >= self.heads[writer]:
+                behind.discard(view.writer)
+                if not behind:
+                    self._drop(writer)
+
+    def _drop(self, writer):
+        self.retired.pop(writer, None)
+        del self.logs[writer]
+        if self.heads.pop(writer):
+            self.generation += 1
+            for view in self.views.values():
+                view._forget(writer, self.generation)
+
+    def entries(self, writer, start, stop):
+        """Live entries of `writer` with sequence numbers in [start, stop)."""
+        log = self.logs.get(writer)
+        if log:
+            for seq in range(start, stop):
+                ref = log.get(seq)
+                entry = ref() if ref is not None else None
+                if entry is not None:
+                    yield entry
+
+    def view(self):
+        return KnowledgeView(self)
+
+    def live_entries(self):
+        return sum(len(log) for log in self.logs.values())
+
+
+class KnowledgeView(MutableMapping):
+    """
+    A node's knowledge: a dict-like view onto a KnowledgeStore.
+
+    The view maps keys to entries through a base dict, which is never
+    modified and may be shared with other views, and a private overlay that
+    takes new writes and merged entries. The overlay is folded into a fresh
+    base once it outgrows the base, so compaction is amortized O(1) per write
+    and views keep sharing a base for as long as possible. A sparse version
+    vector (sorted writer ids and counts, plus the view's own write count)
+    records how many of each writer's entries the view has seen.
+
+    update() from another view of the same store compares the two vectors
+    and only visits the writer log ranges this view is behind on, keeping for
+    each key the most recently written entry. When the other view has seen
+    everything this one has, its base is adopted as is and only its overlay
+    is copied.
+
+    Removing a key writes a tombstone entry (value DELETED) that stays in
+    the index, so merges cannot bring back an older value of the key.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._base = {}
+        self._overlay = {}
+        self._added = 0  # Overlay keys missing from the base
+        self._deleted = 0  # Keys whose current entry is a tombstone
+        self._writers = np.zeros(0, dtype=np.int64)  # Other writers seen, sorted
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._written = 0  # Entries written by this view's own writer
+        self._generation = 0  # store.generation as of the dropped writers this view has seen
+        self.writer = store.new_writer(self)
+
+    def _vector(self):
+        """(writers, counts) of the full version vector, own writer included."""
+        if not self._written:
+            return self._writers, self._counts
+        slot = np.searchsorted(self._writers, self.writer)
+        return np.insert(self._writers, slot, self.writer), np.insert(self._counts, slot, self._written)
+
+    def _entry(self, key):
+        entry = self._overlay.get(key)
+        return entry if entry is not None else self._base.get(key)
+
+    def seen(self, writer):
+        """Number of `writer`'s entries this view has seen."""
+        if writer == self.writer:
+            return self._written
+        slot = int(np.searchsorted(self._writers, writer))
+        return int(self._counts[slot]) if slot < len(self._writers) and self._writers[slot] == writer else 0
+
+    def _forget(self, writer, generation):
+        """Drop a writer every live view has seen all of from the version vector."""
+        keep = self._writers != writer
+        self._writers, self._counts = self._writers[keep], self._counts[keep]
+        self._generation = generation
+
+    def _put(self, key, entry):
+        current = self._entry(key)
+        if current is None:
+            self._added += 1
+        self._deleted += (entry.value is DELETED) - (current is not None and current.value is DELETED)
+        self._overlay[key] = entry
+        if len(self._overlay) > 16 and len(self._overlay) > len(self._base):
+            self._base = {**self._base, **self._overlay}
+            self._overlay = {}
+            self._added = 0
+
+    @property
+    def version(self):
+        writers, counts = self._vector()
+        return dict(zip(writers.tolist(), counts.tolist()))
+
+    def __getitem__(self, key):
+        entry = self._entry(key)
+        if entry is None or entry.value is DELETED:
+            raise KeyError(key)
+        return entry.value
+
+    def __setitem__(self, key, value):
+        self._put(key, self.store.append(self.writer, self._written, key, value))
+        self._written += 1
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self[key] = DELETED
+
+    def _keys(self):
+        """Every indexed key, tombstones included."""
+        yield from self._base
+        for key in self._overlay:
+            if key not in self._base:
+                yield key
+
+    def __iter__(self):
+        for key in self._keys():
+            if self._entry(key).value is not DELETED:
+                yield key
+
+    def __len__(self):
+        return len(self._base) + self._added - self._deleted
+
+    def __contains__(self, key):
+        entry = self._entry(key)
+        return entry is not None and entry.value is not DELETED
+
+    def __repr__(self):
+        return f"KnowledgeView({dict(self.items())})"
+
+    def clear(self):
+        """Remove every key, leaving tombstones that merges spread to the other views."""
+        index = {**self._base, **self._overlay}
+        for key in list(self):
+            index[key] = self.store.append(self.writer, self._written, key, DELETED)
+            self._written += 1
+        # A fresh base lets the removed values go at once
+        self._base, self._overlay, self._added, self._deleted = index, {}, 0, len(index)
+
+    def update(self, other=(), **kwargs):
+        if isinstance(other, KnowledgeView) and other.store is self.store:
+            self.merge(other)
+        else:
+            super().update(other, **kwargs)
+
+    def merge(self, other):
+        """Add the entries `other` holds that this view has not seen; returns how many were taken."""
+        theirs, seen = other._vector()
+        own = theirs == self.writer
+        seen_of_mine = int(seen[own].sum())
+        if seen_of_mine:  # This view always knows its own writes
+            theirs, seen = theirs[~own], seen[~own]
+        mine, have = self._writers, self._counts
+        slot = np.minimum(np.searchsorted(mine, theirs), max(len(mine) - 1, 0))
+        known = np.where(mine[slot] == theirs, have[slot], 0) if len(mine) else np.zeros_like(seen)
+        behind = np.flatnonzero(seen > known)
+        stale = other._generation > self._generation  # `other` has seen entries of writers since dropped
+        if not len(behind) and not stale:
+            return 0
+        slot = np.minimum(np.searchsorted(theirs, mine), max(len(theirs) - 1, 0))
+        covered = (theirs[slot] == mine) & (seen[slot] >= have) if len(theirs) else np.zeros(len(mine), bool)
+        if covered.all() and seen_of_mine >= self._written:
+            # `other` has seen every write this view has, so its knowledge is the merge
+            taken = len(other) - len(self)
+            self._base, self._overlay, self._added = other._base, dict(other._overlay), other._added
+            self._deleted, self._generation = other._deleted, other._generation
+            self._writers, self._counts = theirs, seen
+            self.store.caught_up(self)
+            return taken
+        taken = 0
+        if stale or int((seen[behind] - known[behind]).sum()) > len(other):
+            # Further behind than `other` is large: comparing all of its entries is cheaper
+            candidates = [other._entry(key) for key in other._keys()]
+        else:
+            # Keeping the newest entry per key makes the log ranges merge to what `other` holds
+            candidates = (entry for writer, start, stop in zip(theirs[behind].tolist(), known[behind].tolist(),
+                                                               seen[behind].tolist())
+                          for entry in self.store.entries(writer, start, stop))
+        for entry in candidates:
+            current = self._entry(entry.key)
+            if current is None or current.stamp < entry.stamp:
+                self._put(entry.key, entry)
+                taken += 1
+        writers = np.concatenate([mine, theirs])
+        counts = np.concatenate([have, seen])
+        order = np.lexsort((-counts, writers))  # By writer, highest count first
+        writers, counts = writers[order], counts[order]
+        first = np.ones(len(writers), bool)
+        first[1:] = writers[1:] != writers[:-1]
+        self._writers, self._counts = writers[first], counts[first]
+        self._generation = max(self._generation, other._generation)
+        self.store.caught_up(self)
+        return taken
@@ -1,4 +1,5 @@
 import random
+import numpy as np
 
 class NegotiationAgent:
     """
@@ -28,6 +29,32 @@ class NegotiationAgent:
         print(f"Agent {self.agent_id} evaluated task {task['id']} with score {score:.2f}.")
         return score
 
+    @staticmethod
+    def score_tasks(agents, tasks):
+        """
+        Score every agent against every task at once.
+
+        Returns an (agents, tasks) array holding what evaluate_task would
+        return for each pair: 0 where the agent lacks the capability or the
+        resources, else priority - resource_cost / resource_capacity.
+        """
+        types = {}
+        task_types = np.array([types.setdefault(task["type"], len(types)) for task in tasks], dtype=np.int64)
+        capable = np.zeros((len(agents), len(types) + 1), dtype=bool)
+        for row, agent in enumerate(agents):
+            capable[row, [types[kind] for kind in agent.capabilities if kind in types]] = True
+        capacity = np.array([agent.resource_capacity for agent in agents], dtype=float)[:, None]
+        cost = np.array([task["resource_cost"] for task in tasks], dtype=float)
+        priority = np.array([task["priority"] for task in tasks], dtype=float)
+        # Built task-major so each task's column of bids is contiguous
+        infeasible = ~capable.T[task_types]
+        infeasible |= capacity.T < cost[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = cost[:, None] / capacity.T
+        np.subtract(priority[:, None], scores, out=scores)
+        scores[infeasible] = 0.0
+        return scores.T
+
     def bid_for_task(self, task, marketplace):
         """
         Submit a bid for a task to the marketplace.
@@ -0,0 +1,170 @@
+import contextlib
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+# Per-model metric totals. They add across node partitions; means are derived afterwards.
+AGENT_TOTALS = ("nodes", "active", "energy", "tasks_completed", "knowledge", "state")
+MODEL_TOTALS = {
+    "swarm": ("nodes", "state", "state_squared"),
+    "advanced": AGENT_TOTALS,
+    "vectorized": AGENT_TOTALS,
+}
+# Fewest nodes a model can simulate; swarm_behavior.Swarm pairs nodes up every step.
+MIN_NODES = {
+    "swarm": 2,
+    "advanced": 1,
+    "vectorized": 1,
+}
+# derived metric -> (numerator total, denominator total)
+MEANS = {
+    "mean_state": ("state", "nodes"),
+    "mean_energy": ("energy", "nodes"),
+    "mean_knowledge": ("knowledge", "nodes"),
+}
+
+
+def _python_rng(seed_sequence):
+    """random.Random seeded from a SeedSequence, for the object models."""
+    return random.Random(seed_sequence.generate_state(4).tobytes())
+
+
+def _simulate_swarm(node_count, iterations, seed_sequence, params):
+    from src.swarm.swarm_behavior import Swarm
+
+    swarm = Swarm(node_count, rng=_python_rng(seed_sequence), **params)
+    swarm.simulate(iterations)
+    states = np.array([node.state for node in swarm.nodes])
+    return {"nodes": len(states), "state": states.sum(), "state_squared": np.square(states).sum()}
+
+
+def _simulate_advanced(node_count, iterations, seed_sequence, params):
+    from src.swarm.advanced_swarm_behavior import Swarm
+
+    swarm = Swarm(node_count, rng=_python_rng(seed_sequence), **params)
+    swarm.simulate(iterations)
+    nodes = swarm.nodes
+    return {
+        "nodes": len(nodes),
+        "active": sum(node.role != "inactive" for node in nodes),
+        "energy": sum(node.energy for node in nodes),
+        "tasks_completed": sum(node.tasks_completed for node in nodes),
+        "knowledge": sum(len(node.knowledge) for node in nodes),
+        "state": sum(node.state for node in nodes),
+    }
+
+
+def _simulate_vectorized(node_count, iterations, seed_sequence, params):
+    from src.swarm.vectorized_swarm import VectorizedSwarm
+
+    swarm = VectorizedSwarm(node_count, rng=np.random.default_rng(seed_sequence), **params)
+    swarm.simulate(iterations)
+    metrics = swarm.metrics()
+    return {
+        "nodes": len(swarm),
+        "active": metrics["active"],
+        "energy": int(swarm.energy.sum()),
+        "tasks_completed": metrics["tasks_completed"],
+        "knowledge": int(swarm.knowledge_size.sum()),
+        "state": float(swarm.state.sum()),
+    }
+
+
+SIMULATORS = {
+    "swarm": _simulate_swarm,
+    "advanced": _simulate_advanced,
+    "vectorized": _simulate_vectorized,
+}
+
+
+def _run_chunk(model, tasks, iterations, params):
+    """Worker entry point: simulate (node_count, seed_sequence) tasks and return their totals."""
+    simulate = SIMULATORS[model]
+    totals = []
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for node_count, seed_sequence in tasks:
+            result = simulate(node_count, iterations, seed_sequence, params)
+            totals.append([result[name] for name in MODEL_TOTALS[model]])
+    return totals
+
+
+def partition_sizes(node_count, partitions):
+    """Split node_count into `partitions` near-equal sizes, larger ones first."""
+    base, extra = divmod(node_count, partitions)
+    return [base + (index < extra) for index in range(partitions)]
+
+
+def run_replicas(model, replicas, node_count, iterations, seed=0, workers=None, partitions=1,
+                 chunk_size=None, **params):
+    """
+    Run independent Monte Carlo replicas of a swarm model over a process pool.
+
+    model is "swarm" (swarm_behavior.Swarm), "advanced"
+    (advanced_swarm_behavior.Swarm) or "vectorized" (VectorizedSwarm); extra
+    keyword arguments go to its constructor. With partitions > 1 each
+    replica's nodes are split into that many independent sub-swarms that
+    never interact, and their totals are summed; every partition must hold at
+    least the model's MIN_NODES.
+
+    SeedSequence(seed) spawns one child per replica and each replica one per
+    partition, so every unit of work owns its random stream and the results
+    for a seed are identical whatever `workers` and `chunk_size` are.
+    workers=1 runs in this process; None uses os.cpu_count().
+
+    Returns {"totals": {name: array}, "metrics": {name: array}, "mean": {...},
+    "std": {...}} with one array entry per replica, plus the run settings.
+    """
+    if model not in SIMULATORS:
+        raise ValueError(f"Unknown model: {model}")
+    if partitions < 1:
+        raise ValueError(f"partitions must be at least 1, got {partitions}")
+    if node_count // partitions < MIN_NODES[model]:
+        raise ValueError(f"The {model} model needs at least {MIN_NODES[model]} nodes per partition; "
+                         f"{node_count} nodes cannot be split into {partitions} partitions")
+    sizes = partition_sizes(node_count, partitions)
+    tasks = [(size, stream)
+             for replica in np.random.SeedSequence(seed).spawn(replicas)
+             for size, stream in zip(sizes, replica.spawn(partitions))]
+
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, -(-len(tasks) // (workers * 4)))
+    chunks = [tasks[start:start + chunk_size] for start in range(0, len(tasks), chunk_size)]
+    if workers == 1:
+        results = [_run_chunk(model, chunk, iterations, params) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_chunk, [model] * len(chunks), chunks,
+                                    [iterations] * len(chunks), [params] * len(chunks)))
+
+    names = MODEL_TOTALS[model]
+    per_task = np.array([row for chunk in results for row in chunk], dtype=float).reshape(-1, len(names))
+    per_replica = per_task.reshape(replicas, partitions, len(names)).sum(axis=1)
+    totals = {name: per_replica[:, index] for index, name in enumerate(names)}
+
+    metrics = dict(totals)
+    for name, (numerator, denominator) in MEANS.items():
+        if numerator in totals:
+            metrics[name] = totals[numerator] / np.maximum(totals[denominator], 1)
+    if "state_squared" in totals:
+        metrics["state_variance"] = totals["state_squared"] / np.maximum(totals["nodes"], 1) - metrics["mean_state"] ** 2
+
+    return {
+        "model": model,
+        "replicas": replicas,
+        "node_count": node_count,
+        "iterations": iterations,
+        "partitions": partitions,
+        "seed": seed,
+        "totals": totals,
+        "metrics": metrics,
+        "mean": {name: float(values.mean()) for name, values in metrics.items()},
+        "std": {name: float(values.std(ddof=1)) if replicas > 1 else 0.0 for name, values in metrics.items()},
+    }
+
+
+# Example usage
+if __name__ == "__main__":
+    summary = run_replicas("vectorized", replicas=1000, node_count=1000, iterations=20, seed=42)
+    for name, mean in summary["mean"].items():
+        print(f"{name}: {mean:.3f} +/- {summary['std'][name]:.3f}")
@@ -1,25 +1,44 @@
 import random
+from src.swarm.gossip_engine import GossipEngine
 
 class SwarmNode:
     """A single node in an AI swarm."""
-    def __init__(self, id):
+    def __init__(self, id, rng=random):
         self.id = id
-        self.state = random.random()
+        self.state = rng.random()
 
     def interact(self, other_node):
         """Simulate interaction between nodes."""
         self.state = (self.state + other_node.state) / 2
 
 class Swarm:
-    """A collection of swarm nodes."""
-    def __init__(self, node_count):
-        self.nodes = [SwarmNode(i) for i in range(node_count)]
+    """
+    A collection of swarm nodes.
+
+    Random draws come from `rng` (a random.Random), or the global random
+    module when none is given.
+    """
+    def __init__(self, node_count, rng=None):
+        self.rng = rng if rng is not None else random
+        self.nodes = [SwarmNode(i, self.rng) for i in range(node_count)]
 
     def simulate(self, iterations):
         for _ in range(iterations):
-            node1, node2 = random.sample(self.nodes, 2)
+            node1, node2 = self.rng.sample(self.nodes, 2)
             node1.interact(node2)
 
+    def gossip(self, max_steps, tolerance=1e-6, graph=None, seed=None):
+        """
+        Average node states with a GossipEngine until their variance is within tolerance.
+
+        Each step applies a whole random matching of pairwise averages; graph
+        restricts pairs to its edges. Returns the number of steps taken.
+        """
+        engine = GossipEngine.from_swarm(self, graph, seed=seed)
+        steps = engine.run(max_steps, tolerance)
+        engine.write_back(self)
+        return steps
+
 # Example usage
 if __name__ == "__main__":
     swarm = Swarm(10)
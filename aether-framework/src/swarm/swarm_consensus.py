@@ -1,84 +1,251 @@
-import redis
+import time
+from src.swarm.consensus_backend import ConsensusBackend
+from src.utils.config_loader import ConfigLoader
+from src.utils.redis_registry import register_script, shared_registry
 
+register_script("swarm_consensus.create", """
+redis.call('HSET', KEYS[1], 'task', ARGV[1], 'votes', 0, 'expires_at', ARGV[2])
+redis.call('EXPIREAT', KEYS[1], ARGV[2])
+return 1
+""")
 
-class SwarmConsensus:
+register_script("swarm_consensus.reached", """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', '(' .. ARGV[1])
+return redis.call('ZRANGEBYSCORE', KEYS[1], ARGV[1], '+inf')
+""")
+
+
+class SwarmConsensus(ConsensusBackend):
     """Handles swarm-based decision-making for small and large swarms using Redis.
-    
-    Note: 
+
+    Note:
     - For small swarms, basic methods are sufficient.
     - For larger swarms or more complex data operations, use Lua scripts or Redis transactions for better performance and atomicity.
+
+    Every proposal is one hash, swarm:proposal:{id}, holding its task, vote
+    count and expiry time, and expiring proposal_ttl seconds after it is
+    proposed (swarm.proposal_ttl in config.yaml by default). The {id} hash
+    tag keeps a proposal's keys in one Redis Cluster slot while different
+    proposals spread across shards. The vote that brings a proposal to
+    consensus_threshold (swarm.consensus_threshold by default) adds it to the
+    swarm:consensus sorted set, scored by expiry so expired entries are
+    pruned, and publishes its id on consensus_channel; wait_for_consensus
+    blocks on that channel.
     """
 
-    def __init__(self, agent_id, redis_host="localhost", redis_port=6379):
+    def __init__(self, agent_id, redis_host=None, redis_port=None, redis_client=None, consensus_threshold=None,
+                 proposal_ttl=None):
         self.agent_id = agent_id
-        self.redis_client = redis.StrictRedis(host=redis_host, port=redis_port, decode_responses=True)
-        self.proposals_key = "swarm_proposals"
-        self.votes_key = "swarm_votes"
+        self.registry = shared_registry()
+        if redis_client is None:
+            redis_client = self.registry.client(redis_host, redis_port)
+        self.redis_client = redis_client
+        if consensus_threshold is None or proposal_ttl is None:
+            config = ConfigLoader()
+            if consensus_threshold is None:
+                consensus_threshold = config.get("swarm.consensus_threshold", 3)
+            if proposal_ttl is None:
+                proposal_ttl = config.get("swarm.proposal_ttl", 86400)
+        self.consensus_threshold = int(consensus_threshold)
+        self.proposal_ttl = int(proposal_ttl)
+        self.counter_key = "swarm:proposals:counter"
+        self.reached_key = "swarm:consensus"  # Sorted set: proposal_id -> expires_at, for proposals at the threshold
+        self.consensus_channel = "swarm_consensus"
+
+    def proposal_key(self, proposal_id):
+        return f"swarm:proposal:{{{proposal_id}}}"
+
+    def _create(self, pipe, proposal_id, task_description, expires_at):
+        key = self.proposal_key(proposal_id)
+        pipe.hset(key, mapping={"task": task_description, "votes": 0, "expires_at": expires_at})
+        pipe.expireat(key, expires_at)
+
+    def _cast(self, pipe, proposal_id):
+        key = self.proposal_key(proposal_id)
+        pipe.hincrby(key, "votes", 1)
+        pipe.ttl(key)
+
+    def _counted(self, proposal_ids, replies):
+        """
+        Vote counts from the replies of _cast, in order.
+
+        A vote for an unknown proposal creates its hash without a TTL (-1);
+        those keys get proposal_ttl here so they never stay forever. This
+        stands in for EXPIRE NX, which needs Redis 7.
+        """
+        created = {proposal_id for proposal_id, ttl in zip(proposal_ids, replies[1::2]) if ttl == -1}
+        if created:
+            with self.redis_client.pipeline(transaction=False) as pipe:
+                for proposal_id in created:
+                    pipe.expire(self.proposal_key(proposal_id), self.proposal_ttl)
+                pipe.execute()
+        return replies[::2]
 
     # Basic Methods for Small Swarms
     def propose_task(self, task_description):
         """Propose a task to the swarm."""
-        proposal_id = self.redis_client.incr(f"{self.proposals_key}:counter")
-        self.redis_client.hset(self.proposals_key, proposal_id, task_description)
+        proposal_id = self.redis_client.incr(self.counter_key)
+        with self.redis_client.pipeline() as pipe:  # MULTI, so the hash never exists without its TTL
+            self._create(pipe, proposal_id, task_description, int(time.time()) + self.proposal_ttl)
+            pipe.execute()
         print(f"Agent {self.agent_id} proposed task {proposal_id}: {task_description}")
         return proposal_id
 
     def vote(self, proposal_id):
-        """Vote for a proposed task."""
-        self.redis_client.hincrby(self.votes_key, proposal_id, 1)
+        """Vote for a proposed task; returns its vote count after this vote."""
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            self._cast(pipe, proposal_id)
+            count = self._counted([proposal_id], pipe.execute())[0]
+        self._announce([(proposal_id, count)])
         print(f"Agent {self.agent_id} voted for task {proposal_id}")
+        return count
+
+    def _announce(self, tallies):
+        """Record and publish the proposals whose (proposal_id, count) shows this vote reached the threshold."""
+        # Votes add one at a time, so exactly one vote lands on the threshold
+        reached = [proposal_id for proposal_id, count in tallies if count == self.consensus_threshold]
+        if not reached:
+            return
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            for proposal_id in reached:
+                pipe.hget(self.proposal_key(proposal_id), "expires_at")
+            now = int(time.time())
+            expiry = [int(expires_at or now + self.proposal_ttl) for expires_at in pipe.execute()]
+            pipe.zadd(self.reached_key, dict(zip(reached, expiry)))
+            pipe.zremrangebyscore(self.reached_key, "-inf", f"({now}")
+            for proposal_id in reached:
+                pipe.publish(self.consensus_channel, proposal_id)
+            pipe.execute()
+
+    def _reached(self, proposal_id=None):
+        """A live proposal at the threshold (`proposal_id`'s, if given), or None."""
+        if proposal_id is not None:
+            votes = self.redis_client.hget(self.proposal_key(proposal_id), "votes")
+            return str(proposal_id) if votes is not None and int(votes) >= self.consensus_threshold else None
+        reached = self.redis_client.zrangebyscore(self.reached_key, int(time.time()), "+inf", start=0, num=1)
+        return reached[0] if reached else None
+
+    # Bulk Methods for Large Swarms
+    def propose_many(self, task_descriptions, batch_size=1000):
+        """
+        Propose many tasks at once; returns their proposal ids in order.
+
+        The ids are reserved with a single INCRBY on the counter, and each
+        batch of proposals is written in one pipelined round-trip, so n
+        proposals cost 1 + ceil(n / batch_size) round-trips.
+        """
+        task_descriptions = list(task_descriptions)
+        if not task_descriptions:
+            return []
+        last_id = self.redis_client.incrby(self.counter_key, len(task_descriptions))
+        first_id = last_id - len(task_descriptions) + 1
+        proposal_ids = list(range(first_id, last_id + 1))
+        expires_at = int(time.time()) + self.proposal_ttl
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            for start in range(0, len(proposal_ids), batch_size):
+                for i in range(start, min(start + batch_size, len(proposal_ids))):
+                    self._create(pipe, proposal_ids[i], task_descriptions[i], expires_at)
+                pipe.execute()
+        print(f"Agent {self.agent_id} proposed {len(proposal_ids)} tasks ({first_id}..{last_id})")
+        return proposal_ids
+
+    def vote_many(self, proposal_ids, batch_size=1000):
+        """
+        Cast one vote per item of `proposal_ids`; returns each item's vote count after its vote.
+
+        Votes are sent as pipelined HINCRBYs, one round-trip per batch_size
+        votes plus one if any vote was for an unknown proposal. A proposal may
+        appear more than once.
+        """
+        proposal_ids = list(proposal_ids)
+        replies = []
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            for start in range(0, len(proposal_ids), batch_size):
+                for proposal_id in proposal_ids[start:start + batch_size]:
+                    self._cast(pipe, proposal_id)
+                replies.extend(pipe.execute())
+        counts = self._counted(proposal_ids, replies)
+        self._announce(zip(proposal_ids, counts))
+        print(f"Agent {self.agent_id} cast {len(counts)} votes")
+        return counts
 
     def get_consensus(self):
-        """Check if consensus has been reached on any task (small swarms only)."""
-        votes = self.redis_client.hgetall(self.votes_key)
-        for proposal_id, vote_count in votes.items():
-            if int(vote_count) > 2:  # Example threshold for consensus
-                task = self.redis_client.hget(self.proposals_key, proposal_id)
-                print(f"Consensus reached for task {proposal_id}: {task}")
-                return {"proposal_id": proposal_id, "task": task}
+        """Check if consensus has been reached on any task."""
+        proposal_id = self._reached()
+        if proposal_id is not None:
+            task = self.redis_client.hget(self.proposal_key(proposal_id), "task")
+            print(f"Consensus reached for task {proposal_id}: {task}")
+            return {"proposal_id": proposal_id, "task": task}
         print("No consensus reached.")
         return None
 
+    def wait_for_consensus(self, proposal_id=None, timeout=None):
+        """
+        Block until a proposal (any, or `proposal_id`) reaches consensus.
+
+        Returns the same dict as get_consensus, or None after `timeout`
+        seconds. The channel is subscribed before the tally is checked, so a
+        threshold crossed in between is not missed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(self.consensus_channel)
+            reached = self._reached(proposal_id)
+            while reached is None:
+                remaining = 1.0 if deadline is None else deadline - time.monotonic()
+                if remaining <= 0:
+                    print("No consensus reached.")
+                    return None
+                message = pubsub.get_message(timeout=min(remaining, 1.0))
+                if message and (proposal_id is None or str(message["data"]) == str(proposal_id)):
+                    reached = message["data"]
+        finally:
+            pubsub.close()
+        task = self.redis_client.hget(self.proposal_key(reached), "task")
+        print(f"Consensus reached for task {reached}: {task}")
+        return {"proposal_id": reached, "task": task}
+
     # Advanced Methods for Larger Swarms
     def propose_task_with_lua(self, task_description):
         """Propose a task using a Lua script (recommended for larger swarms)."""
-        lua_script = """
-        local proposal_id = redis.call('INCR', KEYS[1])
-        redis.call('HSET', KEYS[2], proposal_id, ARGV[1])
-        return proposal_id
-        """
-        script = self.redis_client.register_script(lua_script)
-        proposal_id = script(keys=[f"{self.proposals_key}:counter", self.proposals_key], args=[task_description])
+        proposal_id = self.redis_client.incr(self.counter_key)
+        self.registry.run_script(self.redis_client, "swarm_consensus.create", keys=[self.proposal_key(proposal_id)],
+                                 args=[task_description, int(time.time()) + self.proposal_ttl])
         print(f"Agent {self.agent_id} proposed task with Lua {proposal_id}: {task_description}")
         return proposal_id
 
     def vote_with_transaction(self, proposal_id):
         """Vote for a proposal using Redis transactions."""
+        # HINCRBY is atomic on its own, so MULTI/EXEC needs no WATCH or read-back
         with self.redis_client.pipeline() as pipe:
-            pipe.watch(self.votes_key)
-            current_votes = int(self.redis_client.hget(self.votes_key, proposal_id) or 0)
-            pipe.multi()
-            pipe.hincrby(self.votes_key, proposal_id, 1)
-            pipe.execute()
+            self._cast(pipe, proposal_id)
+            count = self._counted([proposal_id], pipe.execute())[0]
+        self._announce([(proposal_id, count)])
         print(f"Agent {self.agent_id} voted for task {proposal_id} using a transaction.")
+        return count
+
+    def get_consensus_with_lua(self, threshold=None):
+        """
+        Check for consensus using a Lua script (for larger swarms).
 
-    def get_consensus_with_lua(self, threshold=3):
-        """Check for consensus using a Lua script (for larger swarms)."""
-        lua_script = """
-        local results = {}
-        for proposal_id, vote_count in pairs(redis.call('HGETALL', KEYS[1])) do
-            if tonumber(vote_count) >= tonumber(ARGV[1]) then
-                table.insert(results, proposal_id)
-                table.insert(results, redis.call('HGET', KEYS[2], proposal_id))
-            end
-        end
-        return results
+        The script prunes and reads swarm:consensus, which only records
+        proposals that reached consensus_threshold, so `threshold` can raise
+        the bar but not lower it.
         """
-        script = self.redis_client.register_script(lua_script)
-        result = script(keys=[self.votes_key, self.proposals_key], args=[threshold])
-        consensus = [{"proposal_id": result[i], "task": result[i + 1]} for i in range(0, len(result), 2)]
+        if threshold is None:
+            threshold = self.consensus_threshold
+        reached = self.registry.run_script(self.redis_client, "swarm_consensus.reached",
+                                           keys=[self.reached_key], args=[int(time.time())])
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            for proposal_id in reached:
+                pipe.hmget(self.proposal_key(proposal_id), "task", "votes")
+            details = pipe.execute()
+        consensus = [{"proposal_id": proposal_id, "task": task}
+                     for proposal_id, (task, votes) in zip(reached, details)
+                     if votes is not None and int(votes) >= threshold]
         if consensus:
             print(f"Consensus reached: {consensus}")
         else:
             print("No consensus reached.")
-        return consensus
\ No newline at end of file
+        return consensus
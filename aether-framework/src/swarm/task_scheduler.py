@@ -1,21 +1,114 @@
+import heapq
+import itertools
+
+
 class TaskScheduler:
-    """Dynamic task scheduling for swarm nodes."""
-    def __init__(self):
-        self.tasks = []
+    """
+    Dynamic task scheduling for swarm nodes.
+
+    Tasks wait in one priority heap per node id. A task's effective priority
+    is `priority + aging_rate * (clock - added_at)`, where the clock counts
+    assignment rounds, so long-waiting tasks overtake newer urgent ones.
+    Ranking by that value is the same at every clock reading as ranking by
+    `priority - aging_rate * added_at`, so aging never needs a re-heapify.
+    Cancelled tasks stay in their heap and are skipped when they surface.
+    """
+
+    def __init__(self, aging_rate=0.0):
+        self.aging_rate = aging_rate
+        self.clock = 0
+        self.queues = {}  # node_id -> heap of (key, task_id); ids increase, so ties go oldest first
+        self.entries = {}  # task_id -> (node_id, task, priority, added_at)
+        self._ids = itertools.count()
+
+    def __len__(self):
+        return len(self.entries)
 
     def add_task(self, node_id, task, priority):
-        """Add a task with a specific priority."""
-        self.tasks.append({"node_id": node_id, "task": task, "priority": priority})
-        self.tasks = sorted(self.tasks, key=lambda x: x["priority"], reverse=True)
+        """Add a task with a specific priority; returns its task id."""
+        task_id = next(self._ids)
+        self.entries[task_id] = (node_id, task, priority, self.clock)
+        key = -(priority - self.aging_rate * self.clock)  # Highest aged priority first, then oldest
+        heapq.heappush(self.queues.setdefault(node_id, []), (key, task_id))
+        return task_id
+
+    def cancel(self, task_id):
+        """Drop a queued task; returns False if it was not queued."""
+        return self.entries.pop(task_id, None) is not None
+
+    def cancel_node(self, node_id):
+        """Drop every task queued for a node; returns how many were dropped."""
+        queue = self.queues.pop(node_id, [])
+        return sum(self.entries.pop(task_id, None) is not None for _, task_id in queue)
+
+    def effective_priority(self, task_id):
+        node_id, task, priority, added_at = self.entries[task_id]
+        return priority + self.aging_rate * (self.clock - added_at)
+
+    def _head(self, node_id):
+        """Key of the node's best live task, popping cancelled ones; None if it has none."""
+        queue = self.queues.get(node_id)
+        while queue and queue[0][1] not in self.entries:
+            heapq.heappop(queue)
+        if not queue:
+            self.queues.pop(node_id, None)
+            return None
+        return queue[0]
+
+    def peek(self, node_id):
+        """The node's next task as (task_id, task, effective priority), or None."""
+        head = self._head(node_id)
+        if head is None:
+            return None
+        task_id = head[1]
+        return task_id, self.entries[task_id][1], self.effective_priority(task_id)
+
+    @property
+    def tasks(self):
+        """Queued tasks in assignment order, as dicts."""
+        ordered = sorted(item for queue in self.queues.values() for item in queue if item[1] in self.entries)
+        return [{"node_id": self.entries[task_id][0], "task": self.entries[task_id][1],
+                 "priority": self.entries[task_id][2], "task_id": task_id} for _, task_id in ordered]
+
+    def assign_all(self, nodes, per_node=None):
+        """
+        Assign queued tasks to the active nodes among `nodes`, highest effective priority first.
+
+        Each eligible node pulls from its own heap, merged across nodes so
+        tasks run in global priority order. per_node caps how many tasks a
+        node takes this round. Returns the assigned task ids and advances the
+        aging clock by one round.
+        """
+        eligible = {}
+        merge = []
+        for node in nodes:
+            if node.role != "inactive" and node.id in self.queues:
+                head = self._head(node.id)
+                if head is not None:
+                    eligible[node.id] = node
+                    merge.append((head, node.id))
+        heapq.heapify(merge)
+        taken = dict.fromkeys(eligible, 0)
+        assigned = []
+        while merge:
+            (_, task_id), node_id = heapq.heappop(merge)
+            heapq.heappop(self.queues[node_id])
+            _, task, priority, _ = self.entries.pop(task_id)
+            node = eligible[node_id]
+            print(f"Task '{task}' assigned to Node {node.id} with priority {priority}.")
+            node.perform_task()
+            assigned.append(task_id)
+            taken[node_id] += 1
+            if per_node is None or taken[node_id] < per_node:
+                head = self._head(node_id)
+                if head is not None:
+                    heapq.heappush(merge, (head, node_id))
+        self.clock += 1
+        return assigned
 
     def assign_task(self, nodes):
         """Assign tasks to nodes based on priority."""
-        for task in self.tasks[:]:
-            node = next((n for n in nodes if n.id == task["node_id"] and n.role != "inactive"), None)
-            if node:
-                print(f"Task '{task['task']}' assigned to Node {node.id} with priority {task['priority']}.")
-                node.perform_task()
-                self.tasks.remove(task)
+        return self.assign_all(nodes)
 
 # Example usage
 if __name__ == "__main__":
@@ -30,4 +123,4 @@ if __name__ == "__main__":
     scheduler.add_task(2, "Explore environment", priority=2)
 
     # Assign tasks
-    scheduler.assign_task(swarm.nodes)
\ No newline at end of file
+    scheduler.assign_task(swarm.nodes)
@@ -0,0 +1,161 @@
+import numpy as np
+
+ROLES = ("worker", "explorer", "coordinator", "inactive")
+WORKER, EXPLORER, COORDINATOR, INACTIVE = range(len(ROLES))
+ACTIONS = ("explore", "process", "rest")
+EXPLORE, PROCESS, REST = range(len(ACTIONS))
+KNOWLEDGE_KEYS = 101  # explore() records keys 0..100
+KNOWLEDGE_WORDS = -(-KNOWLEDGE_KEYS // 64)
+
+
+def _popcount(words):
+    """Number of set bits per row of a uint64 matrix."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    return np.unpackbits(np.ascontiguousarray(words).view(np.uint8), axis=1).sum(axis=1, dtype=np.int64)
+
+
+class VectorizedSwarm:
+    """
+    Array-backed equivalent of advanced_swarm_behavior.Swarm.
+
+    Node attributes are NumPy columns (role codes, energy, state,
+    tasks_completed, per-node Q-values) and each iteration runs task
+    selection, exploration, processing, rest, recovery, failure and the
+    pairwise interaction as masked vector operations. Random draws follow
+    the same distributions as the object model, so runs are statistically
+    equivalent to it. Knowledge is kept as a bitset of the explore keys
+    (0..100) each node holds; the random values stored under them are not.
+    """
+
+    def __init__(self, node_count, seed=None, rng=None, exploration_rate=0.1,
+                 learning_rate=0.1, discount_factor=0.9, recovery_rate=0.2, failure_rate=0.2):
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+        self.exploration_rate = exploration_rate
+        self.learning_rate = learning_rate
+        self.discount_factor = discount_factor
+        self.recovery_rate = recovery_rate
+        self.failure_rate = failure_rate
+        rng = self.rng
+        self.role = rng.integers(0, 3, node_count, dtype=np.int8)
+        self.state = rng.random(node_count)
+        self.energy = rng.integers(50, 101, node_count, dtype=np.int32)
+        self.tasks_completed = np.zeros(node_count, dtype=np.int32)
+        # Bitset of known keys, word-major: bit k of node i is in knowledge[k >> 6, i]
+        self.knowledge = np.zeros((KNOWLEDGE_WORDS, node_count), dtype=np.uint64)
+        # Q(state="normal", action) per node, stored action-major so each action is a contiguous column
+        self.q_values = np.zeros((len(ACTIONS), node_count))
+        self.iterations = 0
+
+    @classmethod
+    def from_swarm(cls, swarm, seed=None, **kwargs):
+        """Start from the current state of an object-model Swarm's nodes."""
+        nodes = swarm.nodes
+        engine = cls(len(nodes), seed=seed, **kwargs)
+        engine.role[:] = [ROLES.index(node.role) for node in nodes]
+        engine.state[:] = [node.state for node in nodes]
+        engine.energy[:] = [node.energy for node in nodes]
+        engine.tasks_completed[:] = [node.tasks_completed for node in nodes]
+        for i, node in enumerate(nodes):
+            for key in node.knowledge:
+                if isinstance(key, int) and 0 <= key < KNOWLEDGE_KEYS:
+                    engine.knowledge[key >> 6, i] |= np.uint64(1 << (key & 63))
+            q_table = node.rl_agent.q_table
+            engine.q_values[:, i] = [q_table.get(("normal", action), 0) for action in ACTIONS]
+        return engine
+
+    def __len__(self):
+        return len(self.role)
+
+    @property
+    def knowledge_size(self):
+        return _popcount(self.knowledge.T)
+
+    def roles(self):
+        """Role names per node, as the object model stores them."""
+        return np.array(ROLES)[self.role]
+
+    def step(self):
+        """Run one Swarm.simulate iteration over every node."""
+        rng, n = self.rng, len(self.role)
+        inactive = self.role == INACTIVE
+        active = ~inactive
+
+        # perform_task: epsilon-greedy over Q(normal, .); strict > keeps max()'s first-wins ties.
+        q_explore, q_process, q_rest = self.q_values
+        best_q = np.maximum(np.maximum(q_explore, q_process), q_rest)
+        greedy = np.where(q_process > q_explore, PROCESS, EXPLORE).astype(np.int8)
+        greedy[q_rest > np.maximum(q_explore, q_process)] = REST
+        action = np.where(rng.random(n) < self.exploration_rate,
+                          rng.integers(0, len(ACTIONS), n, dtype=np.int8), greedy)
+        taken = [active & (action == code) for code in range(len(ACTIONS))]
+        keys = rng.integers(0, KNOWLEDGE_KEYS, n, dtype=np.uint8)
+        bits = np.left_shift(np.uint64(1), (keys & 63).astype(np.uint64)) * taken[EXPLORE]
+        word = keys >> 6
+        for index, words in enumerate(self.knowledge):
+            words |= bits * (word == index)
+        self.tasks_completed += taken[PROCESS]
+        self.energy[:] = np.where(taken[REST], np.minimum(self.energy + 10, 100), self.energy)
+
+        # Bellman update with reward ~ randint(0, 10) and next state "normal".
+        reward = rng.integers(0, 11, n, dtype=np.int8)
+        current = np.where(action == EXPLORE, q_explore, np.where(action == PROCESS, q_process, q_rest))
+        delta = self.learning_rate * (reward + self.discount_factor * best_q - current)
+        for column, mask in zip(self.q_values, taken):
+            column += delta * mask
+
+        # Inactive nodes recover with a fresh role and energy.
+        recovering = np.flatnonzero(inactive & (rng.random(n) < self.recovery_rate))
+        self.role[recovering] = rng.integers(0, 3, len(recovering), dtype=np.int8)
+        self.energy[recovering] = rng.integers(50, 101, len(recovering))
+
+        if n and rng.random() < self.failure_rate:
+            self.fail(int(rng.integers(n)))
+
+        pair = self._sample_active_pair()
+        if pair is not None:
+            self.interact(*pair)
+        self.iterations += 1
+
+    def simulate(self, iterations):
+        for _ in range(iterations):
+            self.step()
+
+    def fail(self, index):
+        if self.role[index] != INACTIVE:
+            self.role[index] = INACTIVE
+            self.energy[index] = 0
+            self.tasks_completed[index] = 0
+            self.knowledge[:, index] = 0
+
+    def interact(self, first, second):
+        """first interacts with second: workers learn from explorers, states average."""
+        if self.role[first] == WORKER and self.role[second] == EXPLORER:
+            self.knowledge[:, first] |= self.knowledge[:, second]
+        self.state[first] = (self.state[first] + self.state[second]) / 2
+
+    def _sample_active_pair(self):
+        """Two distinct active nodes, like random.sample(active_nodes, 2); None if fewer than two."""
+        role, rng, n = self.role, self.rng, len(self.role)
+        for _ in range(16):  # Rejection sampling is O(1) while most nodes are active
+            first, second = rng.integers(0, n, 2) if n > 1 else (0, 0)
+            if first != second and role[first] != INACTIVE and role[second] != INACTIVE:
+                return int(first), int(second)
+        active = np.flatnonzero(role != INACTIVE)
+        if len(active) < 2:
+            return None
+        first, second = rng.choice(active, 2, replace=False)
+        return int(first), int(second)
+
+    def metrics(self):
+        """Swarm-level summary of the current state."""
+        active = self.role != INACTIVE
+        return {
+            "iterations": self.iterations,
+            "active": int(active.sum()),
+            "role_counts": dict(zip(ROLES, np.bincount(self.role, minlength=len(ROLES)).tolist())),
+            "mean_energy": float(self.energy.mean()) if len(self) else 0.0,
+            "mean_state": float(self.state.mean()) if len(self) else 0.0,
+            "tasks_completed": int(self.tasks_completed.sum()),
+            "mean_knowledge": float(self.knowledge_size.mean()) if len(self) else 0.0,
+        }
@@ -0,0 +1,105 @@
+import threading
+import redis
+from redis.exceptions import NoScriptError
+from src.utils.config_loader import ConfigLoader
+
+SCRIPTS = {}  # name -> Lua source, loaded into every server a registry talks to
+
+
+def register_script(name, source):
+    """Register a Lua script under `name` for RedisRegistry.run_script."""
+    SCRIPTS[name] = source
+
+
+class RedisRegistry:
+    """
+    Process-wide Redis clients and Lua scripts.
+
+    client() hands out one StrictRedis per (host, port, db), each on its own
+    ConnectionPool, so every component talking to the same server shares its
+    connections. Host and port default to swarm.redis in config.yaml.
+    run_script() calls registered scripts by EVALSHA. The first call against
+    a pool loads every registered script with SCRIPT LOAD, and a NoScriptError
+    (after a server restart or SCRIPT FLUSH) reloads them once and retries.
+    """
+
+    def __init__(self, config=None, max_connections=None, **connection_kwargs):
+        config = config if config is not None else ConfigLoader()
+        self.default_host = config.get("swarm.redis.host", "localhost")
+        self.default_port = int(config.get("swarm.redis.port", 6379))
+        self.default_db = int(config.get("swarm.redis.db", 0))
+        self.max_connections = max_connections
+        self.connection_kwargs = connection_kwargs
+        self.clients = {}  # (host, port, db) -> StrictRedis
+        self._loaded = {}  # ConnectionPool -> {script name: sha}
+        self._lock = threading.Lock()
+        self.script_loads = 0
+        self.script_calls = 0
+
+    def client(self, host=None, port=None, db=None):
+        """The shared client for a server, created with its pool on first use."""
+        key = (host or self.default_host, int(port or self.default_port), int(self.default_db if db is None else db))
+        client = self.clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self.clients.get(key)
+                if client is None:
+                    pool = redis.ConnectionPool(host=key[0], port=key[1], db=key[2], decode_responses=True,
+                                                max_connections=self.max_connections, **self.connection_kwargs)
+                    client = self.clients[key] = redis.StrictRedis(connection_pool=pool)
+        return client
+
+    def load_scripts(self, client):
+        """SCRIPT LOAD every registered script into the client's server in one round-trip."""
+        names = list(SCRIPTS)
+        with client.pipeline(transaction=False) as pipe:
+            for name in names:
+                pipe.script_load(SCRIPTS[name])
+            shas = pipe.execute()
+        self._loaded[client.connection_pool] = dict(zip(names, shas))
+        self.script_loads += 1
+        return self._loaded[client.connection_pool]
+
+    def run_script(self, client, name, keys=(), args=()):
+        """EVALSHA the registered script `name` on `client`."""
+        shas = self._loaded.get(client.connection_pool)
+        if shas is None or name not in shas:
+            shas = self.load_scripts(client)
+        self.script_calls += 1
+        try:
+            return client.evalsha(shas[name], len(keys), *keys, *args)
+        except NoScriptError:
+            shas = self.load_scripts(client)
+            return client.evalsha(shas[name], len(keys), *keys, *args)
+
+    def metrics(self):
+        """Connection counts per server as {"host:port/db": {...}}, plus script load and call counts."""
+        pools = {}
+        for (host, port, db), client in self.clients.items():
+            pool = client.connection_pool
+            in_use = len(pool._in_use_connections)
+            pools[f"{host}:{port}/{db}"] = {
+                "created": pool._created_connections,
+                "in_use": in_use,
+                "idle": len(pool._available_connections),
+                "max_connections": self.max_connections,
+                "utilization": in_use / self.max_connections if self.max_connections else None,
+            }
+        return {"pools": pools, "script_loads": self.script_loads, "script_calls": self.script_calls}
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+def shared_registry():
+    """Return the process-wide registry, creating it on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = RedisRegistry()
+    return _registry
+
+def shared_client(host=None, port=None, db=None):
+    """Shortcut for shared_registry().client(host, port, db)."""
+    return shared_registry().client(host, port, db)
@@ -1,12 +1,12 @@
-import redis
 import json
+from src.utils.redis_registry import shared_client
 
 
 class RedisTaskQueue:
     """A distributed task queue using Redis."""
 
-    def __init__(self, redis_host="localhost", redis_port=6379, queue_name="task_queue"):
-        self.redis_client = redis.StrictRedis(host=redis_host, port=redis_port, decode_responses=True)
+    def __init__(self, redis_host=None, redis_port=None, queue_name="task_queue", redis_client=None):
+        self.redis_client = redis_client if redis_client is not None else shared_client(redis_host, redis_port)
         self.queue_name = queue_name
 
     def push_task(self, task):
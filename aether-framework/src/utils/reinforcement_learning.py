@@ -28,4 +28,98 @@ class QLearning:
 
     def decay_exploration(self):
         """Decay the exploration rate."""
-        self.exploration_rate *= self.exploration_decay
\ No newline at end of file
+        self.exploration_rate *= self.exploration_decay
+
+class QTensor:
+    """
+    Q-values for a whole swarm in one tensor indexed by (node, state, action).
+
+    In per-node mode every node learns its own table. With shared=True the
+    nodes share parameters: the tensor has a single node slot and every node
+    reads and writes it. choose_actions and update work on arrays of nodes,
+    so a swarm selects and learns in one call per step. States and actions
+    are given as label sequences and may be passed as labels or indices.
+    """
+
+    def __init__(self, node_count, states, actions, shared=False, learning_rate=0.1,
+                 discount_factor=0.9, exploration_rate=0.1, seed=None, rng=None):
+        self.states = list(states)
+        self.actions = list(actions)
+        self.shared = shared
+        self.node_count = node_count
+        self.learning_rate = learning_rate
+        self.discount_factor = discount_factor
+        self.exploration_rate = exploration_rate
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+        self.values = np.zeros((1 if shared else node_count, len(self.states), len(self.actions)))
+        self._state_ids = {state: i for i, state in enumerate(self.states)}
+        self._action_ids = {action: i for i, action in enumerate(self.actions)}
+
+    def state_index(self, state):
+        return self._state_ids[state] if state in self._state_ids else int(state)
+
+    def action_index(self, action):
+        return self._action_ids[action] if action in self._action_ids else int(action)
+
+    def _slots(self, nodes, count):
+        if self.shared:
+            return np.zeros(count, dtype=np.int64)
+        if nodes is None:
+            return np.arange(self.node_count)
+        return np.asarray(nodes, dtype=np.int64)
+
+    def _state_ids_of(self, states, count):
+        if np.isscalar(states) or isinstance(states, str):
+            return np.full(count, self.state_index(states), dtype=np.int64)
+        return np.array([self.state_index(state) for state in states], dtype=np.int64)
+
+    def rows(self, states, nodes=None):
+        """Q-values of each (node, state) pair as a (len(nodes), n_actions) array."""
+        count = self.node_count if nodes is None else len(nodes)
+        return self.values[self._slots(nodes, count), self._state_ids_of(states, count)]
+
+    def greedy(self, q):
+        """Index of the best action per row; ties go to the first action, like max()."""
+        best = q[:, 0].copy()
+        choice = np.zeros(len(q), dtype=np.int64)
+        for action in range(1, q.shape[1]):
+            better = q[:, action] > best
+            choice[better] = action
+            np.maximum(best, q[:, action], out=best)
+        return choice
+
+    def choose_actions(self, states, nodes=None):
+        """Epsilon-greedy action indices for every node (all nodes if nodes is None)."""
+        q = self.rows(states, nodes)
+        explore = self.rng.random(len(q)) < self.exploration_rate
+        return np.where(explore, self.rng.integers(0, q.shape[1], len(q)), self.greedy(q))
+
+    def update(self, states, actions, rewards, next_states, nodes=None):
+        """
+        Apply the Bellman update to every (node, state, action) at once.
+
+        Targets are computed from the values before the call; in shared mode
+        updates that land on the same (state, action) are averaged, so the
+        step size stays learning_rate however many nodes share the table.
+        """
+        count = self.node_count if nodes is None else len(nodes)
+        slots = self._slots(nodes, count)
+        state_ids = self._state_ids_of(states, count)
+        next_ids = self._state_ids_of(next_states, count)
+        action_ids = np.array([self.action_index(action) for action in actions], dtype=np.int64) \
+            if not isinstance(actions, np.ndarray) else actions.astype(np.int64)
+        current = self.values[slots, state_ids, action_ids]
+        future = self.values[slots, next_ids].max(axis=1)
+        delta = self.learning_rate * (np.asarray(rewards) + self.discount_factor * future - current)
+        if self.shared:
+            cells = state_ids * len(self.actions) + action_ids
+            size = self.values[0].size
+            totals = np.bincount(cells, weights=delta, minlength=size)
+            counts = np.bincount(cells, minlength=size)
+            self.values[0] += (totals / np.maximum(counts, 1)).reshape(self.values[0].shape)
+        else:
+            self.values[slots, state_ids, action_ids] += delta
+        return delta
+
+    def get(self, node, state, action):
+        return float(self.values[0 if self.shared else node, self.state_index(state), self.action_index(action)])
@@ -3,24 +3,86 @@ import sqlite3
 class Storage:
     def __init__(self, db_name="lattice.db"):
         self.conn = sqlite3.connect(db_name)
+        self.saved_seq = {}  # node id -> number of log entries already persisted
         self.create_table()
 
     def create_table(self):
         query = """
+        CREATE TABLE IF NOT EXISTS node_messages (
+            node_id INTEGER,
+            seq INTEGER,
+            timestamp REAL,
+            signal TEXT,
+            PRIMARY KEY (node_id, seq)
+        )
+        """
+        self.conn.execute(query)
+        columns = [column[1] for column in self.conn.execute("PRAGMA table_info(nodes)")]
+        legacy = "message_log" in columns
+        if legacy:
+            self.conn.execute("ALTER TABLE nodes RENAME TO nodes_legacy")
+        elif columns and "log_epoch" not in columns:
+            self.conn.execute("ALTER TABLE nodes ADD COLUMN log_epoch TEXT")
+        query = """
         CREATE TABLE IF NOT EXISTS nodes (
             id INTEGER PRIMARY KEY,
             energy INTEGER,
             evolution_score REAL,
-            message_log TEXT
+            message_count INTEGER,
+            log_epoch TEXT
         )
         """
         self.conn.execute(query)
+        if legacy:
+            self.migrate_message_log()
         self.conn.commit()
 
+    def migrate_message_log(self):
+        """Move the comma-joined message_log column of an older database into node_messages."""
+        rows = self.conn.execute("SELECT id, energy, evolution_score, message_log FROM nodes_legacy").fetchall()
+        for node_id, energy, evolution_score, message_log in rows:
+            signals = message_log.split(",") if message_log else []
+            self.conn.execute(
+                "INSERT INTO nodes (id, energy, evolution_score, message_count) VALUES (?, ?, ?, ?)",
+                (node_id, energy, evolution_score, len(signals)),
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO node_messages (node_id, seq, timestamp, signal) VALUES (?, ?, NULL, ?)",
+                [(node_id, seq, signal) for seq, signal in enumerate(signals)],
+            )
+        self.conn.execute("DROP TABLE nodes_legacy")
+
     def save_node(self, node):
+        """
+        Persist a node's numeric state and the log entries added since the last save.
+
+        The log's epoch is stored with the node. A log with another epoch (a
+        node rebuilt or reloaded, or a log that was cleared) is appended after
+        the persisted messages rather than overwriting them. Entries evicted
+        from the ring before they were saved cannot be written; their number
+        is reported and returned (a table with a spill_path still has them in
+        its spill segment).
+        """
+        log = node.state["message_log"]
+        row = self.conn.execute("SELECT message_count, log_epoch FROM nodes WHERE id = ?", (node.id,)).fetchone()
+        stored, stored_epoch = (row[0] or 0, row[1]) if row else (0, None)
+        held_from = log.seq - len(log)  # Oldest seq still in the ring
+        if stored and log.epoch != stored_epoch:
+            # Another log for this node: continue the persisted history under its new epoch
+            history = self.conn.execute(
+                "SELECT timestamp, signal FROM node_messages WHERE node_id = ? AND seq < ? ORDER BY seq DESC LIMIT ?",
+                (node.id, stored, log.capacity),
+            ).fetchall()
+            lost = held_from
+            log.rebase(stored, history[::-1])
+        else:
+            lost = max(held_from - stored, 0)
+        if lost:
+            print(f"Node {node.id}: {lost} log entries were evicted before they could be saved.")
+
         query = """
-        INSERT OR REPLACE INTO nodes (id, energy, evolution_score, message_log)
-        VALUES (?, ?, ?, ?)
+        INSERT OR REPLACE INTO nodes (id, energy, evolution_score, message_count, log_epoch)
+        VALUES (?, ?, ?, ?, ?)
         """
         self.conn.execute(
             query,
@@ -28,16 +90,28 @@ class Storage:
                 node.id,
                 node.state["energy"],
                 node.state["evolution_score"],
-                ",".join(node.state["message_log"]),
+                log.seq,
+                log.epoch,
             ),
         )
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO node_messages (node_id, seq, timestamp, signal) VALUES (?, ?, ?, ?)",
+            [(node.id, seq, timestamp, signal) for seq, timestamp, signal in log.entries_since(stored)],
+        )
         self.conn.commit()
+        self.saved_seq[node.id] = log.seq
+        return lost
 
     def load_node(self, node_id):
         query = "SELECT * FROM nodes WHERE id = ?"
         cursor = self.conn.execute(query, (node_id,))
         return cursor.fetchone()
 
+    def load_messages(self, node_id):
+        """Return [(seq, timestamp, signal)] persisted for a node, oldest first."""
+        query = "SELECT seq, timestamp, signal FROM node_messages WHERE node_id = ? ORDER BY seq"
+        return self.conn.execute(query, (node_id,)).fetchall()
+
 # Example usage
 if __name__ == "__main__":
     from src.core.node_autonomy import AutonomousNode
@@ -45,4 +119,4 @@ if __name__ == "__main__":
     node = AutonomousNode(0)
     storage = Storage()
     storage.save_node(node)
-    print(storage.load_node(0))
\ No newline at end of file
+    print(storage.load_node(0))
@@ -0,0 +1,20 @@
+import unittest
+from benchmarks.run_benchmarks import build_lattice, compare, run_suite
+
+class TestBenchmarks(unittest.TestCase):
+    def test_topologies_have_expected_edges(self):
+        """Test that the benchmark lattices are wired as rings, chains and meshes."""
+        self.assertEqual(build_lattice("ring", 10).topology.edge_count, 10)
+        self.assertEqual(build_lattice("chain", 10).topology.edge_count, 9)
+        self.assertEqual(build_lattice("mesh", 9).topology.edge_count, 12)
+
+    def test_suite_records_timings_and_flags_regressions(self):
+        """Test that a small sweep produces timings and slower runs are flagged against a baseline."""
+        results = run_suite(["propagate_signal"], [10], repeats=1, report=lambda line: None)
+        self.assertEqual(sorted(results), [f"propagate_signal/{t}/10" for t in ("chain", "mesh", "ring")])
+        baseline = {key: {"seconds": result["seconds"] / 10} for key, result in results.items()}
+        self.assertEqual(len(compare(results, baseline, tolerance=0.25)), 3)
+        self.assertEqual(compare(results, results), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import contextlib
+import io
+import threading
+import unittest
+from src.swarm.consensus_backend import ConsensusBackend, InMemoryConsensus, InMemoryConsensusStore, create_consensus
+from src.swarm.swarm_consensus import SwarmConsensus
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+class ConsensusContract:
+    """Behavior every ConsensusBackend must share; subclasses provide make(agent_id)."""
+
+    def setUp(self):
+        self.output = contextlib.redirect_stdout(io.StringIO())
+        self.output.__enter__()
+
+    def tearDown(self):
+        self.output.__exit__(None, None, None)
+
+    def test_is_a_backend(self):
+        """Test that the backend implements the ConsensusBackend interface."""
+        self.assertIsInstance(self.make("a"), ConsensusBackend)
+
+    def test_proposal_ids_are_consecutive_across_agents(self):
+        """Test that proposals from different agents share one id sequence."""
+        first = self.make("a").propose_task("solo")
+        self.assertEqual(self.make("b").propose_many(["x", "y"]), [first + 1, first + 2])
+        self.assertEqual(self.make("a").propose_many([]), [])
+
+    def test_votes_reach_threshold_once(self):
+        """Test that running counts are returned and consensus is found after the threshold vote."""
+        a, b = self.make("a"), self.make("b")
+        ids = a.propose_many(["first", "second"])
+        self.assertEqual(a.vote(ids[1]), 1)
+        self.assertIsNone(a.get_consensus())
+        self.assertEqual(b.vote_many([ids[1], ids[0], ids[1], ids[1]]), [2, 1, 3, 4])
+        self.assertEqual(a.get_consensus(), {"proposal_id": str(ids[1]), "task": "second"})
+        self.assertEqual(b.vote_many([ids[0]] * 2), [2, 3])
+        self.assertEqual(b.get_consensus()["proposal_id"], str(ids[0]))  # Same expiry, so ordered by id
+
+    def test_vote_for_unknown_proposal_starts_a_tally(self):
+        """Test that votes for a proposal nobody made are counted without a task."""
+        a = self.make("a")
+        self.assertEqual(a.vote_many([999] * 3), [1, 2, 3])
+        self.assertEqual(a.get_consensus(), {"proposal_id": "999", "task": None})
+
+    def test_wait_for_consensus(self):
+        """Test that waiting wakes on another agent's threshold vote, returns at once if reached, and times out."""
+        a, b = self.make("a"), self.make("b")
+        ids = a.propose_many(["first", "second"])
+        self.assertIsNone(a.wait_for_consensus(timeout=0.05))
+        voter = threading.Timer(0.1, b.vote_many, [[ids[0]] * 3])
+        voter.start()
+        self.assertEqual(a.wait_for_consensus(ids[0], timeout=5), {"proposal_id": str(ids[0]), "task": "first"})
+        voter.join()
+        self.assertEqual(a.wait_for_consensus(timeout=0)["task"], "first")
+        self.assertIsNone(a.wait_for_consensus(ids[1], timeout=0.05))
+
+    def test_concurrent_votes_are_all_counted(self):
+        """Test that votes from many threads neither get lost nor cross the threshold twice."""
+        agents = [self.make(i) for i in range(8)]
+        proposal_id = agents[0].propose_task("shared")
+        counts = []
+        threads = [threading.Thread(target=lambda agent=agent: counts.extend(agent.vote_many([proposal_id] * 50)))
+                   for agent in agents]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(counts), list(range(1, 401)))
+
+class TestInMemoryConsensus(ConsensusContract, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.store = InMemoryConsensusStore(stripes=4)
+
+    def make(self, agent_id):
+        return InMemoryConsensus(agent_id, consensus_threshold=3, proposal_ttl=60, store=self.store)
+
+    def test_expired_proposals_are_swept(self):
+        """Test that expired proposals and their consensus disappear, keeping the store bounded."""
+        a = self.make("a")
+        ids = a.propose_many(["old"] * 100)
+        a.vote_many([ids[0]] * 3)
+        for stripe in self.store.stripes:
+            for entry in stripe.values():
+                entry[2] = 0
+        self.store.expiry = [(0, key) for _, key in self.store.expiry]
+        self.store.reached = [(0, key) for _, key in self.store.reached]
+        self.store.next_sweep = 0
+        self.assertIsNone(a.get_consensus())
+        a.propose_task("new")
+        self.assertEqual(len(self.store), 1)
+        self.assertEqual(a.vote(ids[0]), 1)
+
+    def test_votes_do_not_wait_for_the_expiry_lock(self):
+        """Test that voting proceeds while another thread holds the expiry heap, and sweeps are rate limited."""
+        a = self.make("a")
+        proposal_id = a.propose_task("busy")
+        with self.store.expiry_lock:
+            voter = threading.Thread(target=a.vote_many, args=([proposal_id] * 3,))
+            voter.start()
+            voter.join(timeout=5)
+            self.assertFalse(voter.is_alive())
+        self.assertEqual(a.vote(proposal_id), 4)
+        self.assertGreater(self.store.next_sweep, 0)
+
+@unittest.skipIf(fakeredis is None, "fakeredis is not installed")
+class TestRedisConsensus(ConsensusContract, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = fakeredis.FakeStrictRedis(decode_responses=True)
+
+    def make(self, agent_id):
+        return SwarmConsensus(agent_id, redis_client=self.client, consensus_threshold=3, proposal_ttl=60)
+
+class TestCreateConsensus(unittest.TestCase):
+    def test_backend_selection(self):
+        """Test that the factory builds the named backend and rejects unknown ones."""
+        backend = create_consensus("a", backend="memory", consensus_threshold=2, store=InMemoryConsensusStore())
+        self.assertIsInstance(backend, InMemoryConsensus)
+        self.assertEqual(backend.consensus_threshold, 2)
+        if fakeredis is not None:
+            client = fakeredis.FakeStrictRedis(decode_responses=True)
+            self.assertIsInstance(create_consensus("a", backend="redis", redis_client=client), SwarmConsensus)
+        with self.assertRaises(ValueError):
+            create_consensus("a", backend="carrier-pigeon")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import time
+import unittest
+from src.core.event_scheduler import EventScheduler
+from src.core.lattice_engine import LatticeEngine
+from src.core.node_autonomy import AutonomousNode
+
+class TestEventScheduler(unittest.TestCase):
+    def test_events_run_in_virtual_time_order(self):
+        """Test that events run by virtual time, ties in scheduling order, and cancelled ones are skipped."""
+        scheduler = EventScheduler()
+        seen = []
+        scheduler.schedule(2, seen.append, "late")
+        scheduler.schedule(1, seen.append, "first")
+        scheduler.schedule(1, seen.append, "second")
+        cancelled = scheduler.schedule(1.5, seen.append, "cancelled")
+        scheduler.cancel(cancelled)
+        self.assertEqual(scheduler.run(until=1.5), 2)
+        self.assertEqual(scheduler.now, 1.5)
+        scheduler.run()
+        self.assertEqual(seen, ["first", "second", "late"])
+        self.assertEqual(scheduler.now, 2)
+
+    def test_cancel_stops_a_repeating_series(self):
+        """Test that cancelling the handle from every() stops the series, also from inside its callback."""
+        scheduler = EventScheduler()
+        ticks = []
+        series = scheduler.every(1, lambda: ticks.append(scheduler.now))
+        scheduler.run(until=3)
+        scheduler.cancel(series)
+        scheduler.run(until=10)
+        self.assertEqual(ticks, [0, 1, 2, 3])
+        self.assertEqual(scheduler.pending, 0)
+
+        def stop_after_two():
+            ticks.append(scheduler.now)
+            if len(ticks) == 6:
+                scheduler.cancel(own)
+        own = scheduler.every(1, stop_after_two, count=5)
+        self.assertEqual(scheduler.run(), 2)
+        self.assertEqual(ticks[4:], [10, 11])
+
+    def test_fast_forward_skips_wall_time(self):
+        """Test that a long simulation in fast-forward mode does not wait on the wall clock."""
+        lattice = LatticeEngine()
+        nodes = [AutonomousNode(i) for i in range(2)]
+        for node in nodes:
+            lattice.add_node(node)
+        lattice.connect_nodes(nodes[0], nodes[1])
+        scheduler = EventScheduler()
+        started = time.monotonic()
+        lattice.simulate_activity(duration=1000, scheduler=scheduler)
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(scheduler.now, 1000)
+
+    def test_real_time_keeps_pacing(self):
+        """Test that real-time mode waits for virtual time to elapse, scaled by speed."""
+        scheduler = EventScheduler(real_time=True, speed=10)
+        ticks = []
+        scheduler.every(1, lambda: ticks.append(time.monotonic()), count=3)
+        started = time.monotonic()
+        scheduler.run()
+        self.assertEqual(len(ticks), 3)
+        self.assertGreaterEqual(ticks[-1] - started, 0.19)
+
+if __name__ == "__main__":
+    unittest.main()
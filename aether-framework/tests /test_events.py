@@ -0,0 +1,61 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from src.core.events import BufferedEventLog, EnergyDepleted, NodeEvolved, SignalDelivered, hooks
+from src.core.lattice_engine import LatticeEngine
+from src.core.node_autonomy import AutonomousNode
+
+class TestEvents(unittest.TestCase):
+    def setUp(self):
+        """Set up a three node chain and a buffered subscriber."""
+        self.lattice = LatticeEngine()
+        self.nodes = [AutonomousNode(i) for i in range(3)]
+        for node in self.nodes:
+            self.lattice.add_node(node)
+        self.lattice.connect_nodes(self.nodes[0], self.nodes[1])
+        self.lattice.connect_nodes(self.nodes[1], self.nodes[2])
+        self.log = BufferedEventLog()
+
+    def tearDown(self):
+        self.log.detach()
+
+    def test_propagation_publishes_typed_events(self):
+        """Test that propagation publishes delivery, evolution and depletion events."""
+        self.nodes[2].state["energy"] = 10
+        self.lattice.propagate_signal("Ping", start_node_id=0, energy_cost=5)
+        events = self.log.drain()
+        self.assertEqual([e for e in events if e.type == "signal_delivered"],
+                         [SignalDelivered(i, "Ping") for i in range(3)])
+        self.assertIn(NodeEvolved(2, 5, 1), events)
+        self.assertEqual([e for e in events if e.type == "energy_depleted"], [EnergyDepleted(2, 0)])
+
+    def test_batch_publishes_deliveries(self):
+        """Test that batched propagation publishes one event per delivery and per evolved node."""
+        self.lattice.propagate_batch(["A", "B"], [0, 2])
+        events = self.log.drain()
+        self.assertEqual(sum(e.type == "signal_delivered" for e in events), 6)
+        self.assertEqual(sorted(e.node_id for e in events if e.type == "node_evolved"), [0, 1, 2])
+
+    def test_log_is_bounded_by_default(self):
+        """Test that an undrained log keeps only its latest events unless capacity=None."""
+        for i in range(self.log.events.maxlen + 5):
+            self.log(SignalDelivered(i, "Ping"))
+        self.assertEqual(len(self.log.events), 10000)
+        self.assertEqual(self.log.events[0], SignalDelivered(5, "Ping"))
+        unbounded = BufferedEventLog(event_types=(), capacity=None)
+        for i in range(10005):
+            unbounded(SignalDelivered(i, "Ping"))
+        self.assertEqual(len(unbounded.drain()), 10005)
+
+    def test_detached_hooks_are_silent(self):
+        """Test that nothing is printed or collected once subscribers are detached."""
+        self.log.detach()
+        self.assertEqual(hooks.signal_delivered, ())
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.lattice.propagate_signal("Quiet", start_node_id=0)
+        self.assertEqual(output.getvalue(), "")
+        self.assertEqual(self.log.drain(), [])
+
+if __name__ == "__main__":
+    unittest.main()
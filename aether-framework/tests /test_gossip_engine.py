@@ -0,0 +1,40 @@
+import random
+import unittest
+import numpy as np
+from scipy import sparse
+from src.swarm.gossip_engine import GossipEngine
+from src.swarm.swarm_behavior import Swarm
+
+class TestGossipEngine(unittest.TestCase):
+    def test_graph_pairs_are_disjoint_edges(self):
+        """Test that sampled pairs form a matching on the interaction graph."""
+        ring = np.column_stack([np.arange(50), (np.arange(50) + 1) % 50])
+        engine = GossipEngine(np.arange(50), sparse.coo_matrix((np.ones(50), ring.T), shape=(50, 50)), seed=0)
+        edges = {tuple(sorted(edge)) for edge in ring.tolist()}
+        for _ in range(20):
+            pairs = engine.sample_pairs()
+            self.assertEqual(len(np.unique(pairs)), 2 * len(pairs))
+            self.assertTrue(all(tuple(sorted(pair)) in edges for pair in pairs.tolist()))
+            self.assertGreater(len(pairs), 0)
+
+    def test_averaging_matrix_matches_interact(self):
+        """Test that one step equals the pairwise averages it sampled."""
+        states = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+        pairs = np.array([[0, 3], [4, 1]])
+        symmetric = GossipEngine(states).averaging_matrix(pairs) @ states
+        np.testing.assert_allclose(symmetric, [1.5, 2.5, 2.0, 1.5, 2.5])
+        one_sided = GossipEngine(states, symmetric=False).averaging_matrix(pairs) @ states
+        np.testing.assert_allclose(one_sided, [1.5, 1.0, 2.0, 3.0, 2.5])
+
+    def test_swarm_gossip_converges_early(self):
+        """Test that gossip stops once the variance is within tolerance and keeps the mean."""
+        swarm = Swarm(1000, rng=random.Random(0))
+        mean = np.mean([node.state for node in swarm.nodes])
+        steps = swarm.gossip(500, tolerance=1e-8, seed=0)
+        states = np.array([node.state for node in swarm.nodes])
+        self.assertLess(steps, 500)
+        self.assertLessEqual(states.var(), 1e-8)
+        self.assertAlmostEqual(states.mean(), mean)
+
+if __name__ == "__main__":
+    unittest.main()
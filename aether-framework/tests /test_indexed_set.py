@@ -0,0 +1,43 @@
+import contextlib
+import io
+import random
+import unittest
+from src.swarm.advanced_swarm_behavior import Swarm
+from src.swarm.indexed_set import IndexedSet
+
+class TestIndexedSet(unittest.TestCase):
+    def test_swap_remove_keeps_positions(self):
+        """Test that removal fills the gap with the last member and keeps positions current."""
+        members = IndexedSet(6, range(6))
+        self.assertTrue(members.remove(1))
+        self.assertFalse(members.remove(1))
+        self.assertEqual(members.items, [0, 5, 2, 3, 4])
+        self.assertEqual(members.positions[5], 1)
+        self.assertTrue(members.add(1))
+        self.assertNotIn(7, members)
+        self.assertEqual(sorted(members), list(range(6)))
+
+    def test_bernoulli_picks_each_member_at_the_given_rate(self):
+        """Test that geometric skipping picks members with the requested probability."""
+        members = IndexedSet(500, range(500))
+        rng = random.Random(1)
+        picks = [len(members.bernoulli(0.2, rng)) for _ in range(400)]
+        self.assertAlmostEqual(sum(picks) / len(picks), 100, delta=3)
+        self.assertEqual(members.bernoulli(0, rng), [])
+        self.assertEqual(len(members.bernoulli(1, rng)), 500)
+
+    def test_swarm_sets_follow_fail_and_recover(self):
+        """Test that the swarm's active and inactive sets match node roles after simulating."""
+        swarm = Swarm(40, rng=random.Random(2))
+        with contextlib.redirect_stdout(io.StringIO()):
+            swarm.fail_nodes(range(0, 40, 3))
+            swarm.simulate(30)
+            self.assertEqual(set(swarm.inactive), {i for i, node in enumerate(swarm.nodes) if node.role == "inactive"})
+            self.assertEqual(swarm.inactive_count + swarm.active_count, 40)
+            swarm.recover_nodes(list(swarm.inactive))
+        self.assertEqual(swarm.inactive_count, 0)
+        for i, node in enumerate(swarm.nodes):
+            self.assertEqual(i in swarm.active, node.role != "inactive")
+
+if __name__ == "__main__":
+    unittest.main()
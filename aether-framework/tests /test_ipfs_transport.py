@@ -0,0 +1,40 @@
+import contextlib
+import io
+import unittest
+from src.integrations.ifps_communication import IPFSCommunication, shared_transport
+from src.integrations.local_ipfs_server import LocalIPFSServer, content_id
+from src.swarm.advanced_swarm_behavior import Swarm
+
+class TestIPFSTransport(unittest.TestCase):
+    def setUp(self):
+        """Start a local IPFS stand-in and a transport pointed at it."""
+        self.server = LocalIPFSServer().start()
+        self.transport = IPFSCommunication(self.server.api_url)
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.stop()
+
+    def test_batched_publish_returns_hashes_in_order(self):
+        """Test that one multi-file add returns a content ID per message, in order."""
+        messages = [f"message {i}" for i in range(20)] + ["message 3"]
+        with contextlib.redirect_stdout(io.StringIO()):
+            hashes = self.transport.send_messages(messages)
+            self.assertEqual(hashes, [content_id(m.encode()) for m in messages])
+            self.assertEqual(self.transport.retrieve_message(hashes[7]), "message 7")
+            self.assertEqual(self.transport.send_message("single"), content_id(b"single"))
+        self.assertEqual(len(self.server.blocks), 21)
+
+    def test_swarm_nodes_share_one_lazy_transport(self):
+        """Test that nodes share a transport and open no session until they publish."""
+        swarm = Swarm(5, ipfs=self.transport)
+        self.assertIsNone(self.transport._session)
+        self.assertTrue(all(node.ipfs is self.transport for node in swarm.nodes))
+        self.assertIs(Swarm(2).nodes[0].ipfs, shared_transport())
+        with contextlib.redirect_stdout(io.StringIO()):
+            hashes = swarm.send_decentralized_messages({node.id: f"from {node.id}" for node in swarm.nodes})
+            self.assertEqual(swarm.nodes[4].retrieve_decentralized_message(hashes[4]), "from 4")
+        self.assertEqual(list(hashes), [0, 1, 2, 3, 4])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import contextlib
+import gc
+import io
+import random
+import unittest
+from src.swarm.advanced_swarm_behavior import Swarm
+from src.swarm.knowledge_store import DELETED, KnowledgeStore
+
+class TestKnowledgeStore(unittest.TestCase):
+    def test_views_match_last_writer_wins_dicts(self):
+        """Test that writes, merges and clears agree with dicts that keep the newest write or removal per key."""
+        rng = random.Random(4)
+        store = KnowledgeStore()
+        views = [store.view() for _ in range(8)]
+        expected = [{} for _ in range(8)]  # key -> (time, value)
+        for clock in range(3000):
+            i, j = rng.sample(range(8), 2)
+            roll = rng.random()
+            if roll < 0.5:
+                key = rng.randrange(60)
+                views[i][key] = clock
+                expected[i][key] = (clock, clock)
+            elif roll < 0.98:
+                views[i].update(views[j])
+                for key, stamped in expected[j].items():
+                    if key not in expected[i] or expected[i][key][0] < stamped[0]:
+                        expected[i][key] = stamped
+            else:
+                views[i].clear()
+                expected[i] = {key: stamped if stamped[1] is DELETED else (clock, DELETED)
+                               for key, stamped in expected[i].items()}
+        for view, reference in zip(views, expected):
+            self.assertEqual(dict(view), {key: value for key, (_, value) in reference.items() if value is not DELETED})
+
+    def test_merge_transfers_delta_and_frees_replaced_entries(self):
+        """Test that merges adopt or copy only unseen entries and dead entries leave the store."""
+        store = KnowledgeStore()
+        explorer, worker = store.view(), store.view()
+        for key in range(100):
+            explorer[key] = key
+        self.assertEqual(worker.merge(explorer), 100)
+        self.assertIs(worker._base, explorer._base)
+        explorer[5] = "new"
+        worker["own"] = 1
+        self.assertEqual(worker.merge(explorer), 1)
+        self.assertEqual(worker.merge(explorer), 0)
+        self.assertEqual((worker[5], len(worker)), ("new", 101))
+        explorer.clear()
+        worker.clear()
+        explorer.merge(worker)
+        gc.collect()
+        # Only the newest tombstone of each key is left
+        self.assertEqual(store.live_entries(), 101)
+        self.assertEqual((len(explorer), len(worker)), (0, 0))
+
+    def test_removed_keys_stay_removed_after_merges(self):
+        """Test that a merge does not bring back a key removed after the other view saw it."""
+        store = KnowledgeStore()
+        first, second = store.view(), store.view()
+        first["task"] = "route"
+        second.merge(first)
+        del first["task"]
+        first.merge(second)
+        self.assertNotIn("task", first)
+        second.merge(first)
+        self.assertEqual(dict(second), {})
+        second["task"] = "scan"
+        first.merge(second)
+        self.assertEqual(first["task"], "scan")
+
+    def test_fail_recover_cycles_keep_version_vectors_bounded(self):
+        """Test that failing and recovering nodes does not grow the store's writers or version vectors."""
+        swarm = Swarm(4, rng=random.Random(1))
+        store = swarm.knowledge_store
+        with contextlib.redirect_stdout(io.StringIO()):
+            for cycle in range(200):
+                node = swarm.nodes[cycle % 4]
+                node.knowledge[cycle] = cycle
+                node.fail()
+                node.recover()
+                node.interact(swarm.nodes[(cycle + 1) % 4])
+        self.assertEqual(len(store.logs), 4)
+        self.assertTrue(all(len(node.knowledge.version) <= 4 for node in swarm.nodes))
+
+    def test_collected_views_leave_the_store_once_seen(self):
+        """Test that a dropped view's writer is removed after every live view has seen its entries."""
+        store = KnowledgeStore()
+        first, second, leaving = store.view(), store.view(), store.view()
+        for key in range(5):
+            leaving[key] = key
+        first.merge(leaving)
+        writer = leaving.writer
+        del leaving
+        gc.collect()
+        self.assertIn(writer, store.logs)
+        second.merge(first)
+        self.assertNotIn(writer, store.logs)
+        self.assertNotIn(writer, first.version)
+        self.assertNotIn(writer, second.version)
+        second["own"] = 1
+        late = store.view()
+        late["mine"] = 2
+        late.merge(second)
+        self.assertEqual(dict(late), {**{key: key for key in range(5)}, "own": 1, "mine": 2})
+
+    def test_swarm_nodes_share_one_store(self):
+        """Test that swarm nodes keep knowledge in views of the swarm's store."""
+        swarm = Swarm(2, rng=random.Random(0))
+        worker, explorer = swarm.nodes
+        worker.role, explorer.role = "worker", "explorer"
+        with contextlib.redirect_stdout(io.StringIO()):
+            explorer.explore()
+            explorer.receive_message(9, "hello")
+            worker.interact(explorer)
+        self.assertEqual(dict(worker.knowledge), dict(explorer.knowledge))
+        self.assertIs(worker.knowledge.store, swarm.knowledge_store)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,6 @@
 import unittest
+import numpy as np
+from src.core.csr_propagation import CSRPropagationEngine
 from src.core.lattice_engine import LatticeEngine
 from src.core.node_autonomy import AutonomousNode
 
@@ -29,5 +31,98 @@ class TestLatticeEngine(unittest.TestCase):
         node.recharge(20)
         self.assertEqual(node.state["energy"], 120)
 
+    def test_long_ring_propagation(self):
+        """Test that propagation through a long ring does not hit the recursion limit."""
+        lattice = LatticeEngine()
+        ring = [AutonomousNode(i) for i in range(5000)]
+        for node in ring:
+            lattice.add_node(node)
+        for i in range(len(ring)):
+            lattice.connect_nodes(ring[i], ring[(i + 1) % len(ring)])
+        lattice.propagate_signal("Ring Signal", start_node_id=0)
+        self.assertTrue(all(node.state["message_log"] == ["Ring Signal"] for node in ring))
+
+    def test_energy_gating_blocks_propagation(self):
+        """Test that a node without enough energy stops the signal."""
+        self.nodes[1].state["energy"] = 3
+        self.lattice.propagate_signal("Blocked", start_node_id=0)
+        self.assertEqual(self.nodes[0].state["message_log"], ["Blocked"])
+        self.assertEqual(self.nodes[1].state["message_log"], [])
+        self.assertEqual(self.nodes[2].state["message_log"], [])
+
+    def test_batch_matches_single_propagation(self):
+        """Test that a one-signal batch leaves the same state as propagate_signal."""
+        reference = LatticeEngine()
+        reference_nodes = [AutonomousNode(i) for i in range(3)]
+        for node in reference_nodes:
+            reference.add_node(node)
+        reference.connect_nodes(reference_nodes[0], reference_nodes[1])
+        reference.connect_nodes(reference_nodes[1], reference_nodes[2])
+        reference.propagate_signal("Batch", start_node_id=0, energy_cost=10)
+
+        deliveries = self.lattice.propagate_batch(["Batch"], [0], energy_cost=10)
+        self.assertEqual(deliveries, {0: ["Batch"], 1: ["Batch"], 2: ["Batch"]})
+        self.assertEqual([n.state for n in self.nodes], [n.state for n in reference_nodes])
+
+    def test_batch_contention_serves_earlier_signals_first(self):
+        """Test that a node with energy for one delivery takes the earlier signal."""
+        self.nodes[1].state["energy"] = 10
+        deliveries = self.lattice.propagate_batch(["First", "Second"], [0, 2], energy_cost=5)
+        self.assertEqual(deliveries[1], ["First"])
+        self.assertEqual(self.nodes[1].state["energy"], 0)
+        self.assertEqual(deliveries[0], ["First"])
+        self.assertEqual(deliveries[2], ["Second", "First"])
+
+    def test_small_frontier_path_matches_vectorized_path(self):
+        """Test that the pure-Python hop for small frontiers gives the same deliveries and state as NumPy."""
+        rng = np.random.default_rng(3)
+        indptr, indices = self._random_graph(rng, 60, 90)
+        for energy_cost, wave_count in ((5, 20), (2.5, 3), (0, 20), (0, 3)):
+            starts = rng.integers(-1, 60, wave_count)
+            energy = rng.integers(-5, 60, 60).astype(np.float64)
+            results = []
+            for small_frontier in (0, 8, 10**6):  # NumPy only, switching back and forth, Python only
+                engine = CSRPropagationEngine(indptr, indices)
+                engine.SMALL_FRONTIER = small_frontier
+                state = energy.copy(), np.zeros(60, dtype=np.int64)
+                waves, nodes = engine.propagate_waves(starts, *state, energy_cost)
+                results.append((waves.tolist(), nodes.tolist(), state[0].tolist(), state[1].tolist()))
+            self.assertEqual(results[0], results[1])
+            self.assertEqual(results[0], results[2])
+
+    @staticmethod
+    def _random_graph(rng, node_count, edge_count):
+        pairs = {tuple(sorted(pair)) for pair in rng.integers(0, node_count, (edge_count, 2)).tolist() if pair[0] != pair[1]}
+        neighbors = [[] for _ in range(node_count)]
+        for a, b in sorted(pairs):
+            neighbors[a].append(b)
+            neighbors[b].append(a)
+        indptr = np.cumsum([0] + [len(n) for n in neighbors])
+        return indptr, np.array([b for n in neighbors for b in n], dtype=np.int32)
+
+    def test_repeated_connections_are_deduplicated(self):
+        """Test that connecting the same nodes twice keeps a single edge."""
+        self.lattice.connect_nodes(self.nodes[1], self.nodes[0])
+        self.assertEqual(list(self.lattice.network_map[0]), [self.nodes[1]])
+        self.assertEqual(self.lattice.topology.edge_count, 2)
+        self.assertEqual(self.lattice.topology.degree_stats()["histogram"], {1: 2, 2: 1})
+
+    def test_disconnect_splits_components(self):
+        """Test that removing edges and nodes updates reachability."""
+        self.assertTrue(self.lattice.is_connected())
+        self.assertEqual(self.lattice.reach(0), 3)
+        self.lattice.disconnect_nodes(self.nodes[1], self.nodes[2])
+        self.assertEqual(self.lattice.topology.component_count, 2)
+        self.assertEqual(self.lattice.reach(0), 2)
+        self.lattice.propagate_signal("Split", start_node_id=0)
+        self.assertEqual(self.nodes[2].state["message_log"], [])
+
+        self.lattice.remove_node(self.nodes[0])
+        self.assertEqual([node.id for node in self.lattice.nodes], [2, 1])
+        self.assertEqual(self.lattice.node_index, {2: 0, 1: 1})
+        self.lattice.connect_nodes(self.nodes[1], self.nodes[2])
+        self.assertTrue(self.lattice.is_connected())
+        self.assertEqual(self.lattice.propagate_batch(["Joined"], [2]), {2: ["Joined"], 1: ["Joined"]})
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,101 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.core.lattice_engine import LatticeEngine
+from src.core.node_autonomy import AutonomousNode
+from src.core.node_state_table import NodeStateTable
+
+def is_mapped(array):
+    """Whether an array is a view over a memory-mapped file."""
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+class TestLatticeSnapshot(unittest.TestCase):
+    def setUp(self):
+        """Set up a small lattice with mixed ids, logs and extra state."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "lattice.snap")
+        self.lattice = LatticeEngine()
+        table = NodeStateTable(log_capacity=2)
+        self.nodes = [AutonomousNode(node_id, table=table) for node_id in (0, "hub", 2, 3)]
+        for node in self.nodes:
+            self.lattice.add_node(node)
+        self.lattice.connect_nodes(self.nodes[0], self.nodes[1])
+        self.lattice.connect_nodes(self.nodes[1], self.nodes[2])
+        self.nodes[2].state["task"] = "route"
+        self.lattice.propagate_batch(["A", "B", "C"], [0, "hub", 2], energy_cost=10)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip_preserves_lattice(self):
+        """Test that a saved lattice loads with the same nodes, state and topology."""
+        self.lattice.save(self.path)
+        for mmap in (True, False):
+            loaded = LatticeEngine.load(self.path, mmap=mmap)
+            self.assertEqual([node.id for node in loaded.nodes], [0, "hub", 2, 3])
+            self.assertEqual([node.state.copy() for node in loaded.nodes],
+                             [node.state.copy() for node in self.nodes])
+            self.assertEqual([n.id for n in loaded.network_map["hub"]], [0, 2])
+            self.assertEqual(loaded.topology.component_count, 2)
+            self.assertEqual(loaded.state_table.message_log(0).seq, self.nodes[0].state["message_log"].seq)
+            self.assertEqual(loaded.state_table.message_log(0).epoch, self.nodes[0].state["message_log"].epoch)
+
+    def test_loaded_lattice_propagates_without_touching_file(self):
+        """Test that a memory-mapped lattice can propagate before nodes are built, leaving the file unchanged."""
+        self.lattice.save(self.path)
+        loaded = LatticeEngine.load(self.path)
+        self.assertEqual(loaded._nodes, [])
+        deliveries = loaded.propagate_batch(["D"], [2], energy_cost=5)
+        self.assertEqual(deliveries, {2: ["D"], "hub": ["D"], 0: ["D"]})
+        self.assertEqual(loaded._snapshot_ids, [0, "hub", 2, 3])
+        reloaded = LatticeEngine.load(self.path)
+        self.assertEqual(reloaded.nodes[2].state["energy"], self.nodes[2].state["energy"])
+
+    def test_loaded_snapshot_reads_ids_and_logs_in_place(self):
+        """Test that a memory-mapped load does not copy ids or log rings until they are written."""
+        self.lattice.save(self.path)
+        loaded = LatticeEngine.load(self.path)
+        table = loaded.state_table
+        logs = table.logs
+        self.assertIsNone(table.owners._list)
+        self.assertTrue(is_mapped(logs.snapshot.signal_ids))
+        self.assertTrue(is_mapped(logs.snapshot.times))
+        self.assertTrue(is_mapped(table.owners._data))
+        self.assertEqual(logs.slots, {})
+        self.assertEqual(table.owners[1], "hub")
+        self.assertEqual([signal for _, _, signal in logs.entries(2)], list(self.nodes[2].state["message_log"]))
+        self.assertIsNotNone(logs.interner._table)
+
+        self.assertEqual(loaded.propagate_batch(["D"], [3], energy_cost=5), {3: ["D"]})
+        self.assertEqual(list(logs.slots), [3])
+        self.assertEqual(len(logs.snapshot), 3)
+        self.assertIsNone(table.owners._list)
+
+        resaved = os.path.join(self.tmpdir.name, "resaved.snap")
+        loaded.save(resaved)
+        reloaded = LatticeEngine.load(resaved)
+        for row, node in enumerate(self.nodes[:3]):
+            log = reloaded.state_table.message_log(row)
+            self.assertEqual(list(log), list(node.state["message_log"]))
+            self.assertEqual((log.seq, log.epoch), (node.state["message_log"].seq, node.state["message_log"].epoch))
+        self.assertEqual(list(reloaded.state_table.message_log(3)), ["D"])
+
+    def test_loaded_lattice_is_usable_after_reading_nodes(self):
+        """Test that a loaded lattice can propagate and grow after its nodes are built."""
+        self.lattice.save(self.path)
+        loaded = LatticeEngine.load(self.path)
+        self.assertEqual(len(loaded.nodes), 4)
+        loaded.propagate_signal("x", 0)
+        self.assertEqual(list(loaded.nodes[2].state["message_log"])[-1], "x")
+        loaded.add_node(AutonomousNode("new"))
+        loaded.connect_nodes(loaded.nodes[4], loaded.nodes[3])
+        self.assertEqual(loaded.node_index["new"], 4)
+        self.assertEqual(loaded.propagate_batch(["E"], [3], energy_cost=5), {3: ["E"], "new": ["E"]})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import contextlib
+import io
+import os
+import sqlite3
+import tempfile
+import unittest
+from src.core.message_log import SignalInterner, SpillSegment
+from src.core.node_autonomy import AutonomousNode
+from src.core.node_state_table import NodeStateTable
+from src.utils.storage import Storage
+
+class TestMessageLog(unittest.TestCase):
+    def setUp(self):
+        """Set up a table with a small ring and a spill segment."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.spill_path = os.path.join(self.tmpdir.name, "messages.seg")
+        self.table = NodeStateTable(log_capacity=3, spill_path=self.spill_path)
+        self.node = AutonomousNode("node-a", table=self.table)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_ring_keeps_latest_entries(self):
+        """Test that the log is bounded to its capacity and keeps the newest signals."""
+        log = self.node.state["message_log"]
+        log.extend(f"Signal-{i}" for i in range(5))
+        self.assertEqual(log, ["Signal-2", "Signal-3", "Signal-4"])
+        self.assertEqual(log.seq, 5)
+
+    def test_evicted_entries_spill_to_segment(self):
+        """Test that evicted entries can be queried by node and time range."""
+        for i in range(5):
+            self.table.logs.append(self.node.row, "node-a", f"Signal-{i}", timestamp=float(i))
+        self.table.logs.flush()
+        reopened = SpillSegment.open(self.spill_path)
+        self.assertEqual(reopened.query(node_id="node-a"), [
+            ("node-a", 0.0, "Signal-0"), ("node-a", 1.0, "Signal-1"),
+        ])
+        self.assertEqual(reopened.query(node_id="node-a", start=1.0, end=2.0), [("node-a", 1.0, "Signal-1")])
+        self.assertEqual(reopened.query(node_id="node-b"), [])
+
+    def test_new_store_appends_to_existing_segment(self):
+        """Test that a store reopening a spill path keeps the old records and writes new ones readably."""
+        for i in range(5):
+            self.table.logs.append(self.node.row, "node-a", f"Signal-{i}", timestamp=float(i))
+        self.table.logs.flush()
+        table = NodeStateTable(log_capacity=1, spill_path=self.spill_path)
+        node = AutonomousNode("node-b", table=table)
+        for i, signal in enumerate(["x", "Signal-0", "y"]):
+            table.logs.append(node.row, "node-b", signal, timestamp=10.0 + i)
+        table.logs.flush()
+        reopened = SpillSegment.open(self.spill_path)
+        self.assertEqual(reopened.query(node_id="node-a"), [
+            ("node-a", 0.0, "Signal-0"), ("node-a", 1.0, "Signal-1"),
+        ])
+        self.assertEqual(reopened.query(node_id="node-b"), [("node-b", 10.0, "x"), ("node-b", 11.0, "Signal-0")])
+        with self.assertRaises(ValueError):
+            SpillSegment(self.spill_path, SignalInterner(["other"]))
+
+    def test_storage_persists_only_deltas(self):
+        """Test that save_node only writes entries added since the previous save."""
+        storage = Storage(os.path.join(self.tmpdir.name, "lattice.db"))
+        node = AutonomousNode(7, table=self.table)
+        log = node.state["message_log"]
+        log.append("First")
+        storage.save_node(node)
+        log.append("Second")
+        self.assertEqual([signal for _, _, signal in log.entries_since(storage.saved_seq[7])], ["Second"])
+        storage.save_node(node)
+        self.assertEqual([signal for _, _, signal in storage.load_messages(7)], ["First", "Second"])
+        self.assertEqual(storage.load_node(7)[3], 2)
+        storage.conn.close()
+
+    def test_storage_keeps_history_across_instances(self):
+        """Test that reopening the store, even for a node rebuilt from scratch, appends to the persisted log."""
+        path = os.path.join(self.tmpdir.name, "lattice.db")
+        storage = Storage(path)
+        node = AutonomousNode(7, table=self.table)
+        node.state["message_log"].extend(["First", "Second"])
+        storage.save_node(node)
+        storage.conn.close()
+
+        storage = Storage(path)
+        node.state["message_log"].append("Third")
+        storage.save_node(node)
+        storage.conn.close()
+
+        storage = Storage(path)
+        rebuilt = AutonomousNode(7, table=NodeStateTable(log_capacity=3))
+        rebuilt.state["message_log"].append("Fourth")
+        storage.save_node(rebuilt)
+        self.assertEqual([signal for _, _, signal in storage.load_messages(7)], ["First", "Second", "Third", "Fourth"])
+        self.assertEqual(storage.load_node(7)[3], 4)
+        self.assertEqual(rebuilt.state["message_log"], ["Second", "Third", "Fourth"])
+        storage.conn.close()
+
+    def test_storage_appends_a_longer_rebuilt_log(self):
+        """Test that a rebuilt node whose new log outgrew the stored count is appended, not merged."""
+        path = os.path.join(self.tmpdir.name, "lattice.db")
+        storage = Storage(path)
+        node = AutonomousNode(7, table=self.table)
+        node.state["message_log"].extend(["First", "Second"])
+        storage.save_node(node)
+        rebuilt = AutonomousNode(7, table=NodeStateTable(log_capacity=3))
+        rebuilt.state["message_log"].extend(["A", "B", "C"])
+        self.assertEqual(storage.save_node(rebuilt), 0)
+        self.assertEqual([signal for _, _, signal in storage.load_messages(7)], ["First", "Second", "A", "B", "C"])
+        lattice_table = NodeStateTable()
+        rebuilt.move_to(lattice_table)  # Moving a node keeps its log's identity
+        rebuilt.state["message_log"].append("D")
+        storage.save_node(rebuilt)
+        self.assertEqual([seq for seq, _, _ in storage.load_messages(7)], list(range(6)))
+        storage.conn.close()
+
+    def test_storage_reports_entries_evicted_between_saves(self):
+        """Test that entries evicted from the ring before a save are counted instead of silently skipped."""
+        storage = Storage(os.path.join(self.tmpdir.name, "lattice.db"))
+        node = AutonomousNode(7, table=self.table)
+        log = node.state["message_log"]
+        log.append("Signal-0")
+        storage.save_node(node)
+        log.extend(f"Signal-{i}" for i in range(1, 6))
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(storage.save_node(node), 2)
+        self.assertIn("2 log entries were evicted", output.getvalue())
+        self.assertEqual([seq for seq, _, _ in storage.load_messages(7)], [0, 3, 4, 5])
+        self.assertEqual(storage.load_node(7)[3], 6)
+        storage.conn.close()
+
+    def test_storage_migrates_message_log_column(self):
+        """Test that a database with the old message_log column is migrated on open."""
+        path = os.path.join(self.tmpdir.name, "legacy.db")
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE nodes (id INTEGER PRIMARY KEY, energy INTEGER, evolution_score REAL, message_log TEXT)")
+        conn.execute("INSERT INTO nodes VALUES (7, 40, 2.0, 'First,Second')")
+        conn.commit()
+        conn.close()
+        storage = Storage(path)
+        self.assertEqual(storage.load_node(7), (7, 40, 2.0, 2, None))
+        node = AutonomousNode(7, table=self.table)
+        node.state["message_log"].append("Third")
+        storage.save_node(node)
+        self.assertEqual([signal for _, _, signal in storage.load_messages(7)], ["First", "Second", "Third"])
+        storage.conn.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from src.core.lattice_engine import LatticeEngine
+from src.core.node_autonomy import AutonomousNode
+from src.core.node_state_table import NodeStateTable
+
+class TestNodeStateTable(unittest.TestCase):
+    def setUp(self):
+        """Set up a lattice whose nodes share one state table."""
+        self.table = NodeStateTable(capacity=2)
+        self.lattice = LatticeEngine()
+        self.nodes = [AutonomousNode(i, table=self.table) for i in range(4)]
+        for node in self.nodes:
+            self.lattice.add_node(node)
+
+    def test_state_proxy_reads_and_writes_columns(self):
+        """Test that node.state reads and writes the table row."""
+        node = self.nodes[2]
+        node.state["energy"] -= 30
+        self.assertEqual(self.table.energy[node.row], 70)
+        self.assertEqual(node.state["energy"], 70)
+        node.state["task"] = "DataAnalysis"
+        self.assertEqual(dict(node.state), {
+            "energy": 70, "evolution_score": 0, "message_log": [], "task": "DataAnalysis",
+        })
+
+    def test_fractional_energy_is_kept(self):
+        """Test that fractional energy updates are not truncated, as with plain node attributes."""
+        node = self.nodes[1]
+        node.state["energy"] -= 2.5
+        self.table.recharge_all(0.25)
+        self.assertEqual(node.state["energy"], 97.75)
+        self.lattice.propagate_batch(["A"], [1], energy_cost=0.5)
+        self.assertEqual(node.state["energy"], 92.25)
+
+    def test_destroy_resets_row(self):
+        """Test that assigning a whole state dict replaces the row."""
+        node = self.nodes[0]
+        node.state["task"] = "UpdatePolicy"
+        node.destroy()
+        self.assertEqual(dict(node.state), {"energy": 0, "evolution_score": 0, "message_log": []})
+
+    def test_bulk_operations(self):
+        """Test vectorized recharge, evolve and energy thresholding."""
+        self.nodes[1].state["energy"] = 0
+        self.assertEqual(self.lattice.evolve_all(), 3)
+        self.assertEqual([n.state["evolution_score"] for n in self.nodes], [1, 0, 1, 1])
+        self.lattice.recharge_all(10)
+        self.assertEqual([n.state["energy"] for n in self.nodes], [105, 10, 105, 105])
+        self.assertEqual(self.lattice.nodes_with_energy(100), [self.nodes[0], self.nodes[2], self.nodes[3]])
+
+    def test_lattice_adopts_foreign_nodes(self):
+        """Test that a node from another table is moved into the lattice table."""
+        node = AutonomousNode("outsider")
+        node.state["energy"] = 42
+        self.lattice.add_node(node)
+        self.assertIs(node.table, self.table)
+        self.assertEqual(node.state["energy"], 42)
+
+    def test_released_rows_are_reused(self):
+        """Test that rows of collected nodes return to the free list."""
+        node = AutonomousNode("temporary", table=self.table)
+        row = node.row
+        del node
+        self.assertEqual(AutonomousNode("replacement", table=self.table).row, row)
+
+if __name__ == "__main__":
+    unittest.main()
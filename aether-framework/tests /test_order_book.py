@@ -0,0 +1,80 @@
+import contextlib
+import io
+import random
+import unittest
+from src.marketplace.agent_marketplace import AgentMarketplace
+from src.marketplace.order_book import Order, OrderBook
+
+class TestOrderBook(unittest.TestCase):
+    def test_price_time_priority_and_partial_fills(self):
+        """Test that buys fill against the cheapest, then oldest, asks at the resting price."""
+        book = OrderBook("Energy")
+        book.submit(Order(1, "a", "Energy", "sell", 12, 2))
+        book.submit(Order(2, "b", "Energy", "sell", 10, 1))
+        book.submit(Order(3, "c", "Energy", "sell", 10, 1))
+        fills = book.submit(Order(4, "d", "Energy", "buy", 12, 3))
+        self.assertEqual([(f["seller_id"], f["price"], f["quantity"]) for f in fills],
+                         [("b", 10, 1), ("c", 10, 1), ("a", 12, 1)])
+        self.assertEqual(book.best_ask(), 12)
+        self.assertEqual(book.orders[1].quantity, 1)
+        self.assertEqual(book.submit(Order(5, "e", "Energy", "buy", 11, 2)), [])
+        self.assertEqual(book.best_bid(), 11)
+
+    def test_cancel_skips_and_compacts(self):
+        """Test that cancelled orders never trade and the heaps shrink after many cancels."""
+        book = OrderBook("Data")
+        for order_id in range(1, 101):
+            book.submit(Order(order_id, order_id, "Data", "sell", order_id))
+        for order_id in range(1, 100):
+            self.assertIsNotNone(book.cancel(order_id))
+        self.assertIsNone(book.cancel(1))
+        self.assertLess(len(book.asks), 10)
+        fills = book.submit(Order(101, "buyer", "Data", "buy", 1000, 2))
+        self.assertEqual([f["sell_order"] for f in fills], [100])
+        self.assertEqual(book.best_bid(), 1000)
+
+    def test_matches_brute_force_engine(self):
+        """Test that random order flow produces the same fills as a sorted-list reference."""
+        rng = random.Random(0)
+        marketplace = AgentMarketplace()
+        resting = []  # [price key, order id, side, price, quantity, agent]
+        for step in range(2000):
+            side = rng.choice(("buy", "sell"))
+            price, quantity = rng.randint(95, 105), rng.randint(1, 4)
+            order_id, fills = marketplace.place_order(step, "X", side, price, quantity)
+            expected = []
+            other = sorted((o for o in resting if o[2] != side), key=lambda o: (o[0], o[1]))
+            for entry in other:
+                crosses = entry[3] <= price if side == "buy" else entry[3] >= price
+                if not quantity or not crosses:
+                    break
+                traded = min(quantity, entry[4])
+                expected.append((entry[1], entry[3], traded))
+                quantity -= traded
+                entry[4] -= traded
+            resting = [o for o in resting if o[4]]
+            if quantity:
+                resting.append([price if side == "sell" else -price, order_id, side, price, quantity, step])
+            key = "sell_order" if side == "buy" else "buy_order"
+            self.assertEqual([(f[key], f["price"], f["quantity"]) for f in fills], expected)
+            if resting and rng.random() < 0.2:
+                victim = resting.pop(rng.randrange(len(resting)))
+                self.assertTrue(marketplace.cancel(victim[1]))
+        self.assertEqual(len(marketplace.order_resources), len(resting))
+
+    def test_listing_api(self):
+        """Test that list_resource and buy_resource keep their original behavior."""
+        marketplace = AgentMarketplace()
+        with contextlib.redirect_stdout(io.StringIO()):
+            marketplace.list_resource(1, "Energy", 10)
+            marketplace.list_resource(2, "Energy", 8)
+            marketplace.list_resource(3, "Data", 15)
+            self.assertTrue(marketplace.buy_resource(4, "Energy", 12))
+            self.assertFalse(marketplace.buy_resource(4, "Data", 10))
+            self.assertFalse(marketplace.buy_resource(4, "Compute", 10))
+        self.assertEqual(marketplace.market, [{"agent_id": 1, "resource": "Energy", "price": 10},
+                                              {"agent_id": 3, "resource": "Data", "price": 15}])
+        self.assertEqual(marketplace.books["Energy"].best_bid(), None)
+
+if __name__ == "__main__":
+    unittest.main()
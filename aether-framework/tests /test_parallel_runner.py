@@ -0,0 +1,49 @@
+import random
+import unittest
+import numpy as np
+from src.swarm.parallel_runner import partition_sizes, run_replicas
+from src.swarm.swarm_behavior import Swarm
+
+class TestParallelRunner(unittest.TestCase):
+    def test_results_do_not_depend_on_worker_count(self):
+        """Test that a seed gives identical replica metrics in-process and across a pool."""
+        for model in ("advanced", "vectorized"):
+            serial = run_replicas(model, 8, 20, 10, seed=7, workers=1)
+            pooled = run_replicas(model, 8, 20, 10, seed=7, workers=2, chunk_size=3)
+            for name, values in serial["metrics"].items():
+                np.testing.assert_array_equal(values, pooled["metrics"][name])
+            self.assertEqual(serial["metrics"]["active"].shape, (8,))
+            other = run_replicas(model, 8, 20, 10, seed=8, workers=1)
+            self.assertFalse(np.array_equal(serial["metrics"]["state"], other["metrics"]["state"]))
+
+    def test_partitions_sum_node_totals(self):
+        """Test that partitioned replicas cover every node and derive means from totals."""
+        self.assertEqual(partition_sizes(10, 3), [4, 3, 3])
+        summary = run_replicas("swarm", 4, 10, 5, seed=1, workers=1, partitions=3)
+        np.testing.assert_array_equal(summary["totals"]["nodes"], [10] * 4)
+        np.testing.assert_allclose(summary["metrics"]["mean_state"], summary["totals"]["state"] / 10)
+        with self.assertRaises(ValueError):
+            run_replicas("swarm", 1, 2, 1, partitions=3)
+
+    def test_partitions_below_model_minimum_are_rejected(self):
+        """Test that partitions too small for the model fail up front instead of inside a worker."""
+        for node_count, partitions in ((5, 3), (1, 1), (0, 1)):
+            with self.assertRaisesRegex(ValueError, "at least 2 nodes per partition"):
+                run_replicas("swarm", 1, node_count, 1, partitions=partitions)
+        with self.assertRaises(ValueError):
+            run_replicas("advanced", 1, 0, 1)
+        self.assertEqual(run_replicas("advanced", 1, 3, 1, workers=1, partitions=3)["totals"]["nodes"].tolist(), [3])
+
+    def test_swarm_uses_its_own_generator(self):
+        """Test that a Swarm given a Random does not touch the global random state."""
+        random.seed(0)
+        expected = random.random()
+        random.seed(0)
+        first, second = Swarm(5, rng=random.Random(3)), Swarm(5, rng=random.Random(3))
+        first.simulate(10)
+        second.simulate(10)
+        self.assertEqual(random.random(), expected)
+        self.assertEqual([n.state for n in first.nodes], [n.state for n in second.nodes])
+
+if __name__ == "__main__":
+    unittest.main()
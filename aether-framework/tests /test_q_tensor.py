@@ -0,0 +1,57 @@
+import contextlib
+import io
+import random
+import unittest
+import numpy as np
+from src.swarm.advanced_swarm_behavior import ReinforcementLearningAgent, Swarm
+from src.utils.reinforcement_learning import QTensor
+
+ACTIONS = ["explore", "process", "rest"]
+
+class TestQTensor(unittest.TestCase):
+    def test_per_node_update_matches_dict_agent(self):
+        """Test that a per-node tensor learns exactly what a dict-backed agent learns."""
+        tensor = QTensor(2, ["normal"], ACTIONS)
+        agent = ReinforcementLearningAgent()
+        for action, reward in [("process", 4), ("rest", 7), ("process", 2)]:
+            agent.update_q_value("normal", action, reward, "normal", ACTIONS)
+            tensor.update("normal", [action, "explore"], [reward, 1], "normal", nodes=[0, 1])
+        for action in ACTIONS:
+            self.assertAlmostEqual(tensor.get(0, "normal", action), agent.q_table.get(("normal", action), 0))
+
+    def test_greedy_choice_keeps_first_of_ties(self):
+        """Test that greedy selection picks the first best action, like max()."""
+        tensor = QTensor(3, ["normal"], ACTIONS, exploration_rate=0.0)
+        tensor.values[1, 0] = [1.0, 3.0, 3.0]
+        tensor.values[2, 0] = [0.0, 0.0, 2.0]
+        self.assertEqual(tensor.choose_actions("normal").tolist(), [0, 1, 2])
+
+    def test_shared_mode_averages_updates(self):
+        """Test that parameter sharing applies the mean of the nodes' updates to one table."""
+        tensor = QTensor(4, ["normal"], ACTIONS, shared=True)
+        tensor.update("normal", ["rest", "rest", "rest", "process"], [10, 10, 4, 6], "normal", nodes=range(4))
+        self.assertEqual(tensor.values.shape, (1, 1, 3))
+        self.assertAlmostEqual(tensor.get(3, "normal", "rest"), 0.8)
+        self.assertAlmostEqual(tensor.get(3, "normal", "process"), 0.6)
+
+    def test_large_shared_swarm_stays_bounded(self):
+        """Test that a thousand-node shared swarm keeps Q-values within reward / (1 - discount)."""
+        random.seed(0)
+        swarm = Swarm(1000, q_mode="shared")
+        with contextlib.redirect_stdout(io.StringIO()):
+            swarm.simulate(6)
+        bound = 9 / (1 - swarm.q_store.discount_factor)  # Rewards are at most 9
+        self.assertTrue(np.all(np.abs(swarm.q_store.values) <= bound))
+
+    def test_swarm_runs_with_tensor_modes(self):
+        """Test that a swarm can simulate with per-node and shared Q-tensors."""
+        for mode in ("per_node", "shared"):
+            random.seed(0)
+            swarm = Swarm(20, q_mode=mode)
+            with contextlib.redirect_stdout(io.StringIO()):
+                swarm.simulate(5)
+            self.assertTrue(np.any(swarm.q_store.values != 0))
+            self.assertIn(swarm.nodes[3].rl_agent.choose_action("normal", ACTIONS), ACTIONS)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import contextlib
+import io
+import unittest
+from redis.exceptions import NoScriptError
+from src.swarm.swarm_consensus import SwarmConsensus
+from src.utils import redis_registry
+from src.utils.redis_registry import RedisRegistry
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+class ScriptClient:
+    """Records SCRIPT LOAD and EVALSHA calls; forgets its scripts on flush()."""
+    def __init__(self):
+        self.connection_pool = object()
+        self.scripts = {}
+        self.loads = 0
+        self.queued = []
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.queued = []
+
+    def script_load(self, source):
+        self.queued.append(source)
+
+    def execute(self):
+        self.loads += 1
+        shas = [f"sha-{len(source)}-{hash(source)}" for source in self.queued]
+        self.scripts.update(zip(shas, self.queued))
+        return shas
+
+    def evalsha(self, sha, key_count, *keys_and_args):
+        if sha not in self.scripts:
+            raise NoScriptError("NOSCRIPT")
+        return self.scripts[sha], keys_and_args
+
+    def flush(self):
+        self.scripts.clear()
+
+@unittest.skipIf(fakeredis is None, "fakeredis is not installed")
+class TestRedisRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = RedisRegistry(max_connections=4, connection_class=fakeredis.FakeRedisConnection,
+                                      server=fakeredis.FakeServer())
+        self.previous, redis_registry._registry = redis_registry._registry, self.registry
+
+    def tearDown(self):
+        redis_registry._registry = self.previous
+
+    def test_components_share_one_pool_per_server(self):
+        """Test that agents' consensus and task queue clients all come from one pool per server."""
+        from src.utils.redis_task_queue import RedisTaskQueue
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            parts = [part for i in range(200) for part in (SwarmConsensus(i), RedisTaskQueue())]
+            parts[0].vote_many([1, 2, 3])
+            parts[1].push_task({"id": 1})
+            self.assertEqual(parts[3].task_count(), 1)
+        self.assertEqual(len({id(part.redis_client) for part in parts}), 1)
+        self.assertIs(self.registry.client("localhost", 6379), parts[0].redis_client)
+        self.assertIsNot(self.registry.client(db=1), parts[0].redis_client)
+        self.assertEqual(self.registry.metrics()["pools"]["localhost:6379/0"]["created"], 1)
+
+    def test_metrics_report_pool_utilization(self):
+        """Test that checked-out connections show up as in use against max_connections."""
+        client = self.registry.client()
+        client.ping()
+        held = [client.connection_pool.get_connection() for _ in range(2)]
+        pool = self.registry.metrics()["pools"]["localhost:6379/0"]
+        self.assertEqual((pool["created"], pool["in_use"], pool["idle"]), (2, 2, 0))
+        self.assertEqual(pool["utilization"], 0.5)
+        for connection in held:
+            client.connection_pool.release(connection)
+        self.assertEqual(self.registry.metrics()["pools"]["localhost:6379/0"]["utilization"], 0.0)
+
+    def test_scripts_load_once_and_reload_after_flush(self):
+        """Test that scripts are loaded once per server and reloaded when the server forgets them."""
+        redis_registry.register_script("test.echo", "return ARGV[1]")
+        self.addCleanup(redis_registry.SCRIPTS.pop, "test.echo")
+        client = ScriptClient()
+        for _ in range(3):
+            source, keys_and_args = self.registry.run_script(client, "test.echo", keys=["k"], args=["v"])
+        self.assertEqual((source, keys_and_args, client.loads), ("return ARGV[1]", ("k", "v"), 1))
+        self.assertEqual(sorted(client.scripts.values()), sorted(redis_registry.SCRIPTS.values()))
+        client.flush()
+        self.assertEqual(self.registry.run_script(client, "test.echo")[0], "return ARGV[1]")
+        self.assertEqual(client.loads, 2)
+        self.assertEqual(self.registry.metrics()["script_calls"], 4)
+
+if __name__ == "__main__":
+    unittest.main()
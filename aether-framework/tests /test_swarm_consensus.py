@@ -0,0 +1,124 @@
+import contextlib
+import io
+import threading
+import time
+import unittest
+from redis.crc import key_slot
+from src.swarm.consensus_migration import migrate
+from src.swarm.swarm_consensus import SwarmConsensus
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+@unittest.skipIf(fakeredis is None, "fakeredis is not installed")
+class TestSwarmConsensus(unittest.TestCase):
+    def setUp(self):
+        self.client = fakeredis.FakeStrictRedis(decode_responses=True)
+        self.consensus = SwarmConsensus("agent", redis_client=self.client, consensus_threshold=3)
+        self.output = contextlib.redirect_stdout(io.StringIO())
+        self.output.__enter__()
+
+    def tearDown(self):
+        self.output.__exit__(None, None, None)
+
+    def test_propose_many_reserves_consecutive_ids(self):
+        """Test that bulk proposals get consecutive ids after single proposals and are all stored."""
+        first = self.consensus.propose_task("solo")
+        ids = self.consensus.propose_many([f"task {i}" for i in range(25)], batch_size=10)
+        self.assertEqual(ids, list(range(first + 1, first + 26)))
+        self.assertEqual(self.client.hget(f"swarm:proposal:{{{ids[7]}}}", "task"), "task 7")
+        self.assertEqual(self.consensus.propose_task("next"), first + 26)
+        self.assertEqual(self.consensus.propose_many([]), [])
+
+    def test_vote_many_returns_running_counts(self):
+        """Test that bulk votes return each vote's count and match one-at-a-time voting."""
+        ids = self.consensus.propose_many(["a", "b"])
+        self.consensus.vote(ids[0])
+        counts = self.consensus.vote_many([ids[0], ids[1], ids[0], ids[1], ids[0]], batch_size=2)
+        self.assertEqual(counts, [2, 1, 3, 2, 4])
+        self.consensus.vote_with_transaction(ids[1])
+        self.assertEqual([self.client.hget(self.consensus.proposal_key(i), "votes") for i in ids], ["4", "3"])
+        self.assertEqual(self.consensus.get_consensus()["proposal_id"], str(ids[0]))
+
+    def test_threshold_crossing_is_published_once(self):
+        """Test that only the vote reaching the threshold publishes the proposal."""
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe("swarm_consensus")
+        ids = self.consensus.propose_many(["a", "b"])
+        self.assertIsNone(self.consensus.get_consensus())
+        self.consensus.vote_many([ids[0], ids[1], ids[0]])
+        self.consensus.vote(ids[0])
+        self.consensus.vote_many([ids[0], ids[1], ids[1], ids[1]])
+        messages = []
+        for _ in range(5):  # The first read only consumes the subscribe confirmation
+            message = pubsub.get_message(timeout=0.05)
+            if message is not None:
+                messages.append(message["data"])
+        self.assertEqual(messages, [str(ids[0]), str(ids[1])])
+        self.assertEqual(self.consensus.get_consensus()["task"], "a")
+
+    def test_wait_for_consensus_blocks_until_published(self):
+        """Test that a waiter wakes on another agent's threshold vote and times out otherwise."""
+        ids = self.consensus.propose_many(["a", "b"])
+        self.assertIsNone(self.consensus.wait_for_consensus(timeout=0.05))
+        other = SwarmConsensus("other", redis_client=self.client, consensus_threshold=3)
+        voter = threading.Timer(0.1, other.vote_many, [[ids[1]] * 3])
+        voter.start()
+        result = self.consensus.wait_for_consensus(ids[1], timeout=5)
+        voter.join()
+        self.assertEqual(result, {"proposal_id": str(ids[1]), "task": "b"})
+        self.assertEqual(self.consensus.wait_for_consensus(ids[1], timeout=0)["task"], "b")
+
+    def test_threshold_defaults_to_config(self):
+        """Test that the threshold and proposal TTL come from config.yaml when not given."""
+        consensus = SwarmConsensus("agent", redis_client=self.client)
+        self.assertEqual((consensus.consensus_threshold, consensus.proposal_ttl), (3, 86400))
+
+    def test_proposals_expire_and_spread_across_slots(self):
+        """Test that every proposal key carries a TTL and a hash tag of its own id."""
+        consensus = SwarmConsensus("agent", redis_client=self.client, consensus_threshold=3, proposal_ttl=60)
+        ids = [consensus.propose_task("solo")] + consensus.propose_many([f"task {i}" for i in range(99)])
+        consensus.vote_many(ids + [10**6])  # Includes a proposal that was never made
+        keys = self.client.keys("swarm:proposal:*")
+        self.assertEqual(len(keys), 101)
+        self.assertTrue(all(0 < self.client.ttl(key) <= 60 for key in keys))
+        self.assertEqual(len({key_slot(consensus.proposal_key(i).encode()) for i in ids}), 100)
+        self.assertEqual(key_slot(consensus.proposal_key(7).encode()), key_slot(b"{7}:voters"))
+
+    def test_votes_work_on_redis_6(self):
+        """Test that voting, including on unknown proposals, needs no Redis 7 commands."""
+        client = fakeredis.FakeStrictRedis(version=6, decode_responses=True)
+        consensus = SwarmConsensus("agent", redis_client=client, consensus_threshold=3, proposal_ttl=60)
+        proposal_id = consensus.propose_task("known")
+        self.assertEqual(consensus.vote_many([proposal_id, 500, 500]), [1, 1, 2])
+        self.assertEqual(consensus.vote(501), 1)
+        self.assertEqual(consensus.vote_with_transaction(proposal_id), 2)
+        self.assertTrue(all(0 < client.ttl(consensus.proposal_key(i)) <= 60 for i in (proposal_id, 500, 501)))
+
+    def test_expired_consensus_is_pruned(self):
+        """Test that proposals past their expiry drop out of the consensus set."""
+        ids = self.consensus.propose_many(["old", "new"])
+        self.client.zadd("swarm:consensus", {ids[0]: int(time.time()) - 10})
+        self.assertIsNone(self.consensus.get_consensus())
+        self.consensus.vote_many([ids[1]] * 3)
+        self.assertEqual(self.client.zrange("swarm:consensus", 0, -1), [str(ids[1])])
+        self.assertEqual(self.consensus.get_consensus()["task"], "new")
+
+    def test_migration_moves_legacy_hashes(self):
+        """Test that the legacy global hashes migrate into per-proposal keys."""
+        self.client.hset("swarm_proposals", mapping={1: "a", 2: "b", 3: "c"})
+        self.client.set("swarm_proposals:counter", 3)
+        self.client.hset("swarm_votes", mapping={1: 2, 2: 5, 9: 4})
+        self.client.zadd("swarm_vote_tally", {1: 1})
+        result = migrate(self.consensus, batch_size=2)
+        self.assertEqual(result, {"proposals": 3, "reached": 2, "orphan_votes": 4})
+        self.assertEqual(self.client.hgetall(self.consensus.proposal_key(1))["votes"], "3")
+        self.assertEqual(self.client.hget(self.consensus.proposal_key(3), "votes"), "0")
+        self.assertEqual(sorted(self.client.zrange("swarm:consensus", 0, -1)), ["1", "2"])
+        self.assertEqual(self.consensus.propose_task("d"), 4)
+        self.assertEqual(self.client.keys("swarm_*"), [])
+
+if __name__ == "__main__":
+    unittest.main()
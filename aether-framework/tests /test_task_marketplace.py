@@ -0,0 +1,68 @@
+import contextlib
+import io
+import itertools
+import random
+import unittest
+import numpy as np
+from src.marketplace.task_marketplace import TaskMarketplace
+from src.swarm.negotiation_agent import NegotiationAgent
+
+def make_market(seed, agent_count, task_count, types="abcd"):
+    rng = random.Random(seed)
+    agents = [NegotiationAgent(i, set(rng.sample(types, 2)), rng.randint(5, 30)) for i in range(agent_count)]
+    market = TaskMarketplace()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for task_id in range(task_count):
+            market.add_task({"id": task_id, "type": rng.choice(types),
+                             "priority": rng.randint(1, 10), "resource_cost": rng.randint(1, 12)})
+    return agents, market
+
+class TestTaskMarketplace(unittest.TestCase):
+    def auction(self, market, agents, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return market.auction(agents, **kwargs)
+
+    def test_score_tasks_matches_evaluate_task(self):
+        """Test that the vectorized score matrix equals evaluate_task for every agent and task."""
+        agents, market = make_market(0, 12, 40)
+        agents.append(NegotiationAgent(99, {"a"}, 0))
+        scores = NegotiationAgent.score_tasks(agents, market.tasks)
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = [[agent.evaluate_task(task) for task in market.tasks] for agent in agents]
+        np.testing.assert_allclose(scores, expected)
+
+    def test_auction_respects_capacity(self):
+        """Test that no agent is assigned more resource cost than its capacity."""
+        agents, market = make_market(1, 30, 400)
+        capacity = {agent.agent_id: agent.resource_capacity for agent in agents}
+        assignment = self.auction(market, agents, batch=8)
+        self.assertTrue(assignment)
+        for agent in agents:
+            spent = sum(task["resource_cost"] for task in agent.current_tasks.values())
+            self.assertLessEqual(spent, capacity[agent.agent_id])
+            self.assertEqual(agent.resource_capacity, capacity[agent.agent_id] - spent)
+        for task_id, agent in assignment.items():
+            self.assertIn(task_id, agent.current_tasks)
+            self.assertNotIn(task_id, market.task_index)
+        self.assertEqual(len(market.tasks), 400 - len(assignment))
+
+    def test_auction_is_optimal_for_single_tasks(self):
+        """Test that one task per agent is assigned at the brute-force optimum."""
+        agents = [NegotiationAgent(i, {"a", "b"}, capacity) for i, capacity in enumerate([4, 9, 10])]
+        market = TaskMarketplace()
+        tasks = [{"id": 0, "type": "a", "priority": 5, "resource_cost": 8},
+                 {"id": 1, "type": "b", "priority": 5, "resource_cost": 9},
+                 {"id": 2, "type": "a", "priority": 4, "resource_cost": 4}]
+        with contextlib.redirect_stdout(io.StringIO()):
+            for task in tasks:
+                market.add_task(task)
+        scores = NegotiationAgent.score_tasks(agents, tasks)
+        best = max(sum(scores[agent, task] for task, agent in enumerate(order))
+                   for order in itertools.permutations(range(3)))
+        assignment = self.auction(market, agents)
+        total = sum(scores[agent.agent_id, task_id] for task_id, agent in assignment.items())
+        self.assertEqual(len(assignment), 3)
+        self.assertAlmostEqual(total, best)
+
+if __name__ == "__main__":
+    unittest.main()
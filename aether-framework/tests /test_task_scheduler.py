@@ -0,0 +1,57 @@
+import contextlib
+import io
+import unittest
+from src.swarm.task_scheduler import TaskScheduler
+
+class Node:
+    def __init__(self, id, role="worker"):
+        self.id = id
+        self.role = role
+        self.performed = 0
+
+    def perform_task(self):
+        self.performed += 1
+
+class TestTaskScheduler(unittest.TestCase):
+    def assign(self, scheduler, nodes, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return scheduler.assign_all(nodes, **kwargs)
+
+    def test_assigns_in_priority_order_to_active_nodes(self):
+        """Test that tasks run highest priority first, oldest first on ties, and wait for inactive nodes."""
+        scheduler = TaskScheduler()
+        ids = [scheduler.add_task(node_id, f"task {i}", priority)
+               for i, (node_id, priority) in enumerate([(0, 1), (1, 3), (2, 5), (0, 3), (1, 9)])]
+        nodes = [Node(0), Node(1), Node(2, role="inactive")]
+        self.assertEqual(self.assign(scheduler, nodes), [ids[4], ids[1], ids[3], ids[0]])
+        self.assertEqual([task["task"] for task in scheduler.tasks], ["task 2"])
+        nodes[2].role = "worker"
+        self.assertEqual(self.assign(scheduler, nodes), [ids[2]])
+        self.assertEqual(len(scheduler), 0)
+
+    def test_aging_prevents_starvation(self):
+        """Test that a waiting low-priority task overtakes newer high-priority ones."""
+        scheduler = TaskScheduler(aging_rate=1.0)
+        node = Node(0)
+        old = scheduler.add_task(0, "old", priority=0)
+        rounds = 0
+        while old in scheduler.entries:
+            scheduler.add_task(0, "urgent", priority=3)
+            self.assign(scheduler, [node], per_node=1)
+            rounds += 1
+        self.assertEqual(rounds, 4)
+
+    def test_cancelled_tasks_are_skipped(self):
+        """Test that cancelled tasks are dropped lazily and never assigned."""
+        scheduler = TaskScheduler()
+        first = scheduler.add_task(0, "a", 5)
+        second = scheduler.add_task(0, "b", 1)
+        scheduler.add_task(1, "c", 2)
+        self.assertTrue(scheduler.cancel(first))
+        self.assertFalse(scheduler.cancel(first))
+        self.assertEqual(scheduler.peek(0), (second, "b", 1))
+        self.assertEqual(scheduler.cancel_node(1), 1)
+        self.assertEqual(self.assign(scheduler, [Node(0), Node(1)]), [second])
+
+if __name__ == "__main__":
+    unittest.main()
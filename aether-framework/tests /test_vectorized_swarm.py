@@ -0,0 +1,50 @@
+import contextlib
+import io
+import random
+import unittest
+import numpy as np
+from src.swarm.advanced_swarm_behavior import Swarm
+from src.swarm.vectorized_swarm import INACTIVE, VectorizedSwarm
+
+def object_metrics(seed, node_count, iterations):
+    random.seed(seed)
+    swarm = Swarm(node_count)
+    with contextlib.redirect_stdout(io.StringIO()):
+        swarm.simulate(iterations)
+    nodes = swarm.nodes
+    return [sum(node.role != "inactive" for node in nodes), np.mean([node.energy for node in nodes]),
+            sum(node.tasks_completed for node in nodes), np.mean([len(node.knowledge) for node in nodes])]
+
+def vectorized_metrics(seed, node_count, iterations):
+    swarm = VectorizedSwarm(node_count, seed=seed)
+    swarm.simulate(iterations)
+    metrics = swarm.metrics()
+    return [metrics["active"], metrics["mean_energy"], metrics["tasks_completed"], metrics["mean_knowledge"]]
+
+class TestVectorizedSwarm(unittest.TestCase):
+    def test_statistically_equivalent_to_object_model(self):
+        """Test that swarm metrics match the object model's within sampling error."""
+        replicas = 120
+        expected = np.array([object_metrics(seed, 30, 20) for seed in range(replicas)])
+        actual = np.array([vectorized_metrics(seed, 30, 20) for seed in range(replicas)])
+        stderr = np.sqrt((expected.var(axis=0) + actual.var(axis=0)) / replicas)
+        z_scores = np.abs(expected.mean(axis=0) - actual.mean(axis=0)) / stderr
+        self.assertTrue((z_scores < 4).all(), z_scores)
+
+    def test_from_swarm_copies_node_state(self):
+        """Test that an engine built from a Swarm starts from its nodes' state."""
+        random.seed(1)
+        swarm = Swarm(5)
+        swarm.nodes[0].knowledge[7] = 0.5
+        with contextlib.redirect_stdout(io.StringIO()):
+            swarm.nodes[1].fail()
+        engine = VectorizedSwarm.from_swarm(swarm, seed=1)
+        self.assertEqual(engine.roles().tolist(), [node.role for node in swarm.nodes])
+        self.assertEqual(engine.energy.tolist(), [node.energy for node in swarm.nodes])
+        self.assertEqual(engine.knowledge_size.tolist(), [1, 0, 0, 0, 0])
+        engine.fail(0)
+        self.assertEqual(engine.role[0], INACTIVE)
+        self.assertEqual(engine.knowledge_size[0], 0)
+
+if __name__ == "__main__":
+    unittest.main()
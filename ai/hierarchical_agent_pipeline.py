@@ -64,28 +64,24 @@ class HierarchicalAgentPipeline:
         result = self.proposal_manager.finalize_proposal(proposal_id)
         print(f"[ProposalManager] Final result for proposal '{proposal_text}': {result}")
 
-    def run_agent_exchange(self):
+    def run_agent_exchange(self, max_price=20):
         """
-        Demonstrates a scenario where each agent puts a 'service' or 'resource'
-        in the marketplace, and we simulate a transaction or exchange among them.
+        Demonstrates a scenario where each agent lists a 'resource' in the
+        marketplace's order book and the coordinator bids for one of them.
         """
         print("[Marketplace] Agents listing resources.")
+        listings = {}
         for agent in self.modular_agents:
             resource = f"Resource-{random.randint(100, 999)}"
-            self.marketplace.list_resource(agent.agent_id, resource)
+            listings[agent.agent_id] = resource
+            self.marketplace.list_resource(agent.agent_id, resource, random.randint(5, max_price))
             time.sleep(0.2)
 
-        # Let the coordinator attempt to 'purchase' a resource from one agent
+        # Let the coordinator bid for the resource listed by one agent
         chosen_agent = random.choice(self.modular_agents)
-        resource_id = self.marketplace.find_random_resource(chosen_agent.agent_id)
-        if resource_id:
-            print(f"[Coordinator] Attempting to acquire {resource_id} from {chosen_agent.agent_id}.")
-            self.marketplace.execute_transaction(
-                buyer_id=self.coordinator.agent_id,
-                seller_id=chosen_agent.agent_id,
-                resource_id=resource_id
-            )
-        else:
+        resource_id = listings[chosen_agent.agent_id]
+        print(f"[Coordinator] Attempting to acquire {resource_id} from {chosen_agent.agent_id}.")
+        if not self.marketplace.buy_resource(self.coordinator.agent_id, resource_id, max_price):
             print("[Marketplace] No resource found for coordinator to acquire.")
 
     def finalize_pipeline_state(self):
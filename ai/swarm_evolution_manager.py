@@ -1,9 +1,9 @@
-import time
 import random
 
 # Hypothetical aether-framework imports
 from aether_framework.src.core.lattice_engine import LatticeEngine
 from aether_framework.src.core.node_autonomy import AutonomousNode
+from aether_framework.src.core.event_scheduler import EventScheduler
 from aether_framework.src.swarm.swarm_optimizer import SwarmOptimizer  # imaginary module
 
 class SwarmEvolutionManager:
@@ -13,8 +13,9 @@ class SwarmEvolutionManager:
     to orchestrate collective optimization steps.
     """
 
-    def __init__(self, node_count=5):
+    def __init__(self, node_count=5, scheduler=None):
         self.lattice = LatticeEngine()
+        self.scheduler = scheduler if scheduler is not None else EventScheduler()
         self.optimizer = SwarmOptimizer()  # Hypothetical "swarm optimization" class
         self.nodes = []
 
@@ -46,7 +47,7 @@ class SwarmEvolutionManager:
             start_node = random.choice(self.nodes)
             print(f"[Round {r}] Propagating signal '{chosen_signal}' from {start_node.id}")
             self.lattice.propagate_signal(chosen_signal, start_node_id=start_node.id, energy_cost=5)
-            time.sleep(0.5)
+            self.scheduler.sleep(0.5)
 
             # Let the swarm optimizer do its magic
             self.optimizer.optimize_swarm(self.nodes)
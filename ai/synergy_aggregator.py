@@ -52,11 +52,19 @@ class SynergyAggregator:
         how LatticeEngine distributes messages.
         """
         signals = ["HealthPing", "StatusUpdate", "ConfigSync", "DebugPulse"]
+        chosen_signals = []
         for node in self.nodes:
             signal = random.choice(signals)
             print(f"\nPropagating '{signal}' from {node.id}")
-            self.lattice.propagate_signal(signal, start_node_id=node.id, energy_cost=5)
-            time.sleep(0.5)
+            chosen_signals.append(signal)
+
+        deliveries = self.lattice.propagate_batch(
+            chosen_signals,
+            [node.id for node in self.nodes],
+            energy_cost=5
+        )
+        print(f"Delivered {sum(len(d) for d in deliveries.values())} signals across {len(deliveries)} nodes.")
+        time.sleep(0.5)
 
     # If you have additional modules:
     # def schedule_tasks(self, tasks_dict):
@@ -1,11 +1,11 @@
 #!/usr/bin/env python
 
-import time
 import random
 
 # Hypothetical imports from your aether_framework
 from aether_framework.src.core.lattice_engine import LatticeEngine
 from aether_framework.src.core.node_autonomy import AutonomousNode
+from aether_framework.src.core.event_scheduler import EventScheduler
 from aether_framework.src.swarm.swarm_behavior import SwarmBehavior
 from aether_framework.src.network.task_executor import TaskExecutor
 
@@ -20,8 +20,10 @@ class SynergyCoordinator:
       - TaskExecutor (orchestrates assigned tasks)
     """
 
-    def __init__(self, node_count=3):
+    def __init__(self, node_count=3, scheduler=None):
         self.lattice = LatticeEngine()
+        # Virtual clock pacing the rounds; fast-forward unless a real-time scheduler is given
+        self.scheduler = scheduler if scheduler is not None else EventScheduler()
         self.swarm_behavior = SwarmBehavior()   # Hypothetical swarm logic
         self.task_executor = TaskExecutor()     # Hypothetical task scheduling
         self.nodes = []
@@ -76,16 +78,18 @@ class SynergyCoordinator:
         across the lattice.
         """
         signals = ["Heartbeat", "DiagnosticPing", "ConfigSync"]
+        chosen_signals, start_node_ids = [], []
         for _ in range(len(self.nodes)):
             chosen_signal = random.choice(signals)
             start_node = random.choice(self.nodes)
             print(f"[Coordinator] Propagating '{chosen_signal}' from {start_node.id}")
-            self.lattice.propagate_signal(
-                chosen_signal,
-                start_node_id=start_node.id,
-                energy_cost=5
-            )
-            time.sleep(1)
+            chosen_signals.append(chosen_signal)
+            start_node_ids.append(start_node.id)
+
+        deliveries = self.lattice.propagate_batch(chosen_signals, start_node_ids, energy_cost=5)
+        print(f"[Coordinator] Delivered {sum(len(d) for d in deliveries.values())} signals "
+              f"across {len(deliveries)} nodes.")
+        self.scheduler.sleep(1)
 
     def finalize_states(self):
         """
@@ -100,15 +104,15 @@ def main():
     print("=== Starting Synergy Coordination Demo ===\n")
 
     # 1) Instantiate the coordinator (which sets up nodes + lattice + swarm behavior, etc.)
-    coordinator = SynergyCoordinator(node_count=4)
+    coordinator = SynergyCoordinator(node_count=4, scheduler=EventScheduler(real_time=True))
 
     # 2) Assign tasks to nodes
     coordinator.assign_tasks()
-    time.sleep(1)
+    coordinator.scheduler.sleep(1)
 
     # 3) Demonstrate swarm synergy
     coordinator.run_swarm_behavior()
-    time.sleep(1)
+    coordinator.scheduler.sleep(1)
 
     # 4) Propagate signals through the lattice
     coordinator.propagate_signals()
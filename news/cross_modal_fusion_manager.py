@@ -1,10 +1,10 @@
-import time
 import random
 
 # Hypothetical aether-framework imports
 from aether_framework.src.utils.multi_modal_handler import MultiModalHandler
 from aether_framework.src.utils.reinforcement_learning import RLTrainer
 from aether_framework.src.core.node_autonomy import AutonomousNode
+from aether_framework.src.core.event_scheduler import EventScheduler
 
 
 class CrossModalFusionManager:
@@ -16,8 +16,9 @@ class CrossModalFusionManager:
          might store or process segments of data, collectively generating synergy.
     """
 
-    def __init__(self):
+    def __init__(self, scheduler=None):
         self.handler = MultiModalHandler()
+        self.scheduler = scheduler if scheduler is not None else EventScheduler()
         self.rl_trainer = RLTrainer()  # Hypothetical RL logic
         self.nodes = []
         for i in range(2):
@@ -57,7 +58,7 @@ class CrossModalFusionManager:
                 node.state.setdefault("fusion_history", [])
                 node.state["fusion_history"].append(refined)
                 print(f"Node {node.id} appended refined data to fusion_history.")
-            time.sleep(1)
+            self.scheduler.sleep(1)
 
     def finalize_fusion(self):
         """
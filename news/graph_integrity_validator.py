@@ -34,11 +34,18 @@ class GraphIntegrityValidator:
         Runs a simplistic integrity check:
          - Ensures each node has non-empty state
          - Checks each node's energy is above a threshold
+         - Checks the graph is connected, using the lattice's topology index
          - Summarizes if the graph is 'valid' or not
         """
         threshold = 20
         all_good = True
         result_lines = ["=== Graph Integrity Report ==="]
+        components = self.lattice.topology.component_count
+        if components > 1:
+            all_good = False
+            result_lines.append(f"Connectivity => FAIL ({components} components)")
+        else:
+            result_lines.append("Connectivity => PASS")
         for node in self.lattice.nodes:
             energy = node.state.get("energy", 0)
             if energy < threshold:
@@ -64,5 +71,18 @@ class GraphIntegrityValidator:
             target_node = self.lattice.nodes[node_index]
             target_node.state["energy"] = 0
             print(f"[GraphIntegrityValidator] Node {target_node.id} forcibly depleted to 0 energy.")
+        else:
+            print("[GraphIntegrityValidator] Invalid node index.")
+
+    def artificially_partition_graph(self, node_index=0):
+        """
+        Example method that cuts every connection of a node,
+        simulating a network partition.
+        """
+        if 0 <= node_index < len(self.lattice.nodes):
+            target_node = self.lattice.nodes[node_index]
+            for neighbor in list(self.lattice.network_map[target_node.id]):
+                self.lattice.disconnect_nodes(target_node, neighbor)
+            print(f"[GraphIntegrityValidator] Node {target_node.id} cut off from the graph.")
         else:
             print("[GraphIntegrityValidator] Invalid node index.")
\ No newline at end of file
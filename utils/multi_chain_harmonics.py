@@ -1,9 +1,9 @@
-import time
 import random
 
 # Hypothetical aether-framework imports
 from aether_framework.src.core.lattice_engine import LatticeEngine
 from aether_framework.src.core.node_autonomy import AutonomousNode
+from aether_framework.src.core.event_scheduler import EventScheduler
 
 
 class MultiChainHarmonics:
@@ -13,8 +13,9 @@ class MultiChainHarmonics:
     then bridging them for holistic signal exchange.
     """
 
-    def __init__(self, num_chains=2):
+    def __init__(self, num_chains=2, scheduler=None):
         self.num_chains = num_chains
+        self.scheduler = scheduler if scheduler is not None else EventScheduler()
         self.chains = []
         self.all_nodes = []
 
@@ -51,16 +52,18 @@ class MultiChainHarmonics:
             return
 
         signals = ["CrossLedgerSync", "AtomicSwapSignal", "ChainHarmonicsPulse"]
+        batches = {}  # chain_idx -> (signals, start node ids)
         for i in range(len(self.all_nodes)):
             chain_idx, node = random.choice(self.all_nodes)
             chosen_signal = random.choice(signals)
             print(f"[Harmonics] Propagating '{chosen_signal}' from {node.id} (Chain {chain_idx})")
-            self.chains[chain_idx - 1].propagate_signal(
-                chosen_signal,
-                start_node_id=node.id,
-                energy_cost=5
-            )
-            time.sleep(0.5)
+            chain_signals, start_node_ids = batches.setdefault(chain_idx, ([], []))
+            chain_signals.append(chosen_signal)
+            start_node_ids.append(node.id)
+
+        for chain_idx, (chain_signals, start_node_ids) in sorted(batches.items()):
+            self.chains[chain_idx - 1].propagate_batch(chain_signals, start_node_ids, energy_cost=5)
+        self.scheduler.sleep(0.5)
 
     def finalize_harmonics_state(self):
         """